@@ -0,0 +1,176 @@
+"""
+On-disk LRU cache for proxied artifacts (audio, video, images, ...).
+
+Entries are keyed by the normalized artifact URL and stored as two files:
+<key>.bin (the body) and <key>.json (content type, ETag, Last-Modified,
+size, when it was last validated). File mtimes record last use, so the LRU
+order survives restarts. The cache is trimmed to max_bytes after every
+write, least recently used first.
+
+Bodies are written while they stream to the client (see CacheWriter) and
+only become visible once complete.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from typing import Any, Dict, Optional
+from urllib.parse import parse_qsl, urlencode, urlparse, urlunparse
+
+import json_codec
+
+logger = logging.getLogger(__name__)
+
+# Query parameters that don't change which artifact a URL points at
+IGNORED_PARAMS = {"authuser"}
+
+
+def normalize_url(url: str) -> str:
+    """Canonical form of an artifact URL, used as the cache key."""
+    parsed = urlparse(url)
+    query = sorted((k, v) for k, v in parse_qsl(parsed.query, keep_blank_values=True) if k not in IGNORED_PARAMS)
+    return urlunparse((
+        parsed.scheme.lower(),
+        parsed.netloc.lower(),
+        parsed.path or "/",
+        "",
+        urlencode(query),
+        "",
+    ))
+
+
+class CacheWriter:
+    """Writes one entry's body as it streams; commit() publishes it."""
+
+    def __init__(self, cache: "ArtifactCache", key: str, meta: Dict[str, Any]):
+        self._cache = cache
+        self._key = key
+        self._meta = meta
+        self._size = 0
+        self._tmp_path = os.path.join(cache.directory, f"{key}.{uuid.uuid4().hex}.part")
+        self._file = open(self._tmp_path, "wb")
+        self._failed = False
+
+    def write(self, chunk: bytes) -> None:
+        if self._failed:
+            return
+        self._size += len(chunk)
+        if self._size > self._cache.max_bytes:
+            logger.info(f"Artifact too large to cache ({self._size} bytes so far): {self._meta.get('url')}")
+            self.abort()
+            return
+        try:
+            self._file.write(chunk)
+        except OSError as e:
+            logger.warning(f"Artifact cache write failed: {e}")
+            self.abort()
+
+    def commit(self) -> None:
+        if self._failed:
+            return
+        self._file.close()
+        self._cache._publish(self._key, self._tmp_path, {**self._meta, "size": self._size})
+
+    def abort(self) -> None:
+        if self._failed:
+            return
+        self._failed = True
+        self._file.close()
+        try:
+            os.remove(self._tmp_path)
+        except OSError:
+            pass
+
+
+class ArtifactCache:
+    """Size-capped LRU of artifact bodies in a directory."""
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+        # Leftovers of interrupted downloads
+        for name in os.listdir(directory):
+            if name.endswith(".part"):
+                try:
+                    os.remove(os.path.join(directory, name))
+                except OSError:
+                    pass
+
+    @staticmethod
+    def key_for(url: str) -> str:
+        return hashlib.sha256(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def body_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def _meta_path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.json")
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Metadata of a complete entry (and mark it used), or None."""
+        try:
+            with open(self._meta_path(key), "rb") as f:
+                meta = json_codec.loads(f.read())
+            os.utime(self.body_path(key))
+        except (OSError, ValueError):
+            return None
+        return meta
+
+    def touch_validated(self, key: str, meta: Dict[str, Any]) -> None:
+        """Record a successful revalidation (upstream said 304)."""
+        meta = {**meta, "validated_at": time.time()}
+        self._write_meta(key, meta)
+
+    def writer(self, key: str, meta: Dict[str, Any]) -> CacheWriter:
+        return CacheWriter(self, key, {**meta, "validated_at": time.time()})
+
+    def _write_meta(self, key: str, meta: Dict[str, Any]) -> None:
+        tmp = f"{self._meta_path(key)}.{uuid.uuid4().hex}.part"
+        with open(tmp, "wb") as f:
+            f.write(json_codec.dumps(meta).encode("utf-8"))
+        os.replace(tmp, self._meta_path(key))
+
+    def _publish(self, key: str, tmp_body: str, meta: Dict[str, Any]) -> None:
+        # Body first, metadata last: get() only sees entries whose body exists
+        with self._lock:
+            os.replace(tmp_body, self.body_path(key))
+            self._write_meta(key, meta)
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        total = 0
+        for name in os.listdir(self.directory):
+            if not name.endswith(".bin"):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, name[:-4]))
+            total += stat.st_size
+        for _, size, key in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self.remove(key)
+            total -= size
+
+    def remove(self, key: str) -> None:
+        # Metadata first, the reverse of _publish. A reader that already has
+        # the metadata can still find the body gone (see mcp_bp._send_cached_artifact)
+        for path in (self._meta_path(key), self.body_path(key)):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def stats(self) -> Dict[str, Any]:
+        names = [n for n in os.listdir(self.directory) if n.endswith(".bin")]
+        size = sum(os.path.getsize(os.path.join(self.directory, n)) for n in names)
+        return {"entries": len(names), "bytes": size, "max_bytes": self.max_bytes}
@@ -0,0 +1,261 @@
+"""
+Background artifact generation jobs.
+
+POST /api/mcp/generate_artifact used to look up sources and start the studio
+generation inside the request, holding a Flask worker for the whole call.
+Jobs are now recorded in SQLite and run on a bounded thread pool, with an
+optional concurrency limit per artifact type (e.g. one video at a time).
+
+Each job can carry an idempotency key: submitting the same key again returns
+the existing job instead of generating a second artifact.
+
+Job states: queued -> running -> succeeded | failed. On start-up, queued jobs
+are resumed; jobs that were running when the process stopped are marked
+failed rather than retried, since the artifact may already have been created.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, Optional, Tuple
+
+import json_codec
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+# Finished jobs (and their idempotency keys) are kept this long
+DEFAULT_RETENTION_SECONDS = 7 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS artifact_jobs (
+    id TEXT PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    artifact_type TEXT NOT NULL,
+    notebook_id TEXT NOT NULL,
+    params TEXT NOT NULL,
+    status TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL
+);
+CREATE INDEX IF NOT EXISTS artifact_jobs_status ON artifact_jobs (status);
+"""
+
+
+class IdempotencyConflict(Exception):
+    """Raised when an idempotency key is reused with different parameters"""
+    pass
+
+
+def parse_type_limits(spec: str) -> Dict[str, int]:
+    """Parse "video=1,audio=2" into {"video": 1, "audio": 2}."""
+    limits = {}
+    for part in spec.split(','):
+        if not part.strip():
+            continue
+        name, _, value = part.partition('=')
+        try:
+            limits[name.strip()] = max(1, int(value))
+        except ValueError:
+            logger.warning(f"Ignoring invalid artifact concurrency setting: {part!r}")
+    return limits
+
+
+class JobStore:
+    """SQLite-backed job records, safe to use from several threads."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        if path != ':memory:':
+            self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def _to_dict(row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        if row is None:
+            return None
+        job = dict(row)
+        job['params'] = json_codec.loads(job['params'])
+        job['result'] = json_codec.loads(job['result']) if job['result'] else None
+        return job
+
+    def create(self, artifact_type: str, notebook_id: str, params: Dict[str, Any],
+               idempotency_key: Optional[str] = None) -> Tuple[Dict[str, Any], bool]:
+        """Insert a queued job. Returns (job, created).
+
+        With an idempotency key that is already known, the existing job is
+        returned with created=False.
+
+        Raises:
+            IdempotencyConflict: the key was used for a different request
+        """
+        encoded = json_codec.dumps(params)
+        with self._lock:
+            if idempotency_key:
+                row = self._conn.execute(
+                    "SELECT * FROM artifact_jobs WHERE idempotency_key = ?", (idempotency_key,)
+                ).fetchone()
+                if row is not None:
+                    existing = self._to_dict(row)
+                    if (existing['artifact_type'], existing['notebook_id'], existing['params']) != \
+                            (artifact_type, notebook_id, params):
+                        raise IdempotencyConflict(
+                            f"Idempotency key {idempotency_key!r} was already used for a different request"
+                        )
+                    return existing, False
+            job_id = uuid.uuid4().hex
+            self._conn.execute(
+                "INSERT INTO artifact_jobs (id, idempotency_key, artifact_type, notebook_id, params, status, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, idempotency_key or None, artifact_type, notebook_id, encoded, QUEUED, time.time()),
+            )
+            row = self._conn.execute("SELECT * FROM artifact_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row), True
+
+    def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute("SELECT * FROM artifact_jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row)
+
+    def mark_running(self, job_id: str) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE artifact_jobs SET status = ?, started_at = ? WHERE id = ?",
+                (RUNNING, time.time(), job_id),
+            )
+
+    def finish(self, job_id: str, result: Optional[Dict[str, Any]] = None, error: Optional[str] = None) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE artifact_jobs SET status = ?, result = ?, error = ?, finished_at = ? WHERE id = ?",
+                (
+                    FAILED if error is not None else SUCCEEDED,
+                    json_codec.dumps(result) if result is not None else None,
+                    error,
+                    time.time(),
+                    job_id,
+                ),
+            )
+
+    def recover(self, retention_seconds: float = DEFAULT_RETENTION_SECONDS) -> list:
+        """Tidy up after a restart and return the jobs that are still queued.
+
+        Jobs left running are failed, and finished jobs past retention deleted.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE artifact_jobs SET status = ?, error = ?, finished_at = ? WHERE status = ?",
+                (FAILED, "Interrupted by a server restart; check the notebook before retrying", now, RUNNING),
+            )
+            self._conn.execute(
+                "DELETE FROM artifact_jobs WHERE status IN (?, ?) AND finished_at < ?",
+                (SUCCEEDED, FAILED, now - retention_seconds),
+            )
+            rows = self._conn.execute(
+                "SELECT * FROM artifact_jobs WHERE status = ? ORDER BY created_at", (QUEUED,)
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+class JobQueue:
+    """Runs queued jobs on a bounded pool, with per-artifact-type limits.
+
+    A job whose type is at its limit waits in a per-type FIFO instead of
+    taking a pool thread, so one slow type can't starve the others.
+    """
+
+    def __init__(self, store: JobStore, runner: Callable[[Dict[str, Any]], Dict[str, Any]],
+                 workers: int = 4, type_limits: Optional[Dict[str, int]] = None):
+        self.store = store
+        self.workers = max(1, workers)
+        self.type_limits = dict(type_limits or {})
+        self._runner = runner
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="artifact-job")
+        self._lock = threading.Lock()
+        self._running: Dict[str, int] = {}
+        self._waiting: Dict[str, Deque[str]] = {}
+
+    def submit(self, artifact_type: str, notebook_id: str, params: Dict[str, Any],
+               idempotency_key: Optional[str] = None) -> Tuple[Dict[str, Any], bool]:
+        """Record a job and schedule it. Returns (job, created) like JobStore.create."""
+        job, created = self.store.create(artifact_type, notebook_id, params, idempotency_key)
+        if created:
+            self._schedule(job['id'], artifact_type)
+        return job, created
+
+    def resume(self) -> int:
+        """Schedule jobs left queued by a previous process."""
+        jobs = self.store.recover()
+        for job in jobs:
+            self._schedule(job['id'], job['artifact_type'])
+        if jobs:
+            logger.info(f"Resumed {len(jobs)} queued artifact job(s)")
+        return len(jobs)
+
+    def _schedule(self, job_id: str, artifact_type: str) -> None:
+        with self._lock:
+            limit = self.type_limits.get(artifact_type)
+            if limit is not None and self._running.get(artifact_type, 0) >= limit:
+                self._waiting.setdefault(artifact_type, deque()).append(job_id)
+                return
+            self._running[artifact_type] = self._running.get(artifact_type, 0) + 1
+        self._executor.submit(self._run, job_id, artifact_type)
+
+    def _run(self, job_id: str, artifact_type: str) -> None:
+        try:
+            job = self.store.get(job_id)
+            if job is None:
+                return
+            self.store.mark_running(job_id)
+            started = time.monotonic()
+            try:
+                result = self._runner(job)
+            except Exception as e:
+                logger.exception(f"Artifact job {job_id} ({artifact_type}) failed")
+                self.store.finish(job_id, error=str(e))
+            else:
+                logger.info(f"Artifact job {job_id} ({artifact_type}) finished in {time.monotonic() - started:.1f}s")
+                self.store.finish(job_id, result=result)
+        finally:
+            self._release(artifact_type)
+
+    def _release(self, artifact_type: str) -> None:
+        with self._lock:
+            waiting = self._waiting.get(artifact_type)
+            if waiting:
+                next_id = waiting.popleft()  # keeps the slot for the next job of this type
+            else:
+                self._running[artifact_type] -= 1
+                return
+        self._executor.submit(self._run, next_id, artifact_type)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "type_limits": dict(self.type_limits),
+                "running": {t: n for t, n in self._running.items() if n},
+                "waiting": {t: len(q) for t, q in self._waiting.items() if q},
+            }
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Per-call latency: in-process NLM engine vs one process per call.
+
+NLMClient runs `nlm` for every call, paying interpreter start-up, imports,
+token loading and a NotebookLM homepage fetch each time. InProcessNLMClient
+keeps one warm notebooklm_mcp client. This compares the two on
+poll_studio_status (what /api/mcp/status runs).
+
+By default both sides talk to a local stub of NotebookLM, so no credentials
+or network are needed; the per-process side runs the same notebooklm_mcp
+code `nlm` runs, minus the CLI's own start-up. HOME is pointed at a temp dir
+so the real token cache is never touched.
+
+With --live, the real `nlm` binary (NLM_PATH) is compared with the real
+in-process engine on --notebook-id, using your cached tokens.
+
+Usage:
+    python benchmarks/bench_nlm_engine.py
+    python benchmarks/bench_nlm_engine.py --calls 20
+    python benchmarks/bench_nlm_engine.py --live --notebook-id <id>
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+MCP_SRC = os.path.join(os.path.dirname(APP_DIR), "notebooklm-mcp", "src")
+sys.path.insert(0, APP_DIR)
+sys.path.insert(0, MCP_SRC)
+
+HOMEPAGE = '<html><script>{"SNlM0e":"stub-csrf","FdrFJe":"stub-session"}</script></html>'
+ARTIFACTS = [[["artifact-1", "Deep Dive", 1, None, 3]]]
+
+# Runs in a fresh interpreter per call, like one `nlm studio status` invocation
+CHILD = """
+import os, sys
+sys.path.insert(0, {src!r})
+from notebooklm_mcp.api_client import NotebookLMClient
+from notebooklm_mcp.pool import create_client
+NotebookLMClient.BASE_URL = {base!r}
+NotebookLMClient.BATCHEXECUTE_URL = {base!r} + "/_/LabsTailwindUi/data/batchexecute"
+create_client().poll_studio_status("nb-bench")
+"""
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True  # else delayed ACKs add ~40 ms per keep-alive call
+
+    def _send(self, body: str) -> None:
+        data = body.encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        self._send(HOMEPAGE)
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        rpc_id = parse_qs(urlparse(self.path).query).get("rpcids", [""])[0]
+        chunk = json.dumps([["wrb.fr", rpc_id, json.dumps(ARTIFACTS), None, None, None, "generic"]])
+        self._send(f")]}}'\n\n{len(chunk)}\n{chunk}\n")
+
+    def log_message(self, format, *args):
+        pass
+
+
+def _summary(label: str, samples: list[float]) -> None:
+    ms = sorted(s * 1000 for s in samples)
+    p95 = ms[min(len(ms) - 1, int(len(ms) * 0.95))]
+    print(f"{label:<22} median {statistics.median(ms):8.1f} ms   p95 {p95:8.1f} ms   n={len(ms)}")
+
+
+def _time(call, calls: int) -> list[float]:
+    samples = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def run_stub(calls: int) -> None:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+
+    home = tempfile.mkdtemp(prefix="bench-nlm-")
+    os.environ.update({
+        "HOME": home,
+        "NOTEBOOKLM_COOKIES": "SID=stub; HSID=stub; SSID=stub; APISID=stub; SAPISID=stub",
+        "NLM_ENGINE": "inprocess",
+    })
+
+    child = CHILD.format(src=MCP_SRC, base=base)
+    per_process = _time(lambda: subprocess.run([sys.executable, "-c", child], check=True), calls)
+
+    from notebooklm_mcp.api_client import NotebookLMClient
+    NotebookLMClient.BASE_URL = base
+    NotebookLMClient.BATCHEXECUTE_URL = f"{base}/_/LabsTailwindUi/data/batchexecute"
+    from nlm_client import get_nlm_client
+
+    client = get_nlm_client()
+    start = time.perf_counter()
+    assert client.poll_studio_status("nb-bench"), "stub returned no artifacts"
+    first = time.perf_counter() - start
+    in_process = _time(lambda: client.poll_studio_status("nb-bench"), calls)
+    server.shutdown()
+
+    print(f"poll_studio_status against a local stub, {calls} calls each")
+    _summary("process per call", per_process)
+    _summary("in-process (first)", [first])
+    _summary("in-process (warm)", in_process)
+    print(f"speed-up (median): {statistics.median(per_process) / statistics.median(in_process):.0f}x")
+
+
+def run_live(calls: int, notebook_id: str) -> None:
+    from nlm_client import InProcessNLMClient, NLMClient
+
+    cli = NLMClient()
+    engine = InProcessNLMClient()
+    engine.poll_studio_status(notebook_id)  # warm up: token load + homepage fetch
+
+    print(f"poll_studio_status on {notebook_id}, {calls} calls each")
+    _summary("nlm CLI", _time(lambda: cli.poll_studio_status(notebook_id), calls))
+    _summary("in-process (warm)", _time(lambda: engine.poll_studio_status(notebook_id), calls))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare NLM engine per-call latency")
+    parser.add_argument("--calls", type=int, default=10)
+    parser.add_argument("--live", action="store_true", help="Use the real nlm binary and NotebookLM")
+    parser.add_argument("--notebook-id", help="Notebook to poll with --live")
+    args = parser.parse_args()
+
+    if args.live:
+        if not args.notebook_id:
+            parser.error("--live needs --notebook-id")
+        run_live(args.calls, args.notebook_id)
+    else:
+        run_stub(args.calls)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""WebDriver commands per probe: selector-by-selector vs one execute_script.
+
+find_element_by_priority, count_all_suggestions and count_save_to_note_buttons
+used to issue a find_elements (plus is_displayed / is_enabled checks) per
+selector on every poll. They now evaluate the whole selector list in the page
+with dom_probe.probe_selectors. This counts the WebDriver commands each
+version sends, and the command rate of the probing part of a query.
+
+It drives the real Selenium client against a stub connection that answers
+from a small simulated NotebookLM page and counts commands, so no browser or
+Selenium hub is needed. The "before" side is the previous implementation,
+reproduced below.
+
+Usage:
+    python benchmarks/bench_selector_probe.py
+    python benchmarks/bench_selector_probe.py --input-delay 2
+"""
+
+import argparse
+import os
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+from selenium import webdriver
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.remote.client_config import ClientConfig
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.support import expected_conditions as EC
+
+import notebooklm
+from dom_probe import _PROBE_SCRIPT
+
+ELEMENT_KEY = "element-6066-11e4-a52e-4f735466cecf"
+
+
+class StubPage:
+    """Elements of a simulated NotebookLM page and the selectors matching them."""
+
+    def __init__(self, input_delay: float):
+        self.started = time.monotonic()
+        self.input_delay = input_delay
+        chat_input = notebooklm.CHAT_INPUT_SELECTORS[1][1]  # only the placeholder XPath matches
+        send = notebooklm.SUBMIT_BUTTON_SELECTORS[1][1]
+        chip = notebooklm.SUGGESTION_CHIP_SELECTORS
+        save = notebooklm.SAVE_TO_NOTE_SELECTORS
+        # id -> (selector values that match it, appears after seconds)
+        self.elements = {
+            "input": ({chat_input}, input_delay),
+            "send": ({send}, 0),
+            "chip-1": ({chip[0][1], chip[2][1]}, 0),
+            "chip-2": ({chip[0][1], chip[2][1]}, 0),
+            "chip-3": ({chip[1][1], chip[2][1]}, 0),
+            "save-1": ({save[0][1], save[1][1]}, 0),
+        }
+
+    def find(self, value):
+        now = time.monotonic() - self.started
+        return [eid for eid, (matches, after) in self.elements.items() if value in matches and now >= after]
+
+
+class CountingStubConnection(RemoteConnection):
+    """Answers WebDriver commands from a StubPage and counts them."""
+
+    def __init__(self, page: StubPage):
+        super().__init__(client_config=ClientConfig(remote_server_addr="http://stub.invalid", keep_alive=False))
+        self.page = page
+        self.commands = 0
+
+    def execute(self, command, params):
+        self.commands += 1
+        if command == "newSession":
+            return {"value": {"sessionId": "stub", "capabilities": {"browserName": "chrome"}}}
+        if command == "findElements":
+            return {"value": [{ELEMENT_KEY: e} for e in self.page.find(params["value"])]}
+        if command == "findElement":
+            found = self.page.find(params["value"])
+            if not found:
+                raise NoSuchElementException(params["value"])
+            return {"value": {ELEMENT_KEY: found[0]}}
+        if command == "isElementEnabled":
+            return {"value": True}
+        if command == "w3cExecuteScript":
+            if params["script"] == _PROBE_SCRIPT:
+                return {"value": self._probe(params["args"][0])}
+            return {"value": True}  # isDisplayed atom
+        return {"value": None}
+
+    def _probe(self, selectors):
+        seen, counts, first, index = set(), [], None, -1
+        for i, (_, value) in enumerate(selectors):
+            found = self.page.find(value)
+            counts.append(len(found))
+            seen.update(found)
+            if first is None and found:
+                first, index = {ELEMENT_KEY: found[0]}, i
+        return {"first": first, "index": index, "counts": counts, "unique": len(seen)}
+
+
+# --- The previous implementation ---------------------------------------------
+
+def legacy_find_element_by_priority(driver, selectors, condition=EC.presence_of_element_located, timeout=10):
+    end_time = time.time() + timeout
+    while time.time() < end_time:
+        for by, value in selectors:
+            try:
+                element = condition((by, value))(driver)
+                if element:
+                    return element
+            except (NoSuchElementException, StaleElementReferenceException):
+                pass
+        time.sleep(0.2)
+    return None
+
+
+def legacy_count(driver, selectors):
+    ids = set()
+    for by, value in selectors:
+        for elem in driver.find_elements(by, value):
+            ids.add(elem.id)
+    return len(ids)
+
+
+IMPLEMENTATIONS = {
+    "before": {
+        "find": legacy_find_element_by_priority,
+        "suggestions": lambda d: legacy_count(d, notebooklm.SUGGESTION_CHIP_SELECTORS),
+        "save_to_note": lambda d: legacy_count(d, notebooklm.SAVE_TO_NOTE_SELECTORS),
+    },
+    "after": {
+        "find": notebooklm.find_element_by_priority,
+        "suggestions": notebooklm.count_all_suggestions,
+        "save_to_note": notebooklm.count_save_to_note_buttons,
+    },
+}
+
+
+def run(name, input_delay):
+    impl = IMPLEMENTATIONS[name]
+    conn = CountingStubConnection(StubPage(input_delay))
+    driver = webdriver.Remote(command_executor=conn, options=Options())
+
+    def measure(fn):
+        before, started = conn.commands, time.monotonic()
+        result = fn()
+        return conn.commands - before, time.monotonic() - started, result
+
+    rows = {}
+    # The query's probing: wait for the chat input, then the send button
+    n_input, t_input, found = measure(lambda: impl["find"](driver, notebooklm.CHAT_INPUT_SELECTORS,
+                                                           condition=EC.element_to_be_clickable, timeout=10))
+    assert found is not None
+    n_send, t_send, _ = measure(lambda: impl["find"](driver, notebooklm.SUBMIT_BUTTON_SELECTORS,
+                                                     condition=EC.element_to_be_clickable, timeout=5))
+    rows["chat input wait"] = (n_input, t_input)
+    rows["send button"] = (n_send, t_send)
+    n, t, chips = measure(lambda: impl["suggestions"](driver))
+    assert chips == 3, chips
+    rows["count suggestions"] = (n, t)
+    n, t, saves = measure(lambda: impl["save_to_note"](driver))
+    assert saves == 1, saves
+    rows["count save-to-note"] = (n, t)
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--input-delay", type=float, default=1.0,
+                        help="seconds before the chat input appears (default 1)")
+    args = parser.parse_args()
+
+    results = {name: run(name, args.input_delay) for name in IMPLEMENTATIONS}
+    print(f"{'probe':<22}{'before':>10}{'after':>10}   (WebDriver commands)")
+    for probe in results["before"]:
+        print(f"{probe:<22}{results['before'][probe][0]:>10}{results['after'][probe][0]:>10}")
+    for name, rows in results.items():
+        commands = rows["chat input wait"][0] + rows["send button"][0]
+        seconds = rows["chat input wait"][1] + rows["send button"][1]
+        print(f"{name}: query probing sent {commands} commands in {seconds:.1f}s ({commands / seconds:.1f}/s)")
+
+
+if __name__ == "__main__":
+    main()
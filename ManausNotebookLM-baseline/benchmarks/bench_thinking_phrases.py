@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+"""Thinking-phrase classifier: table loops vs compiled regexes.
+
+Compares the previous is_only_thinking_phrase / strip_thinking_phrase
+(reproduced below) with thinking_phrases.py on a corpus of answer-text
+snapshots, the sequence the streaming loop sees on each read, and checks that
+both give the same results on every snapshot.
+
+The default corpus replays the recorded stream in test_response.txt: a few
+placeholder snapshots ("Reading documents...", ...) and then the answer
+growing chunk by chunk, with the placeholder still at its start as NotebookLM
+renders it. --corpus takes captured snapshots instead, as JSON Lines (one JSON
+string per line, in capture order).
+
+Usage:
+    python benchmarks/bench_thinking_phrases.py
+    python benchmarks/bench_thinking_phrases.py --corpus snapshots.jsonl --repeat 20
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, APP_DIR)
+
+import thinking_phrases
+from thinking_phrases import THINKING_PHRASES, ThinkingPhraseStripper
+
+logging.basicConfig(level=logging.WARNING)
+logger = logging.getLogger("legacy")
+
+
+# --- The previous implementation ---------------------------------------------
+
+def legacy_is_only_thinking_phrase(text):
+    if not text or not text.strip():
+        return False
+    cleaned = text.strip().rstrip('.').rstrip('...')
+    for phrase in THINKING_PHRASES:
+        clean_phrase = phrase.lower().rstrip('.').rstrip('...')
+        if cleaned.lower() == clean_phrase:
+            return True
+        if cleaned.lower().startswith(clean_phrase) and len(cleaned) <= len(clean_phrase) + 5:
+            return True
+        if text.strip().lower() == phrase.lower():
+            return True
+    THINKING_VERBS = [
+        "Finding", "Checking", "Scanning", "Reading", "Getting",
+        "Thinking", "Working", "Parsing", "Sifting", "Analyzing",
+        "Assessing", "Refining", "Reviewing", "Exploring", "Examining",
+        "Gathering", "Consulting"
+    ]
+    if len(text) < 60:
+        text_lower = text.lower()
+        for verb in THINKING_VERBS:
+            if verb.lower() in text_lower:
+                logger.info(f"Heuristic thinking phrase match: '{text}' (contains {verb})")
+                return True
+    return False
+
+
+def legacy_strip_thinking_phrase(text):
+    text_lower = text.lower().strip()
+    best_match_len = 0
+    for phrase in THINKING_PHRASES:
+        clean_phrase = phrase.lower().rstrip('.').strip()
+        if text_lower.startswith(clean_phrase):
+            match_len = len(clean_phrase)
+            if text[:match_len].lower() == clean_phrase:
+                remaining = text[match_len:]
+                stripped_len = match_len
+                while remaining and (remaining[0] == '.' or remaining[0].isspace()):
+                    remaining = remaining[1:]
+                    stripped_len += 1
+                if stripped_len > best_match_len:
+                    best_match_len = stripped_len
+    if best_match_len > 0:
+        return text[best_match_len:]
+    if len(text) < 60:
+        THINKING_VERBS = [
+            "Finding", "Checking", "Scanning", "Reading", "Getting",
+            "Thinking", "Working", "Parsing", "Sifting", "Analyzing",
+            "Assessing", "Refining", "Reviewing", "Exploring", "Examining",
+            "Gathering", "Consulting"
+        ]
+        for verb in THINKING_VERBS:
+            if text.strip().startswith(verb):
+                return ""
+    return text
+
+
+# --- Corpus --------------------------------------------------------------------
+
+def recorded_stream_corpus():
+    """Snapshots of the answer element while test_response.txt was streamed."""
+    chunks = []
+    with open(os.path.join(APP_DIR, "test_response.txt"), encoding="utf-8") as f:
+        for line in f:
+            if line.startswith("data: "):
+                event = json.loads(line[6:])
+                if "chunk" in event:
+                    chunks.append(event["chunk"])
+    snapshots = ["Reading documents...", "Reading documents...", "Finding key words...", "Finding key words..."]
+    text = "Finding key words...\n"
+    for chunk in chunks:
+        # NotebookLM streams a few words per DOM update
+        words = chunk.split(" ")
+        for i in range(0, len(words), 4):
+            text += " ".join(words[i:i + 4]) + " "
+            snapshots.append(text)
+    return snapshots
+
+
+def load_corpus(path):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def timed(fn, corpus, repeat):
+    started = time.perf_counter()
+    for _ in range(repeat):
+        results = fn(corpus)
+    return (time.perf_counter() - started) / (repeat * len(corpus)), results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--corpus", help="JSON Lines file of captured snapshot texts")
+    parser.add_argument("--repeat", type=int, default=10, help="passes over the corpus (default 10)")
+    args = parser.parse_args()
+
+    corpus = load_corpus(args.corpus) if args.corpus else recorded_stream_corpus()
+    sizes = [len(t) for t in corpus]
+    print(f"corpus: {len(corpus)} snapshots, {min(sizes)}-{max(sizes)} chars")
+
+    def incremental(texts):
+        stripper = ThinkingPhraseStripper()
+        return [stripper.strip(t) for t in texts]
+
+    runs = [
+        ("is_only_thinking_phrase", lambda c: [legacy_is_only_thinking_phrase(t) for t in c],
+         lambda c: [thinking_phrases.is_only_thinking_phrase(t) for t in c]),
+        ("strip_thinking_phrase", lambda c: [legacy_strip_thinking_phrase(t) for t in c],
+         lambda c: [thinking_phrases.strip_thinking_phrase(t) for t in c]),
+        ("strip (incremental)", lambda c: [legacy_strip_thinking_phrase(t) for t in c], incremental),
+    ]
+    print(f"{'':<26}{'before':>12}{'after':>12}{'speed-up':>10}")
+    for name, before_fn, after_fn in runs:
+        before, expected = timed(before_fn, corpus, args.repeat)
+        after, actual = timed(after_fn, corpus, args.repeat)
+        if actual != expected:
+            mismatch = next(i for i, (a, b) in enumerate(zip(actual, expected)) if a != b)
+            sys.exit(f"{name}: results differ on snapshot {mismatch}: {corpus[mismatch][:80]!r}")
+        print(f"{name:<26}{before * 1e6:>10.1f}us{after * 1e6:>10.1f}us{before / after:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+"""
+Persistent connections to long-lived mcp_bridge.py workers.
+
+Starting a fresh bridge process per request costs interpreter start-up,
+importing notebooklm_mcp, loading tokens and a NotebookLM homepage fetch.
+BridgePool keeps a few `mcp_bridge.py --serve` workers running instead, each
+with a warm client, and talks to them over JSON lines on stdin/stdout. If
+MCP_BRIDGE_SOCKET is set, it connects to an already running
+`mcp_bridge.py --socket PATH` daemon instead of spawning workers.
+
+Requests are tagged with an id, so one worker can have several in flight.
+Dead workers are replaced on the next request.
+"""
+
+import itertools
+import logging
+import socket
+import subprocess
+import threading
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Callable, Dict, List, Optional
+
+import json_codec
+
+logger = logging.getLogger(__name__)
+
+# Commands that are safe to resend if a worker dies mid-request
+RETRYABLE_COMMANDS = {"ping", "list", "status"}
+
+
+class BridgeError(Exception):
+    """Raised when a bridge worker can't be reached or dies mid-request"""
+    pass
+
+
+class BridgeWorker:
+    """One persistent connection (pipe or socket) to a bridge worker."""
+
+    def __init__(self, name: str, rfile, wfile, process: Optional[subprocess.Popen] = None,
+                 sock: Optional[socket.socket] = None):
+        self.name = name
+        self._rfile = rfile
+        self._wfile = wfile
+        self._process = process
+        self._sock = sock
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._alive = True
+        self._reader = threading.Thread(target=self._read_loop, name=f"bridge-reader-{name}", daemon=True)
+        self._reader.start()
+
+    @property
+    def alive(self) -> bool:
+        if self._process is not None and self._process.poll() is not None:
+            return False
+        return self._alive
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._pending)
+
+    def call(self, payload: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        future: Future = Future()
+        with self._lock:
+            if not self._alive:
+                raise BridgeError(f"Bridge worker {self.name} is not running")
+            request_id = next(self._ids)
+            self._pending[request_id] = future
+        try:
+            line = json_codec.dumps({**payload, "id": request_id}) + "\n"
+            with self._write_lock:
+                self._wfile.write(line)
+                self._wfile.flush()
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise BridgeError(f"Bridge worker {self.name} timed out after {timeout}s")
+        except (OSError, ValueError) as e:
+            # Broken pipe / closed file: the worker is gone
+            self._fail_all(BridgeError(f"Bridge worker {self.name} connection lost: {e}"))
+            raise BridgeError(f"Bridge worker {self.name} connection lost: {e}")
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+
+    def _read_loop(self) -> None:
+        try:
+            for line in self._rfile:
+                try:
+                    message = json_codec.loads(line)
+                except json_codec.JSONDecodeError:
+                    logger.warning(f"Bridge worker {self.name} wrote a non-JSON line: {line[:200]!r}")
+                    continue
+                with self._lock:
+                    future = self._pending.get(message.get("id"))
+                if future is not None and not future.done():
+                    future.set_result(message.get("result") or {"status": "error", "error": "Empty bridge reply"})
+        except (OSError, ValueError):
+            pass
+        self._fail_all(BridgeError(f"Bridge worker {self.name} exited"))
+
+    def _fail_all(self, error: Exception) -> None:
+        with self._lock:
+            self._alive = False
+            pending = list(self._pending.values())
+        for future in pending:
+            if not future.done():
+                future.set_exception(error)
+
+    def close(self) -> None:
+        self._fail_all(BridgeError(f"Bridge worker {self.name} closed"))
+        for f in (self._wfile, self._rfile):
+            try:
+                f.close()
+            except Exception:
+                pass
+        if self._sock is not None:
+            try:
+                self._sock.close()
+            except Exception:
+                pass
+        if self._process is not None and self._process.poll() is None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+
+
+def spawn_stdio_worker(python: str, script: str, cwd: str, env: Dict[str, str], name: str) -> BridgeWorker:
+    """Start `mcp_bridge.py --serve` and connect to its stdin/stdout."""
+    process = subprocess.Popen(
+        [python, script, '--serve'],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=None,  # worker logs go to our stderr
+        text=True,
+        encoding='utf-8',
+        bufsize=1,
+        cwd=cwd,
+        env=env,
+    )
+    return BridgeWorker(name, process.stdout, process.stdin, process=process)
+
+
+def connect_socket_worker(path: str, name: str) -> BridgeWorker:
+    """Open a connection to a running `mcp_bridge.py --socket PATH` daemon."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.connect(path)
+    rfile = sock.makefile('r', encoding='utf-8')
+    wfile = sock.makefile('w', encoding='utf-8')
+    return BridgeWorker(name, rfile, wfile, sock=sock)
+
+
+class BridgePool:
+    """A fixed number of bridge workers; each call goes to the least busy one."""
+
+    def __init__(self, size: int, factory: Callable[[str], BridgeWorker], timeout: float = 120.0):
+        self.size = max(1, size)
+        self.timeout = timeout
+        self._factory = factory
+        self._workers: List[Optional[BridgeWorker]] = [None] * self.size
+        self._lock = threading.Lock()
+
+    def _checkout(self) -> BridgeWorker:
+        with self._lock:
+            for i, worker in enumerate(self._workers):
+                if worker is None or not worker.alive:
+                    if worker is not None:
+                        logger.warning(f"Bridge worker {worker.name} died, replacing it")
+                        worker.close()
+                    self._workers[i] = self._factory(f"{i}")
+            return min(self._workers, key=lambda w: w.in_flight)
+
+    def call(self, payload: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Send one command.
+
+        Read-only commands are retried once on a fresh worker if the
+        connection drops; commands that create things are not resent.
+        """
+        timeout = timeout or self.timeout
+        attempts = 2 if payload.get("command") in RETRYABLE_COMMANDS else 1
+        for attempt in range(attempts):
+            worker = self._checkout()
+            try:
+                return worker.call(payload, timeout)
+            except BridgeError:
+                if worker.alive or attempt == attempts - 1:
+                    raise  # a timeout, or out of attempts
+
+    def warm(self) -> None:
+        """Start every worker now rather than on first use."""
+        self._checkout()
+
+    def close(self) -> None:
+        with self._lock:
+            for worker in self._workers:
+                if worker is not None:
+                    worker.close()
+            self._workers = [None] * self.size
@@ -0,0 +1,259 @@
+"""
+A fixed set of warm WebDriver sessions shared by /api/process_query.
+
+One global browser behind one lock meant one NotebookLM query at a time.
+BrowserPool holds up to `size` sessions on the Selenium hub; each query
+checks one out, uses it exclusively and checks it back in, so queries run
+in parallel up to the pool size.
+
+Sessions are:
+* created lazily (or all at once with warm()) by a factory given the slot
+  number, so each slot can use its own Chrome profile directory
+* health-checked on checkout (a cheap current_url round trip) and replaced
+  if dead
+* recycled after `max_uses` queries, or immediately when a query failed
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class BrowserPoolTimeout(Exception):
+    """Raised when no session becomes free within the checkout timeout"""
+    pass
+
+
+class PooledBrowser:
+    """One pool slot's WebDriver session and its bookkeeping."""
+
+    def __init__(self, slot: int, driver: Any):
+        self.slot = slot
+        self.driver = driver
+        self.uses = 0
+        self.created_at = time.time()
+        self.last_used = self.created_at
+        self.retire = False  # set by reset() while checked out
+        self.context: Dict[str, Any] = {}  # caller state that lives as long as the session
+
+    @property
+    def name(self) -> str:
+        return f"browser-{self.slot}"
+
+
+class BrowserPool:
+    """Checkout/checkin pool of WebDriver sessions, one per slot."""
+
+    def __init__(self, size: int, factory: Callable[[int], Any], quit_driver: Callable[[Any], None],
+                 max_uses: int = 50):
+        self.size = max(1, size)
+        self.max_uses = max(1, max_uses)
+        self._factory = factory
+        self._quit = quit_driver
+        self._cond = threading.Condition()
+        self._idle: List[PooledBrowser] = []          # warm, free sessions
+        self._free_slots: List[int] = list(range(self.size))  # slots with no session
+        self._busy: Dict[int, PooledBrowser] = {}
+        self._starting = 0  # slots being started by warm()
+
+    def _healthy(self, browser: PooledBrowser) -> bool:
+        try:
+            _ = browser.driver.current_url
+            return True
+        except Exception as e:
+            logger.warning(f"{browser.name} failed its health check: {e}")
+            return False
+
+    def checkout(self, timeout: Optional[float] = None) -> PooledBrowser:
+        """Take a healthy session, starting one if a slot is empty.
+
+        Raises:
+            BrowserPoolTimeout: every session stayed busy for `timeout` seconds
+            Exception: whatever the factory raised when a session couldn't start
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._cond:
+                while not self._idle and not self._free_slots:
+                    remaining = None if deadline is None else deadline - time.monotonic()
+                    if remaining is not None and remaining <= 0:
+                        raise BrowserPoolTimeout(f"All {self.size} browser sessions are busy")
+                    self._cond.wait(remaining)
+                if self._idle:
+                    browser = self._idle.pop()  # most recently used: warmest
+                    slot = None
+                else:
+                    browser = None
+                    slot = self._free_slots.pop(0)
+                    self._busy[slot] = None  # reserve while starting
+            if browser is not None:
+                with self._cond:
+                    self._busy[browser.slot] = browser
+                if self._healthy(browser):
+                    return browser
+                self._discard(browser)
+                continue  # try again, the slot is free now
+            try:
+                browser = PooledBrowser(slot, self._factory(slot))
+            except Exception:
+                with self._cond:
+                    del self._busy[slot]
+                    self._free_slots.append(slot)
+                    self._cond.notify()
+                raise
+            logger.info(f"Started {browser.name}")
+            with self._cond:
+                self._busy[slot] = browser
+            return browser
+
+    def checkin(self, browser: PooledBrowser, error: bool = False) -> None:
+        """Return a session; it's recycled after an error or max_uses queries."""
+        browser.uses += 1
+        browser.last_used = time.time()
+        if error or browser.retire or browser.uses >= self.max_uses:
+            reason = "error" if error else "reset" if browser.retire else f"{browser.uses} queries"
+            logger.info(f"Recycling {browser.name} ({reason})")
+            self._discard(browser)
+            return
+        with self._cond:
+            self._busy.pop(browser.slot, None)
+            self._idle.append(browser)
+            self._cond.notify()
+
+    def _discard(self, browser: PooledBrowser) -> None:
+        try:
+            self._quit(browser.driver)
+        finally:
+            with self._cond:
+                self._busy.pop(browser.slot, None)
+                if browser in self._idle:
+                    self._idle.remove(browser)
+                self._free_slots.append(browser.slot)
+                self._cond.notify()
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[PooledBrowser]:
+        """Check out a session for a with-block; errors recycle it."""
+        browser = self.checkout(timeout)
+        try:
+            yield browser
+        except BaseException:
+            self.checkin(browser, error=True)
+            raise
+        else:
+            self.checkin(browser)
+
+    def warm(self) -> None:
+        """Start sessions in every empty slot, in background threads."""
+        with self._cond:
+            slots = list(self._free_slots)
+            self._free_slots.clear()
+            self._starting += len(slots)
+        for slot in slots:
+            threading.Thread(target=self._warm_slot, args=(slot,), name=f"browser-warm-{slot}", daemon=True).start()
+
+    def _warm_slot(self, slot: int) -> None:
+        browser = None
+        try:
+            browser = PooledBrowser(slot, self._factory(slot))
+            logger.info(f"Warmed {browser.name}")
+        except Exception as e:
+            logger.warning(f"Could not warm browser-{slot}: {e}")
+        with self._cond:
+            self._starting -= 1
+            if browser is not None:
+                self._idle.append(browser)
+            else:
+                self._free_slots.append(slot)
+            self._cond.notify()
+
+    def reset(self) -> int:
+        """Quit idle sessions now and retire busy ones when they come back.
+
+        Returns the number of sessions affected.
+        """
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            busy = [b for b in self._busy.values() if b is not None]
+            for browser in busy:
+                browser.retire = True
+        for browser in idle:
+            self._discard(browser)
+        return len(idle) + len(busy)
+
+    def inspect(self, fn: Callable[[Any], Any]) -> Optional[Any]:
+        """Run fn(driver) on an idle session, holding it meanwhile.
+
+        Returns None when no session is idle; a session that raises is
+        discarded and the error re-raised.
+        """
+        with self._cond:
+            if not self._idle:
+                return None
+            browser = self._idle.pop()
+            self._busy[browser.slot] = browser
+        try:
+            result = fn(browser.driver)
+        except Exception:
+            self._discard(browser)
+            raise
+        with self._cond:
+            self._busy.pop(browser.slot, None)
+            self._idle.append(browser)
+            self._cond.notify()
+        return result
+
+    def sweep(self, fn: Callable[[PooledBrowser], None]) -> None:
+        """Run fn(browser) on each session that is idle right now, one at a time."""
+        with self._cond:
+            candidates = list(self._idle)
+        for candidate in candidates:
+            with self._cond:
+                if candidate not in self._idle:
+                    continue  # checked out meanwhile
+                self._idle.remove(candidate)
+                self._busy[candidate.slot] = candidate
+            try:
+                fn(candidate)
+            except Exception as e:
+                logger.warning(f"Sweep of {candidate.name} failed: {e}")
+                self._discard(candidate)
+                continue
+            with self._cond:
+                self._busy.pop(candidate.slot, None)
+                self._idle.append(candidate)
+                self._cond.notify()
+
+    def close(self) -> None:
+        self.reset()
+
+    def sessions(self) -> List[Dict[str, Any]]:
+        """Snapshot of live sessions for status endpoints."""
+        with self._cond:
+            entries = [(b, False) for b in self._idle] + [(b, True) for b in self._busy.values() if b is not None]
+        return [
+            {
+                "slot": b.slot,
+                "busy": busy,
+                "uses": b.uses,
+                "session_id": getattr(b.driver, "session_id", None),
+                "age_seconds": round(time.time() - b.created_at),
+            }
+            for b, busy in sorted(entries, key=lambda e: e[0].slot)
+        ]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "busy": len(self._busy),
+                "starting": self._starting,
+                "empty": len(self._free_slots),
+                "max_uses": self.max_uses,
+            }
@@ -0,0 +1,81 @@
+"""
+Evaluate a whole selector list in one WebDriver round trip.
+
+The NotebookLM page is located with fallback lists of CSS/XPath selectors.
+Probing them one find_elements call at a time cost a hub round trip per
+selector (plus is_displayed/is_enabled calls per candidate) on every 200ms
+poll. probe_selectors() sends the list to the page in a single
+execute_script call and gets back the first match, per-selector counts and
+the number of distinct elements matched.
+"""
+
+from typing import Any, Dict, Iterable, List, Tuple
+
+from selenium.webdriver.common.by import By
+
+PRESENCE = "presence"
+VISIBLE = "visible"      # like EC.visibility_of_element_located
+CLICKABLE = "clickable"  # like EC.element_to_be_clickable: visible and enabled
+
+# arguments: [[kind, value], ...] with kind "css" or "xpath", mode
+_PROBE_SCRIPT = """
+const selectors = arguments[0], mode = arguments[1];
+const find = (kind, value) => {
+  if (kind === 'xpath') {
+    const snapshot = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    const nodes = [];
+    for (let i = 0; i < snapshot.snapshotLength; i++) nodes.push(snapshot.snapshotItem(i));
+    return nodes;
+  }
+  return Array.from(document.querySelectorAll(value));
+};
+const visible = el => {
+  const style = getComputedStyle(el);
+  return style.display !== 'none' && style.visibility !== 'hidden' && el.getClientRects().length > 0;
+};
+const accepts = el => mode === 'presence' || (visible(el) && (mode === 'visible' || !el.disabled));
+const seen = new Set();
+const counts = [];
+let first = null, index = -1;
+selectors.forEach(([kind, value], i) => {
+  let found = [];
+  try { found = find(kind, value); } catch (e) { /* invalid selector: count 0 */ }
+  counts.push(found.length);
+  for (const el of found) {
+    seen.add(el);
+    if (first === null && accepts(el)) { first = el; index = i; }
+  }
+});
+return {first: first, index: index, counts: counts, unique: seen.size};
+"""
+
+
+def _to_page_selector(by: str, value: str) -> Tuple[str, str]:
+    """Map a Selenium locator onto what the probe script understands."""
+    if by == By.XPATH:
+        return "xpath", value
+    if by == By.CSS_SELECTOR:
+        return "css", value
+    if by == By.ID:
+        return "css", f'[id="{value}"]'
+    if by == By.NAME:
+        return "css", f'[name="{value}"]'
+    if by == By.CLASS_NAME:
+        return "css", f".{value}"
+    if by == By.TAG_NAME:
+        return "css", value
+    raise ValueError(f"Unsupported locator for probing: {by}")
+
+
+def probe_selectors(driver, selectors: Iterable[Tuple[str, str]], mode: str = PRESENCE) -> Dict[str, Any]:
+    """Evaluate (By, value) selectors in order, in one execute_script call.
+
+    Returns a dict with:
+        first:  the first element (in selector priority order) that satisfies
+                mode, as a WebElement, or None
+        index:  which selector matched it (-1 if none)
+        counts: number of elements each selector matched
+        unique: number of distinct elements matched by any selector
+    """
+    page_selectors: List[Tuple[str, str]] = [_to_page_selector(by, value) for by, value in selectors]
+    return driver.execute_script(_PROBE_SCRIPT, page_selectors, mode)
@@ -65,6 +65,8 @@ echo "Checking for and removing stale Chrome lock files from profile directory:
 rm -f "$PROFILE_DIR/SingletonLock"
 rm -f "$PROFILE_DIR/SingletonCookie"
 rm -f "$PROFILE_DIR/SingletonSocket"
+# Extra browser pool slots keep their profiles in $PROFILE_DIR/pool-<n>
+rm -f "$PROFILE_DIR"/pool-*/Singleton*
 echo "Stale lock files removed."
 
 
@@ -1,9 +1,13 @@
 from flask import Blueprint, request, jsonify
-import requests
 import logging
 
+from llm_proxy import LLMProxy
+
 grok_bp = Blueprint('grok', __name__)
 
+# Pooled keep-alive connections; GROK_* env vars tune limits (see llm_proxy.py)
+grok_proxy = LLMProxy('Grok', 'https://api.x.ai/v1/chat/completions', 'GROK')
+
 @grok_bp.route('/grok', methods=['POST'])
 def proxy_grok():
 
@@ -14,26 +18,8 @@ def proxy_grok():
         if not auth_header:
             return jsonify({"error": "Missing Authorization header"}), 401
 
-        response = requests.post(
-            'https://api.x.ai/v1/chat/completions',
-            json=data,
-            headers={
-                'Content-Type': 'application/json',
-                'Authorization': auth_header
-            }
-        )
-        
-        # Create Flask response from upstream content and status
-        from flask import make_response
-        flask_response = make_response(response.content, response.status_code)
-        
-        # Forward safe headers
-        excluded_headers = ['content-encoding', 'content-length', 'transfer-encoding', 'connection', 'access-control-allow-origin', 'access-control-allow-methods', 'access-control-allow-headers']
-        for k, v in response.headers.items():
-            if k.lower() not in excluded_headers:
-                flask_response.headers[k] = v
-                
-        return flask_response
+        # "stream": true is relayed as server-sent events as they arrive
+        return grok_proxy.forward(data, auth_header)
     except Exception as e:
         logging.error(f"Grok proxy error: {e}")
         return jsonify({"error": str(e)}), 500
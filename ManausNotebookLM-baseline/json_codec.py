@@ -0,0 +1,162 @@
+"""
+Fast JSON encode/decode for the Flask blueprints.
+
+Same structure as notebooklm_mcp.codec (which the app can't rely on being
+importable): uses orjson or msgspec when installed and falls back to the
+stdlib json module. Set NOTEBOOKLM_JSON_BACKEND=orjson|msgspec|json to force
+a backend.
+
+Callers must go through the module (``json_codec.loads``/``json_codec.dumps``)
+rather than importing the functions directly, so that ``use()`` can swap
+backends.
+"""
+
+import json
+import os
+from typing import Any
+
+from flask.json.provider import DefaultJSONProvider
+
+# All backends raise (a subclass of) this on invalid input
+JSONDecodeError = json.JSONDecodeError
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+backend = "json"
+
+
+def _json_loads(s: str | bytes) -> Any:
+    return json.loads(s)
+
+
+def _json_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"))
+
+
+loads = _json_loads
+dumps = _json_dumps
+
+
+def _build_orjson():
+    import orjson
+
+    def _loads(s: str | bytes) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, let the stdlib have the final say
+            return json.loads(s)
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            return _json_dumps(obj)
+
+    return _loads, _dumps
+
+
+def _build_msgspec():
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def _loads(s: str | bytes) -> Any:
+        try:
+            return decoder.decode(s)
+        except msgspec.DecodeError:
+            return json.loads(s)
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return encoder.encode(obj).decode()
+        except (TypeError, msgspec.EncodeError):
+            return _json_dumps(obj)
+
+    return _loads, _dumps
+
+
+_BUILDERS = {
+    "orjson": _build_orjson,
+    "msgspec": _build_msgspec,
+}
+
+
+def use(name: str | None = None) -> str:
+    """Select the JSON backend (None picks the fastest installed one); returns its name.
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the requested backend is not installed
+    """
+    global backend, loads, dumps
+
+    if name is not None and name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}'. Use one of: {', '.join(BACKENDS)}")
+
+    candidates = [name] if name else list(BACKENDS)
+    for candidate in candidates:
+        if candidate == "json":
+            loads, dumps = _json_loads, _json_dumps
+            backend = "json"
+            return backend
+        try:
+            loads, dumps = _BUILDERS[candidate]()
+        except ImportError:
+            if name:
+                raise
+            continue
+        backend = candidate
+        return backend
+
+    return backend
+
+
+try:
+    use(os.environ.get("NOTEBOOKLM_JSON_BACKEND") or None)
+except (ImportError, ValueError):
+    # Requested backend unavailable - never fail import over an optimization
+    use()
+
+
+def sse_event(payload: dict) -> str:
+    """Format a payload as a single Server-Sent Events data frame."""
+    return f"data: {dumps(payload)}\n\n"
+
+
+# What Flask's response() passes to dumps() outside debug mode
+_COMPACT_KWARGS = {"separators": (",", ":")}
+
+
+class FastJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider that encodes with orjson when it's the backend.
+
+    Output matches Flask's default provider: keys are sorted when sort_keys
+    is set, and dates, Decimals, UUIDs and dataclasses go through
+    self.default (so dates stay HTTP dates). Flask's provider handles
+    everything else: other backends, pretty-printing (debug mode) or other
+    keyword arguments, non-ASCII output when ensure_ascii is set, and
+    whatever orjson can't encode.
+    """
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if backend != "orjson" or (kwargs and kwargs != _COMPACT_KWARGS):
+            return super().dumps(obj, **kwargs)
+        import orjson
+
+        option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            encoded = orjson.dumps(obj, default=self.default, option=option)
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+        if self.ensure_ascii and not encoded.isascii():
+            return super().dumps(obj, **kwargs)
+        return encoded.decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return loads(s)
@@ -0,0 +1,112 @@
+"""
+Pass-through proxy for OpenAI-style chat completion APIs (Grok, DeepSeek).
+
+Each provider gets one requests.Session with a pooled keep-alive adapter, so
+repeat calls skip the TCP/TLS handshake. Requests with "stream": true are
+relayed chunk by chunk as the provider sends its SSE frames, instead of
+being buffered until the completion finishes.
+
+Per-provider settings (PREFIX is e.g. GROK or DEEPSEEK):
+    PREFIX_MAX_CONCURRENCY   upstream calls in flight (default 8)
+    PREFIX_QUEUE_TIMEOUT     seconds to wait for a free slot before 503 (default 10)
+    PREFIX_CONNECT_TIMEOUT   seconds (default 5)
+    PREFIX_READ_TIMEOUT      seconds between bytes from upstream (default 120)
+"""
+
+import logging
+import os
+import threading
+
+import requests
+from flask import Response, jsonify, stream_with_context
+from requests.adapters import HTTPAdapter
+
+import json_codec
+
+# Upstream headers not to copy onto our response
+EXCLUDED_HEADERS = {
+    'content-encoding', 'content-length', 'transfer-encoding', 'connection',
+    'access-control-allow-origin', 'access-control-allow-methods', 'access-control-allow-headers',
+}
+
+
+class LLMProxy:
+    """Forwards chat completion calls to one provider."""
+
+    def __init__(self, name: str, url: str, env_prefix: str):
+        self.name = name
+        self.url = url
+        self.max_concurrency = int(os.environ.get(f'{env_prefix}_MAX_CONCURRENCY', '8'))
+        self.queue_timeout = float(os.environ.get(f'{env_prefix}_QUEUE_TIMEOUT', '10'))
+        self.timeout = (
+            float(os.environ.get(f'{env_prefix}_CONNECT_TIMEOUT', '5')),
+            float(os.environ.get(f'{env_prefix}_READ_TIMEOUT', '120')),
+        )
+        self._slots = threading.BoundedSemaphore(self.max_concurrency)
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.max_concurrency)
+        self._session.mount('https://', adapter)
+        self._session.mount('http://', adapter)
+
+    def _copy_headers(self, upstream, response) -> None:
+        for k, v in upstream.headers.items():
+            if k.lower() not in EXCLUDED_HEADERS:
+                response.headers[k] = v
+
+    def forward(self, data, auth_header: str):
+        """Send one completion request and build the Flask response."""
+        if not self._slots.acquire(timeout=self.queue_timeout):
+            logging.warning(f"{self.name} proxy: all {self.max_concurrency} slots busy")
+            return jsonify({"error": f"Too many concurrent {self.name} requests, try again shortly"}), 503
+
+        stream = bool(isinstance(data, dict) and data.get('stream'))
+        upstream = None
+        try:
+            upstream = self._session.post(
+                self.url,
+                data=json_codec.dumps(data).encode('utf-8'),
+                headers={
+                    'Content-Type': 'application/json',
+                    'Authorization': auth_header
+                },
+                timeout=self.timeout,
+                stream=stream,
+            )
+
+            if not stream or upstream.status_code != 200:
+                # Buffered reply (errors are small JSON bodies even for streams)
+                response = Response(upstream.content, upstream.status_code)
+                self._copy_headers(upstream, response)
+                upstream.close()
+                self._slots.release()
+                return response
+
+            released = threading.Event()
+
+            def finish(upstream=upstream):
+                # Runs from the generator and from call_on_close; the latter
+                # covers clients that leave before the body starts
+                if not released.is_set():
+                    released.set()
+                    upstream.close()
+                    self._slots.release()
+
+            def relay(upstream=upstream):
+                try:
+                    # chunk_size=None yields each chunk as soon as it arrives
+                    for chunk in upstream.iter_content(chunk_size=None):
+                        yield chunk
+                finally:
+                    finish()
+
+            response = Response(stream_with_context(relay()), upstream.status_code)
+            response.call_on_close(finish)
+            self._copy_headers(upstream, response)
+            response.headers['Cache-Control'] = 'no-cache'
+            response.headers['X-Accel-Buffering'] = 'no'
+            return response
+        except Exception:
+            if upstream is not None:
+                upstream.close()
+            self._slots.release()
+            raise
@@ -5,9 +5,11 @@ import logging
 from logging.handlers import RotatingFileHandler
 from flask import Flask, send_from_directory
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
 from models import db
+from json_codec import FastJSONProvider
 from user import user_bp
-from notebooklm import notebooklm_bp, browser_lock, start_browser_initialization_thread, reset_browser
+from notebooklm import notebooklm_bp, start_browser_initialization_thread, get_browser_pool
 from grok import grok_bp
 from deepseek import deepseek_bp
 
@@ -42,6 +44,16 @@ root_logger.addHandler(file_handler)
 logging.info(f"Logging initialized. Log file: {LOG_FILE}")
 
 app = Flask(__name__, static_folder=os.path.join(os.path.dirname(__file__), 'static'))
+# Route request/response JSON through orjson/msgspec when available
+app.json = FastJSONProvider(app)
+
+# Reverse proxies in front of the app (Caddy in docker-compose). Their
+# X-Forwarded-For entries are trusted so request.remote_addr is the real
+# client, which the query queue keys fairness on. Leave at 0 when clients
+# reach the app directly: they could set the header themselves.
+TRUSTED_PROXY_HOPS = int(os.environ.get('TRUSTED_PROXY_HOPS', '0'))
+if TRUSTED_PROXY_HOPS > 0:
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=TRUSTED_PROXY_HOPS)
 
 # Load secret key from environment variable for better security
 SECRET_KEY = os.environ.get('FLASK_SECRET_KEY', 'a-default-insecure-secret-key-for-dev')
@@ -75,17 +87,18 @@ with app.app_context(): # Creates tables if they don't exist
 # Graceful shutdown handler
 def graceful_shutdown(signum, frame):
     """Ensures the browser is closed cleanly on app termination."""
-    logging.info("Shutdown signal received. Closing browser instance...")
-    with browser_lock:
-        reset_browser()
+    logging.info("Shutdown signal received. Closing browser pool...")
+    get_browser_pool().close()
     exit(0)
 
 signal.signal(signal.SIGINT, graceful_shutdown)
 signal.signal(signal.SIGTERM, graceful_shutdown)
 
-# Browser is now initialized on-demand during query execution, not on startup
-# This ensures VNC shows a clean desktop when no queries are running
-# start_browser_initialization_thread()
+# Browser sessions are started on-demand during query execution, not on startup
+# This ensures VNC shows a clean desktop when no queries are running.
+# Set BROWSER_POOL_WARM_ON_START=true to pre-start the whole pool instead.
+if os.environ.get('BROWSER_POOL_WARM_ON_START', 'false').lower() == 'true':
+    start_browser_initialization_thread()
 
 @app.route('/', defaults={'path': ''})
 @app.route('/<path:path>')
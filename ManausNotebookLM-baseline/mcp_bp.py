@@ -1,12 +1,18 @@
 import os
-import json
+import re
+import atexit
 import logging
+import mimetypes
 import subprocess
+import threading
 import requests
 import httpx
 import time
 from urllib.parse import urlparse, parse_qs, urlencode, urlunparse
-from flask import Blueprint, request, jsonify, Response, stream_with_context
+from flask import Blueprint, request, jsonify, Response, send_file, stream_with_context, url_for
+
+import json_codec
+from json_codec import sse_event
 
 mcp_bp = Blueprint('mcp_bp', __name__)
 logger = logging.getLogger(__name__)
@@ -36,7 +42,64 @@ if not os.path.exists(MCP_VENV_PYTHON):
 
 MCP_BRIDGE_SCRIPT = os.path.join(MCP_DIR, 'mcp_bridge.py')
 
+# Persistent bridge workers (see bridge_pool.py). MCP_BRIDGE_WORKERS=0 goes back
+# to one subprocess per request.
+MCP_BRIDGE_WORKERS = int(os.environ.get('MCP_BRIDGE_WORKERS', '2'))
+MCP_BRIDGE_SOCKET = os.environ.get('MCP_BRIDGE_SOCKET', '')
+MCP_BRIDGE_TIMEOUT = float(os.environ.get('MCP_BRIDGE_TIMEOUT', '120'))
+
+_bridge_pool = None
+_bridge_pool_lock = threading.Lock()
+
+def _bridge_env():
+    # Ensure the subprocess uses the local src/ for the package, not the installed one
+    env = os.environ.copy()
+    src_path = os.path.join(MCP_DIR, 'src')
+    if src_path not in env.get('PYTHONPATH', ''):
+        env['PYTHONPATH'] = f"{src_path}{os.pathsep}{env.get('PYTHONPATH', '')}"
+    # The bridge may emit raw UTF-8 (fast JSON backends don't escape non-ASCII)
+    env['PYTHONIOENCODING'] = 'utf-8'
+    return env
+
+def get_bridge_pool():
+    """The shared pool of persistent bridge workers, or None if disabled."""
+    global _bridge_pool
+    if MCP_BRIDGE_WORKERS <= 0 and not MCP_BRIDGE_SOCKET:
+        return None
+    if _bridge_pool is None:
+        with _bridge_pool_lock:
+            if _bridge_pool is None:
+                from bridge_pool import BridgePool, connect_socket_worker, spawn_stdio_worker
+
+                if MCP_BRIDGE_SOCKET:
+                    factory = lambda name: connect_socket_worker(MCP_BRIDGE_SOCKET, name)
+                else:
+                    env = _bridge_env()
+                    factory = lambda name: spawn_stdio_worker(MCP_VENV_PYTHON, MCP_BRIDGE_SCRIPT, MCP_DIR, env, name)
+                _bridge_pool = BridgePool(max(1, MCP_BRIDGE_WORKERS), factory, timeout=MCP_BRIDGE_TIMEOUT)
+                atexit.register(_bridge_pool.close)
+    return _bridge_pool
+
 def run_bridge_command(command_payload):
+    """Runs a bridge command on a persistent worker, falling back to a one-shot subprocess."""
+    pool = None
+    try:
+        pool = get_bridge_pool()
+    except Exception as e:
+        logger.error(f"Bridge worker pool unavailable: {e}")
+    if pool is not None:
+        from bridge_pool import BridgeError
+        try:
+            return pool.call(command_payload)
+        except BridgeError as e:
+            logger.error(f"Bridge worker failed: {e}")
+            return {"status": "error", "error": str(e)}
+        except Exception as e:
+            # Couldn't start or reach a worker at all
+            logger.error(f"Bridge worker pool failed, running one-shot bridge: {e}")
+    return run_bridge_command_once(command_payload)
+
+def run_bridge_command_once(command_payload):
     """Executes the bridge script with the given JSON payload."""
     try:
         if not os.path.exists(MCP_VENV_PYTHON):
@@ -45,12 +108,6 @@ def run_bridge_command(command_payload):
         if not os.path.exists(MCP_BRIDGE_SCRIPT):
             return {"status": "error", "error": f"Bridge script not found at {MCP_BRIDGE_SCRIPT}"}
 
-        # Ensure the subprocess uses the local src/ for the package, not the installed one
-        env = os.environ.copy()
-        src_path = os.path.join(MCP_DIR, 'src')
-        if src_path not in env.get('PYTHONPATH', ''):
-            env['PYTHONPATH'] = f"{src_path}{os.pathsep}{env.get('PYTHONPATH', '')}"
-
         # Run the subprocess
         process = subprocess.Popen(
             [MCP_VENV_PYTHON, MCP_BRIDGE_SCRIPT, '--json-input'],
@@ -58,11 +115,12 @@ def run_bridge_command(command_payload):
             stdout=subprocess.PIPE,
             stderr=subprocess.PIPE,
             text=True,
+            encoding='utf-8',
             cwd=MCP_DIR, # Important to set CWD so imports work if needed
-            env=env
+            env=_bridge_env()
         )
         
-        stdout, stderr = process.communicate(input=json.dumps(command_payload))
+        stdout, stderr = process.communicate(input=json_codec.dumps(command_payload))
         
         if process.returncode != 0:
             logger.error(f"Bridge script failed with return code {process.returncode}")
@@ -70,8 +128,8 @@ def run_bridge_command(command_payload):
             return {"status": "error", "error": f"Bridge script execution failed: {stderr}"}
             
         try:
-            return json.loads(stdout)
-        except json.JSONDecodeError:
+            return json_codec.loads(stdout)
+        except json_codec.JSONDecodeError:
             logger.error("Failed to decode JSON output from bridge script")
             logger.error(f"Stdout: {stdout}")
             return {"status": "error", "error": "Invalid JSON output from bridge script", "raw_output": stdout}
@@ -122,98 +180,243 @@ def health_check():
             "error": str(e)
         }), 500
 
+ARTIFACT_TYPES = {
+    'mind_map', 'audio', 'video', 'report', 'flashcards', 'quiz', 'infographic', 'slide_deck', 'data_table',
+}
+
+# Background artifact jobs (see artifact_jobs.py)
+ARTIFACT_JOB_WORKERS = int(os.environ.get('ARTIFACT_JOB_WORKERS', '4'))
+# Per-type limits, e.g. "video=1,audio=2"; unlisted types share the worker pool
+ARTIFACT_JOB_CONCURRENCY = os.environ.get('ARTIFACT_JOB_CONCURRENCY', 'audio=2,video=1,slide_deck=1')
+ARTIFACT_JOBS_DB = os.environ.get(
+    'ARTIFACT_JOBS_DB', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'database', 'artifact_jobs.db')
+)
+
+_job_queue = None
+_job_queue_lock = threading.Lock()
+
+def get_job_queue():
+    """The shared artifact job queue, created (and resumed) on first use."""
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                from artifact_jobs import JobQueue, JobStore, parse_type_limits
+
+                os.makedirs(os.path.dirname(ARTIFACT_JOBS_DB), exist_ok=True)
+                queue = JobQueue(
+                    JobStore(ARTIFACT_JOBS_DB),
+                    run_artifact_job,
+                    workers=ARTIFACT_JOB_WORKERS,
+                    type_limits=parse_type_limits(ARTIFACT_JOB_CONCURRENCY),
+                )
+                queue.resume()
+                atexit.register(queue.close)
+                _job_queue = queue
+    return _job_queue
+
+def _job_response(job):
+    """Public view of a job record."""
+    view = {
+        "job_id": job['id'],
+        "job_status": job['status'],
+        "artifact_type": job['artifact_type'],
+        "notebook_id": job['notebook_id'],
+        "created_at": job['created_at'],
+        "started_at": job['started_at'],
+        "finished_at": job['finished_at'],
+    }
+    if job['result'] is not None:
+        view["result"] = job['result']
+    if job['error'] is not None:
+        view["error"] = job['error']
+    return view
+
+def run_artifact_job(job):
+    """Generates one artifact (runs on an artifact job worker)."""
+    from nlm_client import get_nlm_client
+
+    notebook_id = job['notebook_id']
+    artifact_type = job['artifact_type']
+    prompt = job['params'].get('prompt', '')
+    title = job['params'].get('title', 'Generated Artifact')
+
+    logger.info(f"Generating {artifact_type} for notebook {notebook_id}...")
+    client = get_nlm_client(profile="default")
+
+    # Get source IDs (required for most operations)
+    # For simplicity, we'll use ALL sources in the notebook
+    # In a future version, we could allow selecting specific sources
+    sources = client.get_notebook_sources_with_types(notebook_id)
+    source_ids = [s['id'] for s in sources if s.get('id')]
+
+    if not source_ids:
+        raise ValueError("Notebook has no sources to generate content from.")
+
+    result = None
+    final_url = f"https://notebooklm.google.com/notebook/{notebook_id}"
+
+    if artifact_type == 'mind_map':
+        # 2-step process for Mind Map
+        gen_res = client.generate_mind_map(source_ids)
+        if gen_res and gen_res.get('mind_map_json'):
+            result = client.save_mind_map(
+                notebook_id,
+                gen_res['mind_map_json'],
+                source_ids,
+                title=title
+            )
+        else:
+            raise Exception("Failed to generate mind map structure")
+
+    elif artifact_type == 'audio':
+        result = client.create_audio_overview(notebook_id, source_ids, focus_prompt=prompt)
+
+    elif artifact_type == 'video':
+        result = client.create_video_overview(notebook_id, source_ids, focus_prompt=prompt)
+
+    elif artifact_type == 'report':
+        # Map simplified types to specific report formats if needed, or just use default
+        result = client.create_report(notebook_id, source_ids, custom_prompt=prompt, report_format="Briefing Doc" if not prompt else "Create Your Own")
+
+    elif artifact_type == 'flashcards':
+        result = client.create_flashcards(notebook_id, source_ids)
+
+    elif artifact_type == 'quiz':
+        result = client.create_quiz(notebook_id, source_ids)
+
+    elif artifact_type == 'infographic':
+        result = client.create_infographic(notebook_id, source_ids, focus_prompt=prompt)
+
+    elif artifact_type == 'slide_deck':
+        result = client.create_slide_deck(notebook_id, source_ids, focus_prompt=prompt)
+
+    elif artifact_type == 'data_table':
+        result = client.create_data_table(notebook_id, source_ids, description=prompt or "Data Table")
+
+    if not result:
+        raise Exception("Generation function returned no result")
+
+    return {
+        "message": f"{artifact_type} generation started/completed.",
+        "url": final_url,
+        "details": result
+    }
+
 @mcp_bp.route('/generate_artifact', methods=['POST'])
 def generate_artifact():
-    """Generates an artifact using the direct Python client."""
+    """Queues an artifact generation job and returns 202 with its job ID.
+
+    Send an Idempotency-Key header (or "idempotency_key" field) to make
+    retries safe: the same key returns the existing job.
+    """
     data = request.get_json()
     if not data:
         return jsonify({"status": "error", "error": "No data provided"}), 400
-        
+
     notebook_id = data.get('notebook_id')
     artifact_type = data.get('artifact_type')
-    prompt = data.get('prompt', '')
-    title = data.get('title', 'Generated Artifact')
-    
+    params = {
+        "prompt": data.get('prompt', ''),
+        "title": data.get('title', 'Generated Artifact'),
+    }
+    idempotency_key = request.headers.get('Idempotency-Key') or data.get('idempotency_key')
+
     if not notebook_id or not artifact_type:
         return jsonify({"status": "error", "error": "Missing notebook_id or artifact_type"}), 400
+    if artifact_type not in ARTIFACT_TYPES:
+        return jsonify({"status": "error", "error": f"Unknown artifact type: {artifact_type}"}), 400
 
-    logger.info(f"Generating {artifact_type} for notebook {notebook_id}...")
+    from artifact_jobs import IdempotencyConflict
 
     try:
-        # Import the nlm CLI wrapper
-        from nlm_client import NLMClient, NLMClientError
-        
-        try:
-            client = NLMClient(profile="default")
-        except Exception as e:
-            return jsonify({"status": "error", "error": f"Failed to initialize NLM client: {e}"}), 500
-        
-        # Get source IDs (required for most operations)
-        # For simplicity, we'll use ALL sources in the notebook
-        # In a future version, we could allow selecting specific sources
-        sources = client.get_notebook_sources_with_types(notebook_id)
-        source_ids = [s['id'] for s in sources if s.get('id')]
-        
-        if not source_ids:
-             return jsonify({"status": "error", "error": "Notebook has no sources to generate content from."}), 400
+        job, created = get_job_queue().submit(artifact_type, notebook_id, params, idempotency_key)
+    except IdempotencyConflict as e:
+        return jsonify({"status": "error", "error": str(e)}), 409
+    except Exception as e:
+        logger.exception(f"Error queueing {artifact_type}")
+        return jsonify({"status": "error", "error": str(e)}), 500
 
-        result = None
-        final_url = f"https://notebooklm.google.com/notebook/{notebook_id}"
-        
-        if artifact_type == 'mind_map':
-            # 2-step process for Mind Map
-            gen_res = client.generate_mind_map(source_ids)
-            if gen_res and gen_res.get('mind_map_json'):
-                result = client.save_mind_map(
-                    notebook_id, 
-                    gen_res['mind_map_json'], 
-                    source_ids, 
-                    title=title
+    if created:
+        logger.info(f"Queued {artifact_type} job {job['id']} for notebook {notebook_id}")
+    status_url = url_for('mcp_bp.get_job', job_id=job['id'])
+    response = jsonify({"status": "accepted", "status_url": status_url, **_job_response(job)})
+    response.headers['Location'] = status_url
+    return response, 202
+
+@mcp_bp.route('/jobs/<job_id>', methods=['GET'])
+def get_job(job_id):
+    """Returns an artifact job's state, and its result or error once finished."""
+    job = get_job_queue().store.get(job_id)
+    if job is None:
+        return jsonify({"status": "error", "error": f"Unknown job: {job_id}"}), 404
+    return jsonify({"status": "success", **_job_response(job)})
+
+def _normalize_artifact(a):
+    """Studio status entry in the shape the frontend expects."""
+    # Map specific URL fields to generic 'url'
+    url = a.get('infographic_url') or a.get('video_url') or a.get('audio_url') or a.get('slide_deck_url')
+    return {
+        "id": a.get('artifact_id'),
+        "url": url,
+        "status": a.get('status'),
+        "title": a.get('title'),
+        "type": a.get('type'),
+        "created_at": a.get('created_at')
+    }
+
+def _fetch_studio_status(notebook_id):
+    from nlm_client import get_nlm_client
+    return [_normalize_artifact(a) for a in get_nlm_client(profile="default").poll_studio_status(notebook_id)]
+
+# Shared status pollers behind the SSE stream (see status_stream.py)
+STATUS_POLL_MIN_INTERVAL = float(os.environ.get('STATUS_POLL_MIN_INTERVAL', '5'))
+STATUS_POLL_MAX_INTERVAL = float(os.environ.get('STATUS_POLL_MAX_INTERVAL', '60'))
+# Comment frames keep proxies from closing idle streams and reveal disconnects
+STATUS_STREAM_KEEPALIVE = 15
+
+_status_hub = None
+_status_hub_lock = threading.Lock()
+
+def get_status_hub():
+    """The shared per-notebook status poller registry."""
+    global _status_hub
+    if _status_hub is None:
+        with _status_hub_lock:
+            if _status_hub is None:
+                from status_stream import StatusHub
+                _status_hub = StatusHub(
+                    _fetch_studio_status,
+                    min_interval=STATUS_POLL_MIN_INTERVAL,
+                    max_interval=STATUS_POLL_MAX_INTERVAL,
                 )
-            else:
-                raise Exception("Failed to generate mind map structure")
-                
-        elif artifact_type == 'audio':
-            result = client.create_audio_overview(notebook_id, source_ids, focus_prompt=prompt)
-            
-        elif artifact_type == 'video':
-            result = client.create_video_overview(notebook_id, source_ids, focus_prompt=prompt)
-            
-        elif artifact_type == 'report':
-            # Map simplified types to specific report formats if needed, or just use default
-            result = client.create_report(notebook_id, source_ids, custom_prompt=prompt, report_format="Briefing Doc" if not prompt else "Create Your Own")
-            
-        elif artifact_type == 'flashcards':
-            result = client.create_flashcards(notebook_id, source_ids)
-            
-        elif artifact_type == 'quiz':
-            result = client.create_quiz(notebook_id, source_ids)
-            
-        elif artifact_type == 'infographic':
-            result = client.create_infographic(notebook_id, source_ids, focus_prompt=prompt)
-            
-        elif artifact_type == 'slide_deck':
-            result = client.create_slide_deck(notebook_id, source_ids, focus_prompt=prompt)
-            
-        elif artifact_type == 'data_table':
-            result = client.create_data_table(notebook_id, source_ids, description=prompt or "Data Table")
-            
-        else:
-            return jsonify({"status": "error", "error": f"Unknown artifact type: {artifact_type}"}), 400
+    return _status_hub
 
-        if result:
-            return jsonify({
-                "status": "success",
-                "message": f"{artifact_type} generation started/completed.",
-                "url": final_url,
-                "details": result
-            })
-        else:
-             return jsonify({"status": "error", "error": "Generation function returned no result"}), 500
+@mcp_bp.route('/status/<notebook_id>/stream', methods=['GET'])
+def stream_status(notebook_id):
+    """Server-sent events with a notebook's artifact status.
 
-    except Exception as e:
-        logger.exception(f"Error generating {artifact_type}")
-        return jsonify({"status": "error", "error": str(e)}), 500
+    The first event is {"type": "snapshot", "artifacts": [...]}; later ones
+    are {"type": "diff", "added": [...], "changed": [...], "removed": [ids]}
+    or {"type": "error", "error": "..."}. All subscribers of a notebook share
+    one upstream poller.
+    """
+    hub = get_status_hub()
+    sub = hub.subscribe(notebook_id)
+
+    def generate():
+        try:
+            while True:
+                event = sub.get(timeout=STATUS_STREAM_KEEPALIVE)
+                yield sse_event(event) if event is not None else ": keepalive\n\n"
+        finally:
+            hub.unsubscribe(sub)
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
 
 @mcp_bp.route('/status/<notebook_id>', methods=['GET'])
 def get_status(notebook_id):
@@ -221,33 +424,18 @@ def get_status(notebook_id):
     logger.info(f"Polling status for notebook {notebook_id} via direct client...")
     
     try:
-        # Import the nlm CLI wrapper
-        from nlm_client import NLMClient, NLMClientError
+        # In-process engine, or the nlm CLI wrapper (NLM_ENGINE=cli)
+        from nlm_client import get_nlm_client, NLMClientError
         
         try:
-            client = NLMClient(profile="default")
+            client = get_nlm_client(profile="default")
         except Exception as e:
             return jsonify({"status": "error", "error": f"Failed to initialize NLM client: {e}"}), 500
         artifacts = client.poll_studio_status(notebook_id)
         
-        # Normalize artifacts
-        normalized = []
-        for a in artifacts:
-            # Map specific URL fields to generic 'url'
-            url = a.get('infographic_url') or a.get('video_url') or a.get('audio_url') or a.get('slide_deck_url')
-            
-            normalized.append({
-                "id": a.get('artifact_id'),
-                "url": url,
-                "status": a.get('status'),
-                "title": a.get('title'),
-                "type": a.get('type'),
-                "created_at": a.get('created_at')
-            })
-            
         return jsonify({
             "status": "success", 
-            "artifacts": normalized
+            "artifacts": [_normalize_artifact(a) for a in artifacts]
         })
         
     except Exception as e:
@@ -261,10 +449,10 @@ def update_cookies():
     
     try:
         # Check if nlm CLI is accessible
-        from nlm_client import NLMClient, NLMClientError
+        from nlm_client import get_nlm_client, NLMClientError
         
         try:
-            client = NLMClient(profile="default")
+            client = get_nlm_client(profile="default")
             # Try a simple command to verify auth
             client.list_notebooks()
             tokens = {"verified": True}
@@ -302,27 +490,156 @@ def update_cookies():
             "error": str(e)
         }), 500
 
+# On-disk artifact cache (see artifact_cache.py); ARTIFACT_CACHE_MAX_MB=0 disables it
+ARTIFACT_CACHE_DIR = os.environ.get(
+    'ARTIFACT_CACHE_DIR', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache', 'artifacts')
+)
+ARTIFACT_CACHE_MAX_MB = float(os.environ.get('ARTIFACT_CACHE_MAX_MB', '1024'))
+# Cached artifacts are served without asking upstream for this long, then revalidated
+ARTIFACT_CACHE_FRESH_SECONDS = float(os.environ.get('ARTIFACT_CACHE_FRESH_SECONDS', '300'))
+PROXY_CHUNK_SIZE = 64 * 1024
+
+_artifact_cache = None
+_artifact_cache_lock = threading.Lock()
+
+def get_artifact_cache():
+    """The shared artifact disk cache, or None if disabled."""
+    global _artifact_cache
+    if ARTIFACT_CACHE_MAX_MB <= 0:
+        return None
+    if _artifact_cache is None:
+        with _artifact_cache_lock:
+            if _artifact_cache is None:
+                from artifact_cache import ArtifactCache
+                _artifact_cache = ArtifactCache(ARTIFACT_CACHE_DIR, int(ARTIFACT_CACHE_MAX_MB * 1024 * 1024))
+    return _artifact_cache
+
+def _artifact_session(cookie_dict):
+    """requests.Session carrying the Google cookies artifact hosts need."""
+    # Use requests.Session for better handling of Google's complex cross-domain redirects
+    session = requests.Session()
+    session.max_redirects = 50
+    # Map the flat cookie dict into a domain-scoped cookie jar
+    # Include OSID and other critical cookies for cross-domain auth
+    critical_cookies = [
+        'SID', 'HSID', 'SSID', 'APISID', 'SAPISID', 
+        '__Secure-1PSID', '__Secure-3PSID', 'NID', 
+        '__Secure-1PSIDTS', '__Secure-3PSIDTS',
+        'OSID', '__Secure-OSID', 'LSID', '__Host-1PLSID', 
+        '__Host-3PLSID', '__Host-GAPS'
+    ]
+    for name, value in cookie_dict.items():
+        if name in critical_cookies or name.startswith('__Secure-'):
+            session.cookies.set(name, value, domain=".google.com")
+            session.cookies.set(name, value, domain=".googleusercontent.com")
+            # Also specifically for the naked host if needed
+            session.cookies.set(name, value, domain="lh3.googleusercontent.com")
+    
+    # Use 'Gold Standard' headers that Google expects for authenticated resource fetching
+    browser_headers = {
+        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36",
+        "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
+        "Accept-Language": "en-US,en;q=0.9",
+        "Sec-Ch-Ua": '"Not A(Brand";v="8", "Chromium";v="132", "Google Chrome";v="132"',
+        "Sec-Ch-Ua-Mobile": "?0",
+        "Sec-Ch-Ua-Platform": '"Windows"',
+        "Sec-Fetch-Dest": "image",
+        "Sec-Fetch-Mode": "no-cors",
+        "Sec-Fetch-Site": "cross-site",
+        "Referer": "https://notebooklm.google.com/",
+        "X-Client-Data": "CIa2yQEIorbJAQipncoBCI79ygEIlKHLAQ==" # Generic valid client data
+    }
+    session.headers.update(browser_headers)
+    return session
+
+def _is_login_page(resp):
+    return "accounts.google.com" in str(resp.url) or "ServiceLogin" in str(resp.url)
+
+def _open_artifact(session, url, headers):
+    """Start a streamed GET, refreshing the session once if Google asks to log in."""
+    resp = session.get(url, headers=headers, allow_redirects=True, timeout=30.0, stream=True)
+    logger.info(f"Proxy request answered. Status: {resp.status_code}, Final URL: {resp.url}")
+
+    # Check for Google Login redirect (stale session or auth required for this specific subdomain)
+    if _is_login_page(resp):
+         resp.close()
+         logger.warning("Session expired or domain mismatch. Landed on login page. Triggering auto-refresh...")
+         try:
+             # Shared with the MCP server/bridge: one headless refresh at a time
+             # across processes, everyone else waits and reuses its tokens
+             from notebooklm_mcp.auth import reauthenticate
+             new_tokens = reauthenticate(python=MCP_VENV_PYTHON, timeout=60)
+
+             # Reload new cookies
+             for k, v in new_tokens.cookies.items():
+                 session.cookies.set(k, v, domain=".google.com")
+                 session.cookies.set(k, v, domain=".googleusercontent.com")
+                 session.cookies.set(k, v, domain="lh3.googleusercontent.com")
+             
+             # Retry once
+             resp = session.get(url, headers=headers, allow_redirects=True, timeout=30.0, stream=True)
+             logger.info(f"Retry answered. Status: {resp.status_code}, Final URL: {resp.url}")
+         except Exception as e:
+             logger.error(f"Auto-refresh or retry failed: {e}")
+    return resp
+
+def _artifact_filename(content_type, stem):
+    """Download name with an extension matching the content type."""
+    ext = mimetypes.guess_extension(content_type.split(';')[0].strip()) or '.bin'
+    return f"artifact_{stem}{ext}"
+
+def _send_cached_artifact(cache, key, meta):
+    """Serve a cached body; send_file handles Range and conditional requests.
+
+    Returns None if the body was evicted after its metadata was read.
+    """
+    try:
+        response = send_file(
+            cache.body_path(key),
+            mimetype=meta['content_type'],
+            conditional=True,
+            etag=(meta.get('etag') or '').removeprefix('W/').strip('"') or f"{key[:16]}-{meta['size']}",
+            download_name=_artifact_filename(meta['content_type'], key[:12]),
+            max_age=ARTIFACT_CACHE_FRESH_SECONDS,
+        )
+    except FileNotFoundError:
+        return None
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    response.headers['X-Artifact-Cache'] = 'HIT'
+    return response
+
 @mcp_bp.route('/proxy_artifact', methods=['GET'])
 def proxy_artifact():
-    """Proxies an external artifact URL to bypass CORS."""
+    """Proxies an external artifact URL to bypass CORS.
+
+    Bodies are streamed to the client as they arrive and cached on disk;
+    cached artifacts support Range requests (media seeking).
+    """
     url = request.args.get('url')
     if not url:
         return jsonify({"status": "error", "error": "Missing url parameter"}), 400
         
     logger.info(f"Proxying artifact URL: {url}")
 
-    # Configuration for auth file
-    auth_dir = os.path.join(os.path.expanduser("~"), ".notebooklm-mcp")
-    auth_path = os.path.join(auth_dir, "auth.json")
-    
+    cache = get_artifact_cache()
+    key = cache.key_for(url) if cache else None
+    meta = cache.get(key) if cache else None
+    if meta and time.time() - meta.get('validated_at', 0) < ARTIFACT_CACHE_FRESH_SECONDS:
+        response = _send_cached_artifact(cache, key, meta)
+        if response is not None:
+            return response
+        meta = None  # evicted meanwhile: a miss
+
+    # Shared auth cache (~/.notebooklm-mcp/auth.json). Kept in memory and only
+    # re-read when another process rotates the cookies.
     cookie_dict = {}
-    if os.path.exists(auth_path):
-        try:
-            with open(auth_path, 'r') as f:
-                auth_data = json.load(f)
-                cookie_dict = auth_data.get('cookies', {})
-        except Exception as e:
-            logger.error(f"Failed to load auth cookies: {e}")
+    try:
+        from notebooklm_mcp.auth import load_cached_tokens
+        tokens = load_cached_tokens()
+        if tokens:
+            cookie_dict = tokens.cookies
+    except Exception as e:
+        logger.error(f"Failed to load auth cookies: {e}")
 
     try:
         # Add authuser=0 if not present to force primary session
@@ -333,75 +650,34 @@ def proxy_artifact():
             new_query = urlencode(params, doseq=True)
             url = urlunparse(parsed._replace(query=new_query))
 
-        # Use requests.Session for better handling of Google's complex cross-domain redirects
-        session = requests.Session()
-        session.max_redirects = 50
-        # Map the flat cookie dict into a domain-scoped cookie jar
-        # Include OSID and other critical cookies for cross-domain auth
-        critical_cookies = [
-            'SID', 'HSID', 'SSID', 'APISID', 'SAPISID', 
-            '__Secure-1PSID', '__Secure-3PSID', 'NID', 
-            '__Secure-1PSIDTS', '__Secure-3PSIDTS',
-            'OSID', '__Secure-OSID', 'LSID', '__Host-1PLSID', 
-            '__Host-3PLSID', '__Host-GAPS'
-        ]
-        for name, value in cookie_dict.items():
-            if name in critical_cookies or name.startswith('__Secure-'):
-                session.cookies.set(name, value, domain=".google.com")
-                session.cookies.set(name, value, domain=".googleusercontent.com")
-                # Also specifically for the naked host if needed
-                session.cookies.set(name, value, domain="lh3.googleusercontent.com")
-        
-        # Use 'Gold Standard' headers that Google expects for authenticated resource fetching
-        browser_headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/132.0.0.0 Safari/537.36",
-            "Accept": "image/avif,image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-            "Sec-Ch-Ua": '"Not A(Brand";v="8", "Chromium";v="132", "Google Chrome";v="132"',
-            "Sec-Ch-Ua-Mobile": "?0",
-            "Sec-Ch-Ua-Platform": '"Windows"',
-            "Sec-Fetch-Dest": "image",
-            "Sec-Fetch-Mode": "no-cors",
-            "Sec-Fetch-Site": "cross-site",
-            "Referer": "https://notebooklm.google.com/",
-            "X-Client-Data": "CIa2yQEIorbJAQipncoBCI79ygEIlKHLAQ==" # Generic valid client data
-        }
-        session.headers.update(browser_headers)
-        
-        # Execute the request
-        resp = session.get(url, allow_redirects=True, timeout=30.0)
-        logger.info(f"Proxy request finished. Status: {resp.status_code}, Final URL: {resp.url}")
-
-        # Check for Google Login redirect (stale session or auth required for this specific subdomain)
-        if "accounts.google.com" in str(resp.url) or "ServiceLogin" in str(resp.url):
-             logger.warning("Session expired or domain mismatch. Landed on login page. Triggering auto-refresh...")
-             try:
-                 # Ensure the subprocess uses the local src/ for the package
-                 refresh_env = os.environ.copy()
-                 src_path = os.path.join(MCP_DIR, 'src')
-                 if src_path not in refresh_env.get('PYTHONPATH', ''):
-                     refresh_env['PYTHONPATH'] = f"{src_path}{os.pathsep}{refresh_env.get('PYTHONPATH', '')}"
-
-                 # Run headless refresh to get fresh tokens
-                 subprocess.run([MCP_VENV_PYTHON, "-m", "notebooklm_mcp.auth_cli", "--headless"], env=refresh_env, capture_output=True, timeout=60, check=True)
-                 
-                 # Reload new cookies
-                 with open(auth_path, 'r') as f:
-                     new_data = json.load(f)
-                     new_cookies = new_data.get('cookies', {})
-                     for k, v in new_cookies.items():
-                         session.cookies.set(k, v, domain=".google.com")
-                         session.cookies.set(k, v, domain=".googleusercontent.com")
-                         session.cookies.set(k, v, domain="lh3.googleusercontent.com")
-                 
-                 # Retry once
-                 resp = session.get(url, allow_redirects=True, timeout=30.0)
-                 logger.info(f"Retry finished. Status: {resp.status_code}, Final URL: {resp.url}")
-             except Exception as e:
-                 logger.error(f"Auto-refresh or retry failed: {e}")
+        upstream_headers = {}
+        range_header = request.headers.get('Range')
+        if meta:
+            # Stale cache entry: ask upstream whether it changed
+            if meta.get('etag'):
+                upstream_headers['If-None-Match'] = meta['etag']
+            if meta.get('last_modified'):
+                upstream_headers['If-Modified-Since'] = meta['last_modified']
+        elif range_header and not re.fullmatch(r'\s*bytes=0-\s*', range_header):
+            # A seek into something not cached yet: relay the range uncached.
+            # "bytes=0-" (how players start) fetches the whole body instead.
+            upstream_headers['Range'] = range_header
+
+        session = _artifact_session(cookie_dict)
+        resp = _open_artifact(session, url, upstream_headers)
+
+        if meta and resp.status_code == 304:
+            resp.close()
+            response = _send_cached_artifact(cache, key, meta)
+            if response is not None:
+                cache.touch_validated(key, meta)
+                return response
+            # Evicted while revalidating: fetch the whole body again
+            resp = _open_artifact(session, url, {})
 
         # If we're STILL on a login page or support page, it's a hard fail
         if "accounts.google.com" in str(resp.url) or "support.google.com" in str(resp.url):
+            resp.close()
             return jsonify({
                 "status": "error", 
                 "error": "Authentication failed. Redirected to Google login/security page.",
@@ -409,11 +685,14 @@ def proxy_artifact():
                 "final_url": str(resp.url)
             }), 401
 
+        if resp.status_code >= 400:
+            resp.close()
         resp.raise_for_status()
         
         # Check for media content type
-        content_type = resp.headers.get('Content-Type', 'image/png')
+        content_type = resp.headers.get('Content-Type', 'application/octet-stream')
         if 'text/html' in content_type:
+            resp.close()
             return jsonify({
                 "status": "error", 
                 "error": f"Expected media, got HTML ({content_type}). Auth likely failed.",
@@ -423,11 +702,44 @@ def proxy_artifact():
         response_headers = {
             'Content-Type': content_type,
             'Access-Control-Allow-Origin': '*',
-            'Content-Disposition': f'inline; filename="artifact_{int(time.time())}.png"'
+            'Content-Disposition': f'inline; filename="{_artifact_filename(content_type, key[:12] if key else int(time.time()))}"',
+            'X-Artifact-Cache': 'MISS',
         }
-        
+        # Content-Length only holds if requests won't decompress the body
+        passthrough = ['Content-Range', 'Accept-Ranges', 'ETag', 'Last-Modified']
+        if not resp.headers.get('Content-Encoding'):
+            passthrough.append('Content-Length')
+        for name in passthrough:
+            if resp.headers.get(name):
+                response_headers[name] = resp.headers[name]
+
+        writer = None
+        if cache and resp.status_code == 200:
+            writer = cache.writer(key, {
+                "url": url,
+                "content_type": content_type,
+                "etag": resp.headers.get('ETag'),
+                "last_modified": resp.headers.get('Last-Modified'),
+            })
+
+        def generate():
+            nonlocal writer
+            try:
+                for chunk in resp.iter_content(PROXY_CHUNK_SIZE):
+                    if writer:
+                        writer.write(chunk)
+                    yield chunk
+                if writer:
+                    writer.commit()
+                    writer = None
+            finally:
+                # Client went away or upstream failed mid-body: keep nothing partial
+                if writer:
+                    writer.abort()
+                resp.close()
+
         return Response(
-            resp.content,
+            stream_with_context(generate()),
             status=resp.status_code,
             headers=response_headers
         )
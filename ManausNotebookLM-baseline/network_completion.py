@@ -0,0 +1,99 @@
+"""
+Network-level completion detection for NotebookLM answers.
+
+The streaming loop used to decide an answer was finished only after
+SILENCE_TIMEOUT seconds without a text change, so every query ended with
+that much dead time. NotebookLM streams each answer over one
+GenerateFreeFormStreamed request; StreamCompletion watches Chrome's
+performance log (CDP Network.* events, enabled with goog:loggingPrefs when
+the session is created) and reports the moment that response has finished
+loading.
+
+The performance log is a buffer drained by each get_log call, so start()
+discards whatever earlier queries left in it. If the session doesn't have
+the log enabled, start() returns False and the caller keeps relying on
+silence detection. The same happens if the answer request fails: a failed
+load says nothing about whether the answer on the page is complete, so
+`failed` is set and poll() stops reporting completion.
+"""
+
+import json
+import logging
+import time
+from typing import Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# Substring of the chat RPC's URL
+DEFAULT_RPC_PATTERN = "GenerateFreeFormStreamed"
+
+
+class StreamCompletion:
+    """Tracks the answer RPC(s) started after start() until they finish."""
+
+    def __init__(self, driver, rpc_pattern: str = DEFAULT_RPC_PATTERN):
+        self.driver = driver
+        self.rpc_pattern = rpc_pattern
+        self.enabled = False
+        self.done_at: Optional[float] = None
+        self.failed = False
+        self._pending: Set[str] = set()
+        self._seen = 0
+
+    def start(self) -> bool:
+        """Discard earlier events; call just before submitting the query."""
+        try:
+            self.driver.get_log("performance")
+            self.enabled = True
+        except Exception as e:
+            logger.info(f"Performance log unavailable, completion falls back to silence detection: {e}")
+            self.enabled = False
+        return self.enabled
+
+    @property
+    def done(self) -> bool:
+        return self.done_at is not None
+
+    def poll(self) -> bool:
+        """Read new network events; True once every answer RPC seen has finished.
+
+        Always False after an answer RPC failed (see `failed`).
+        """
+        if not self.enabled or self.done:
+            return self.done
+        try:
+            entries = self.driver.get_log("performance")
+        except Exception as e:
+            logger.warning(f"Reading the performance log failed, falling back to silence detection: {e}")
+            self.enabled = False
+            return False
+        for entry in entries:
+            raw = entry.get("message", "")
+            # Cheap filter before parsing: only our RPC and load-end events matter
+            if self.rpc_pattern not in raw and "Network.loading" not in raw:
+                continue
+            try:
+                message = json.loads(raw)["message"]
+            except (ValueError, KeyError):
+                continue
+            method = message.get("method")
+            params = message.get("params", {})
+            if method == "Network.requestWillBeSent":
+                if self.rpc_pattern in params.get("request", {}).get("url", ""):
+                    self._pending.add(params.get("requestId"))
+                    self._seen += 1
+            elif method in ("Network.loadingFinished", "Network.loadingFailed"):
+                request_id = params.get("requestId")
+                if request_id in self._pending:
+                    self._pending.discard(request_id)
+                    if method == "Network.loadingFailed":
+                        self.failed = True
+                        logger.warning(f"Answer request failed ({params.get('errorText')}), "
+                                       "completion falls back to silence detection")
+        if self.failed:
+            self.enabled = False
+            return False
+        if self._seen and not self._pending:
+            self.done_at = time.time()
+            logger.info(f"🎯 Answer request finished ({self._seen} {self.rpc_pattern} request(s))")
+        return self.done
@@ -1,17 +1,23 @@
 """
 NLM CLI Client Wrapper
 
-Provides a Python interface to the nlm (notebooklm-cli) command-line tool.
-This replaces direct imports of the notebooklm_mcp library.
+Provides a Python interface to the nlm (notebooklm-cli) command-line tool,
+and InProcessNLMClient, the same interface backed by the notebooklm_mcp
+library in-process. Use get_nlm_client() to pick one.
 """
 
+import os
 import subprocess
 import json
 import logging
+import threading
 from typing import Optional, Dict, List, Any
 
 logger = logging.getLogger(__name__)
 
+# Full path to the nlm executable
+NLM_PATH = os.environ.get('NLM_PATH', '/home/appuser/.local/bin/nlm')
+
 class NLMClientError(Exception):
     """Raised when nlm CLI commands fail"""
     pass
@@ -30,9 +36,7 @@ def run_nlm_command(args: List[str], profile: str = "default") -> Dict[str, Any]
     Raises:
         NLMClientError: If command fails
     """
-    # Use full path to nlm executable
-    nlm_path = '/home/appuser/.local/bin/nlm'
-    cmd = [nlm_path] + args + ['--profile', profile]
+    cmd = [NLM_PATH] + args + ['--profile', profile]
     
     try:
         logger.debug(f"Running: {' '.join(cmd)}")
@@ -262,3 +266,224 @@ class NLMClient:
         # Extract artifacts from notebook details
         # The structure may vary, adjust as needed based on actual output
         return result.get('artifacts', [])
+
+
+# Audio option names accepted by NLMClient, as NotebookLMClient codes
+AUDIO_FORMAT_CODES = {"deep_dive": 1, "brief": 2, "critique": 3, "debate": 4}
+AUDIO_LENGTH_CODES = {"short": 1, "default": 2, "long": 3}
+
+# NotebookLM errors that mean "the in-process engine can't work here", not
+# "this request failed" - reads fall back to the CLI on these
+_ENGINE_UNAVAILABLE = (ImportError, ValueError, OSError)
+
+_engine_pool = None
+_engine_lock = threading.Lock()
+
+
+def _get_engine_pool():
+    """Shared notebooklm_mcp client pool, built once per process and kept warm."""
+    global _engine_pool
+    if _engine_pool is None:
+        with _engine_lock:
+            if _engine_pool is None:
+                from notebooklm_mcp.pool import pool_from_env
+                _engine_pool = pool_from_env()
+    return _engine_pool
+
+
+class InProcessNLMClient:
+    """
+    NLMClient-compatible engine that calls notebooklm_mcp in-process.
+
+    All instances share one warm NotebookLMClient per auth profile (tokens
+    loaded and CSRF token fetched once, HTTP keep-alive reused), so a call
+    costs one batchexecute request instead of a CLI start-up plus auth load.
+    Auth comes from the notebooklm_mcp token cache (~/.notebooklm-mcp), the
+    same one used by mcp_bridge.py and the artifact proxy.
+
+    Reads fall back to the `nlm` CLI if the engine can't be used (missing
+    tokens, import errors); creates don't, so nothing is created twice.
+    """
+
+    def __init__(self, profile: str = "default"):
+        self.profile = profile
+        self._cli = NLMClient(profile)
+
+    def _client(self, notebook_id: Optional[str] = None, write: bool = False):
+        pool = _get_engine_pool()
+        if self.profile in pool.profiles:
+            return pool.get_member(self.profile)
+        return pool.get(notebook_id, write=write)
+
+    def _read(self, name: str, call, *args):
+        try:
+            return call()
+        except _ENGINE_UNAVAILABLE as e:
+            if not os.path.exists(NLM_PATH):
+                raise NLMClientError(f"{name} failed: {e}")
+            logger.warning(f"In-process {name} failed ({e}), falling back to nlm CLI")
+            return getattr(self._cli, name)(*args)
+
+    def _write(self, name: str, call):
+        try:
+            return call()
+        except Exception as e:
+            raise NLMClientError(f"{name} failed: {e}")
+
+    def _all_source_ids(self, notebook_id: str, source_ids: Optional[List[str]]) -> List[str]:
+        if source_ids:
+            return source_ids
+        return [s["id"] for s in self.get_notebook_sources_with_types(notebook_id) if s.get("id")]
+
+    def list_notebooks(self) -> List[Dict[str, Any]]:
+        def call():
+            return [
+                {
+                    "id": nb.id,
+                    "title": nb.title,
+                    "source_count": nb.source_count,
+                    "url": nb.url,
+                    "ownership": nb.ownership,
+                    "is_shared": nb.is_shared,
+                    "created_at": nb.created_at,
+                    "modified_at": nb.modified_at,
+                }
+                for nb in self._client().list_notebooks(fields={"created_at", "modified_at"})
+            ]
+        return self._read("list_notebooks", call)
+
+    def get_notebook_sources_with_types(self, notebook_id: str) -> List[Dict[str, Any]]:
+        return self._read(
+            "get_notebook_sources_with_types",
+            lambda: self._client(notebook_id).get_notebook_sources_with_types(notebook_id),
+            notebook_id,
+        )
+
+    def poll_studio_status(self, notebook_id: str) -> List[Dict[str, Any]]:
+        return self._read(
+            "poll_studio_status",
+            lambda: self._client(notebook_id).poll_studio_status(notebook_id),
+            notebook_id,
+        )
+
+    def create_audio_overview(
+        self,
+        notebook_id: str,
+        source_ids: Optional[List[str]] = None,
+        focus_prompt: Optional[str] = None,
+        format: str = "deep_dive",
+        length: str = "default",
+        language: str = "en"
+    ) -> Dict[str, Any]:
+        """Create an audio overview (podcast)"""
+        return self._write("create_audio_overview", lambda: self._client(notebook_id, write=True).create_audio_overview(
+            notebook_id,
+            self._all_source_ids(notebook_id, source_ids),
+            format_code=AUDIO_FORMAT_CODES.get(format, 1),
+            length_code=AUDIO_LENGTH_CODES.get(length, 2),
+            language=language,
+            focus_prompt=focus_prompt or "",
+        ))
+
+    def create_video_overview(
+        self,
+        notebook_id: str,
+        source_ids: Optional[List[str]] = None,
+        focus_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a video overview"""
+        return self._write("create_video_overview", lambda: self._client(notebook_id, write=True).create_video_overview(
+            notebook_id, self._all_source_ids(notebook_id, source_ids), focus_prompt=focus_prompt or "",
+        ))
+
+    def create_infographic(
+        self,
+        notebook_id: str,
+        source_ids: Optional[List[str]] = None,
+        focus_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create an infographic"""
+        return self._write("create_infographic", lambda: self._client(notebook_id, write=True).create_infographic(
+            notebook_id, self._all_source_ids(notebook_id, source_ids), focus_prompt=focus_prompt or "",
+        ))
+
+    def create_slide_deck(
+        self,
+        notebook_id: str,
+        source_ids: Optional[List[str]] = None,
+        focus_prompt: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a slide deck"""
+        return self._write("create_slide_deck", lambda: self._client(notebook_id, write=True).create_slide_deck(
+            notebook_id, self._all_source_ids(notebook_id, source_ids), focus_prompt=focus_prompt or "",
+        ))
+
+    def generate_mind_map(self, source_ids: List[str]) -> Dict[str, Any]:
+        """Generate mind map structure (not saved yet)"""
+        return self._write("generate_mind_map", lambda: self._client().generate_mind_map(source_ids))
+
+    def save_mind_map(
+        self,
+        notebook_id: str,
+        mind_map_json: Any,
+        source_ids: List[str],
+        title: str = "Mind Map"
+    ) -> Dict[str, Any]:
+        """Save a generated mind map to the notebook"""
+        return self._write("save_mind_map", lambda: self._client(notebook_id, write=True).save_mind_map(
+            notebook_id, mind_map_json, source_ids, title=title,
+        ))
+
+    def create_report(
+        self,
+        notebook_id: str,
+        source_ids: Optional[List[str]] = None,
+        custom_prompt: Optional[str] = None,
+        report_format: str = "Briefing Doc"
+    ) -> Dict[str, Any]:
+        """Create a report"""
+        return self._write("create_report", lambda: self._client(notebook_id, write=True).create_report(
+            notebook_id,
+            self._all_source_ids(notebook_id, source_ids),
+            report_format=report_format,
+            custom_prompt=custom_prompt or "",
+        ))
+
+    def create_quiz(self, notebook_id: str, source_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Create a quiz"""
+        return self._write("create_quiz", lambda: self._client(notebook_id, write=True).create_quiz(
+            notebook_id, self._all_source_ids(notebook_id, source_ids),
+        ))
+
+    def create_flashcards(self, notebook_id: str, source_ids: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Create flashcards"""
+        return self._write("create_flashcards", lambda: self._client(notebook_id, write=True).create_flashcards(
+            notebook_id, self._all_source_ids(notebook_id, source_ids),
+        ))
+
+    def create_data_table(
+        self,
+        notebook_id: str,
+        source_ids: Optional[List[str]] = None,
+        description: str = "Data Table"
+    ) -> Dict[str, Any]:
+        """Create a data table"""
+        return self._write("create_data_table", lambda: self._client(notebook_id, write=True).create_data_table(
+            notebook_id, self._all_source_ids(notebook_id, source_ids), description=description,
+        ))
+
+
+def get_nlm_client(profile: str = "default"):
+    """
+    The NLM client to use: the in-process engine unless NLM_ENGINE=cli.
+
+    Falls back to the CLI wrapper when notebooklm_mcp can't be imported.
+    """
+    if os.environ.get("NLM_ENGINE", "inprocess") == "cli":
+        return NLMClient(profile)
+    try:
+        import notebooklm_mcp.pool  # noqa: F401
+    except ImportError as e:
+        logger.warning(f"notebooklm_mcp not importable ({e}), using nlm CLI")
+        return NLMClient(profile)
+    return InProcessNLMClient(profile)
@@ -0,0 +1,120 @@
+"""
+Warm notebook tabs inside one browser session.
+
+Every query used to navigate the browser to its notebook and wait seconds for
+the page to load, even when the previous query had asked the same notebook.
+NotebookTabs keeps an LRU of open tabs keyed by notebook URL, so a repeat
+query just switches to the tab that is already loaded and types.
+
+The number of tabs per session is capped (least recently used closed first)
+and tabs idle for longer than `idle_seconds` are closed. The window in use is
+never closed, so the WebDriver session always keeps one.
+"""
+
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def tab_key(url: str) -> str:
+    """Notebook URLs that differ only by fragment or trailing slash share a tab."""
+    return url.split('#', 1)[0].rstrip('/')
+
+
+class NotebookTabs:
+    """LRU of {notebook URL: window handle} for one WebDriver session."""
+
+    def __init__(self, max_tabs: int = 4, idle_seconds: float = 900):
+        self.max_tabs = max(1, max_tabs)
+        self.idle_seconds = idle_seconds
+        self._tabs: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()  # oldest first
+
+    def __len__(self) -> int:
+        return len(self._tabs)
+
+    def open(self, driver: Any, url: str) -> bool:
+        """Switch the driver to the tab for url, opening one if needed.
+
+        Returns True if the tab was already open (the caller can skip
+        navigation), False for a fresh tab that still needs driver.get(url).
+        """
+        key = tab_key(url)
+        entry = self._tabs.pop(key, None)
+        warm = False
+        if entry is not None:
+            try:
+                driver.switch_to.window(entry[0])
+                warm = True
+            except Exception as e:
+                logger.info(f"Warm tab for {key} is gone ({e}); opening a new one")
+        if not warm:
+            handles = driver.window_handles
+            if not self._tabs and len(handles) == 1:
+                # The session's first window becomes this notebook's tab
+                driver.switch_to.window(handles[0])
+            else:
+                driver.switch_to.new_window('tab')
+        self._tabs[key] = (driver.current_window_handle, time.time())
+        self._trim(driver, keep=key)
+        return warm
+
+    def forget(self, driver: Any, url: str) -> None:
+        """Stop reusing a tab (e.g. after a query failed in it) and close it.
+
+        The session's last window is kept; the next open() navigates it again.
+        """
+        entry = self._tabs.pop(tab_key(url), None)
+        if entry is None:
+            return
+        try:
+            handles = driver.window_handles
+            if len(handles) > 1 and entry[0] in handles:
+                driver.switch_to.window(entry[0])
+                driver.close()
+                driver.switch_to.window(next(h for h in handles if h != entry[0]))
+            logger.info(f"Dropped notebook tab {tab_key(url)}")
+        except Exception as e:
+            logger.debug(f"Could not close tab {tab_key(url)}: {e}")
+
+    def evict_idle(self, driver: Any) -> int:
+        """Close tabs idle past idle_seconds, keeping the current one."""
+        try:
+            current = driver.current_window_handle
+        except Exception:
+            return 0
+        keep = next((k for k, (handle, _) in self._tabs.items() if handle == current), None)
+        return self._trim(driver, keep=keep)
+
+    def _trim(self, driver: Any, keep: Any) -> int:
+        now = time.time()
+        doomed = [
+            k for k, (_, last_used) in self._tabs.items()
+            if k != keep and (self.idle_seconds and now - last_used > self.idle_seconds)
+        ]
+        overflow = len(self._tabs) - len(doomed) - self.max_tabs
+        for k in self._tabs:
+            if overflow <= 0:
+                break
+            if k != keep and k not in doomed:
+                doomed.append(k)
+                overflow -= 1
+        if not doomed:
+            return 0
+        current = driver.current_window_handle
+        for k in doomed:
+            handle, _ = self._tabs.pop(k)
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+                logger.info(f"Closed notebook tab {k}")
+            except Exception as e:
+                logger.debug(f"Could not close tab {k}: {e}")
+        driver.switch_to.window(current)
+        return len(doomed)
+
+    def stats(self) -> dict:
+        now = time.time()
+        return {k: {"idle_seconds": round(now - last_used)} for k, (_, last_used) in self._tabs.items()}
@@ -2,7 +2,6 @@ import os
 import time
 import logging
 import threading
-import json
 from typing import Optional
 
 from flask import Blueprint, jsonify, request, Response, stream_with_context
@@ -11,17 +10,55 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, InvalidSessionIdException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException, InvalidSessionIdException, JavascriptException
 from selenium import webdriver
+from selenium.webdriver.chromium.remote_connection import ChromiumRemoteConnection
 import urllib3
 
+from browser_pool import BrowserPool, BrowserPoolTimeout
+from dom_probe import CLICKABLE, PRESENCE, VISIBLE, probe_selectors
+from notebook_tabs import NotebookTabs
+from query_scheduler import QueryScheduler, QueueFull
+from network_completion import DEFAULT_RPC_PATTERN, StreamCompletion
+from response_watcher import ResponseWatcher
+from thinking_phrases import ThinkingPhraseStripper
+
+from json_codec import sse_event
+
 notebooklm_bp = Blueprint('notebooklm', __name__)
 logger = logging.getLogger(__name__)
 
-# --- Global State Management for Selenium ---
-# A single, shared browser instance and a lock to ensure thread safety.
-browser_instance: Optional[WebDriver] = None
-browser_lock = threading.Lock()
+# --- Browser Pool (see browser_pool.py) ---
+# Warm WebDriver sessions on the Selenium hub; queries run in parallel up to
+# the pool size. The Selenium node must allow as many sessions
+# (SE_NODE_MAX_SESSIONS).
+BROWSER_POOL_SIZE = int(os.environ.get('BROWSER_POOL_SIZE', '1'))
+# Recycle a session after this many queries (Chrome memory creep)
+BROWSER_MAX_USES = int(os.environ.get('BROWSER_MAX_USES', '50'))
+# How long a query waits for a free session before giving up
+BROWSER_CHECKOUT_TIMEOUT = float(os.environ.get('BROWSER_CHECKOUT_TIMEOUT', '300'))
+# Chrome profile of slot 0 (the VNC-logged-in one, inside the Selenium
+# container). Chrome can't share a profile between sessions, so slot N uses
+# <dir>/pool-N, with Google cookies seeded from the shared auth cache.
+BROWSER_PROFILE_DIR = os.environ.get('BROWSER_PROFILE_DIR', '/data')
+
+# Warm notebook tabs kept per session (see notebook_tabs.py)
+NOTEBOOK_TABS_MAX = int(os.environ.get('NOTEBOOK_TABS_MAX', '4'))
+NOTEBOOK_TAB_IDLE_SECONDS = float(os.environ.get('NOTEBOOK_TAB_IDLE_SECONDS', '900'))
+NOTEBOOK_TAB_SWEEP_INTERVAL = 60
+
+# Query admission (see query_scheduler.py): queries beyond the pool size wait
+# in a bounded round-robin queue, one FIFO per client address; beyond that
+# they get a 429. Behind a reverse proxy the address is only the client's if
+# TRUSTED_PROXY_HOPS is set (main.py); otherwise every query shares the
+# proxy's FIFO and QUERY_QUEUE_MAX_PER_USER becomes a global cap
+QUERY_QUEUE_MAX_DEPTH = int(os.environ.get('QUERY_QUEUE_MAX_DEPTH', '20'))
+QUERY_QUEUE_MAX_PER_USER = int(os.environ.get('QUERY_QUEUE_MAX_PER_USER', '3'))
+# Seconds between 'queued' SSE events while waiting
+QUERY_QUEUE_UPDATE_INTERVAL = float(os.environ.get('QUERY_QUEUE_UPDATE_INTERVAL', '5'))
+
+_browser_pool: Optional[BrowserPool] = None
+_browser_pool_lock = threading.Lock()
 
 # --- Constants for Selenium Selectors ---
 CHAT_INPUT_SELECTORS = [
@@ -40,6 +77,14 @@ SUBMIT_BUTTON_SELECTORS = [
 ]
 
 RESPONSE_CONTENT_SELECTOR = (By.CSS_SELECTOR, '.message-content')
+# Longest a response watcher drain waits for new text (see response_watcher.py)
+RESPONSE_DRAIN_WAIT = float(os.environ.get('RESPONSE_DRAIN_WAIT', '1.0'))
+# End the stream when the answer RPC finishes (see network_completion.py)
+# instead of waiting out the silence timeout
+NETWORK_COMPLETION = os.environ.get('NETWORK_COMPLETION', 'true').lower() == 'true'
+COMPLETION_RPC_PATTERN = os.environ.get('COMPLETION_RPC_PATTERN', DEFAULT_RPC_PATTERN)
+# After the RPC finishes, how long the text must stay unchanged (page catching up)
+COMPLETION_SETTLE_SECONDS = float(os.environ.get('COMPLETION_SETTLE_SECONDS', '0.5'))
 
 # Suggestion chip selectors - these appear when response is complete
 SUGGESTION_CHIP_SELECTORS = [
@@ -64,67 +109,29 @@ NOTEBOOKLM_LOAD_INDICATORS = [
     (By.XPATH, "//*[contains(text(), 'New notebook')]") # "New notebook" button
 ]
 
-THINKING_PHRASES = [
-    "Thinking",
-    "Reading documents",
-    "Gathering facts",
-    "Parsing the data",
-    "Sifting through pages",
-    "Working on it",
-    "Analyzing",
-    "Checking sources",
-    "Gathering info",
-    "Just a sec",
-    "Assessing relevance",
-    "Searching your docs",
-    "Refining the answer",
-    "Scanning the text",
-    "Scanning your sources",
-    "Finding relevant info",
-    "Finding key words",
-    "Finding connections",
-    "Opening your notes",
-    "Reviewing the content",
-    "Exploring your material",
-    "Checking the scope",
-    "Checking your uploads",
-    "Examining the specifics",
-    "Checking the scope...",
-    "Checking your uploads...",
-    "Examining the specifics...",
-    "Finding key words...",
-    "Finding relevant info...",
-    "Getting the gist",
-    "Getting the gist...",
-    "Reading full chapters",
-    "Reading full chapters..."
-]
 
 
 
 
-
-def reset_browser():
+def quit_driver(driver):
     """
-    Safely quits the current browser instance and resets the global variable to None.
+    Safely quits a WebDriver session.
     Enhanced with aggressive cleanup to prevent orphaned Chrome processes.
     """
-    global browser_instance
     session_id = None
     
     try:
-        if browser_instance:
-            # Try to get session ID before quitting (in case quit() fails)
-            try:
-                session_id = browser_instance.session_id
-            except:
-                pass
-            
-            # Attempt graceful quit
-            browser_instance.quit()
-            logger.info("Browser instance quit successfully.")
+        # Try to get session ID before quitting (in case quit() fails)
+        try:
+            session_id = driver.session_id
+        except:
+            pass
+        
+        # Attempt graceful quit
+        driver.quit()
+        logger.info(f"Browser session {session_id} quit successfully.")
     except Exception as e:
-        logger.warning(f"Error quitting browser instance (likely already dead): {e}")
+        logger.warning(f"Error quitting browser session (likely already dead): {e}")
         
         # Fallback: Try to delete session via Selenium Hub API
         if session_id:
@@ -136,21 +143,71 @@ def reset_browser():
                 logger.info(f"Forcefully deleted Selenium session {session_id}: {response.status_code}")
             except Exception as cleanup_error:
                 logger.warning(f"Failed to force-delete session via API: {cleanup_error}")
-    finally:
-        browser_instance = None
-        logger.info("Browser instance reference cleared.")
 
-def initialize_browser(retries=3, delay=5):
+def reset_browser():
+    """Closes every pooled browser session (busy ones as soon as their query ends)."""
+    if _browser_pool is not None:
+        closed = _browser_pool.reset()
+        logger.info(f"Browser pool reset ({closed} session(s)).")
+
+def execute_cdp(driver, cmd, params=None):
+    """Runs a Chrome DevTools Protocol command through the Selenium hub."""
+    return driver.execute("executeCdpCommand", {"cmd": cmd, "params": params or {}})["value"]
+
+def seed_google_cookies(driver):
     """
-    Initializes the shared browser instance with retry logic.
-    Returns: (success: bool, error_message: str|None)
+    Copies the shared Google session cookies (~/.notebooklm-mcp/auth.json)
+    into a fresh profile, so pool slots other than the VNC one start logged in.
+    """
+    try:
+        from notebooklm_mcp.auth import load_cached_tokens
+        tokens = load_cached_tokens()
+    except Exception as e:
+        logger.warning(f"Could not load cached Google cookies: {e}")
+        return
+    if not tokens:
+        logger.warning("No cached Google cookies; this browser may need a manual login.")
+        return
+    cookies = [
+        {
+            "name": name,
+            "value": value,
+            "domain": ".google.com",
+            "path": "/",
+            "secure": True,
+            "httpOnly": not name.endswith("APISID"),
+        }
+        for name, value in tokens.cookies.items()
+        # __Host- cookies can't carry a Domain attribute
+        if not name.startswith("__Host-")
+    ]
+    execute_cdp(driver, "Network.setCookies", {"cookies": cookies})
+    logger.info(f"Seeded {len(cookies)} Google cookies into the browser profile.")
+
+class CountingRemoteConnection(ChromiumRemoteConnection):
+    """Chromium hub connection that counts the WebDriver commands it sends."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.commands = 0
+
+    def execute(self, command, params):
+        self.commands += 1
+        return super().execute(command, params)
+
+def webdriver_command_count(driver):
+    """WebDriver commands sent by this session so far (0 if not counted)."""
+    return getattr(driver.command_executor, 'commands', 0)
+
+def create_browser(slot=0, retries=3, delay=5):
+    """
+    Starts one WebDriver session for a pool slot, with retry logic.
+    Raises RuntimeError if the Selenium hub can't start it.
     """
-    global browser_instance
-    
     # Use a remote WebDriver to connect to the Selenium container
     selenium_hub_url = os.environ.get('SELENIUM_HUB_URL', 'http://localhost:4444/wd/hub')
     
-    logger.info(f"Attempting to connect to Selenium Hub at: {selenium_hub_url}")
+    logger.info(f"Attempting to connect to Selenium Hub at: {selenium_hub_url} (slot {slot})")
     
     chrome_options = Options()
     
@@ -175,33 +232,94 @@ def initialize_browser(retries=3, delay=5):
     chrome_options.add_argument(f'user-agent={user_agent}')
 
     # This points to the profile directory mounted inside the Selenium container
-    chrome_options.add_argument("--user-data-dir=/data")
+    profile_dir = BROWSER_PROFILE_DIR if slot == 0 else f"{BROWSER_PROFILE_DIR}/pool-{slot}"
+    chrome_options.add_argument(f"--user-data-dir={profile_dir}")
     chrome_options.add_argument("--profile-directory=Default")
 
+    # CDP network events in the performance log, for network completion detection
+    if NETWORK_COMPLETION:
+        chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+        chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': False})
+
     last_error = None
 
     for attempt in range(retries):
+        driver = None
         try:
-            # Ensure any existing instance is cleaned up
-            if browser_instance:
-                reset_browser()
-
-            browser_instance = webdriver.Remote(
-                command_executor=selenium_hub_url,
+            # The Chromium connection adds the hub's CDP passthrough (execute_cdp);
+            # the counting subclass feeds the per-query command stats
+            driver = webdriver.Remote(
+                command_executor=CountingRemoteConnection(selenium_hub_url, "goog", "chrome"),
                 options=chrome_options
             )
-            browser_instance.set_page_load_timeout(60)
-            browser_instance.maximize_window()
+            driver.set_page_load_timeout(60)
+            driver.maximize_window()
+            if slot != 0:
+                seed_google_cookies(driver)
             logger.info("WebDriver initialized successfully and connected to Selenium Hub.")
-            return True, None
+            return driver
         except Exception as e:
             last_error = e
             logger.warning(f"Attempt {attempt + 1}/{retries} failed to initialize WebDriver: {e}")
+            if driver is not None:
+                quit_driver(driver)
             time.sleep(delay)
 
     logger.error(f"Failed to initialize WebDriver after {retries} attempts: {last_error}", exc_info=True)
-    reset_browser()
-    return False, str(last_error)
+    raise RuntimeError(str(last_error))
+
+def get_browser_pool():
+    """The shared pool of browser sessions."""
+    global _browser_pool
+    if _browser_pool is None:
+        with _browser_pool_lock:
+            if _browser_pool is None:
+                _browser_pool = BrowserPool(BROWSER_POOL_SIZE, create_browser, quit_driver, max_uses=BROWSER_MAX_USES)
+                if NOTEBOOK_TAB_IDLE_SECONDS > 0 or NETWORK_COMPLETION:
+                    threading.Thread(target=_sweep_idle_sessions, name="browser-session-sweeper", daemon=True).start()
+    return _browser_pool
+
+_query_scheduler: Optional[QueryScheduler] = None
+
+def get_query_scheduler():
+    """The admission queue in front of the browser pool."""
+    global _query_scheduler
+    if _query_scheduler is None:
+        with _browser_pool_lock:
+            if _query_scheduler is None:
+                _query_scheduler = QueryScheduler(
+                    BROWSER_POOL_SIZE,
+                    max_depth=QUERY_QUEUE_MAX_DEPTH,
+                    max_per_user=QUERY_QUEUE_MAX_PER_USER,
+                )
+    return _query_scheduler
+
+def notebook_tabs(browser):
+    """The warm notebook tabs of a pooled browser session."""
+    tabs = browser.context.get('tabs')
+    if tabs is None:
+        tabs = browser.context['tabs'] = NotebookTabs(NOTEBOOK_TABS_MAX, NOTEBOOK_TAB_IDLE_SECONDS)
+    return tabs
+
+def _tidy_idle_session(browser):
+    # Close notebook tabs idle for too long
+    if NOTEBOOK_TAB_IDLE_SECONDS > 0:
+        notebook_tabs(browser).evict_idle(browser.driver)
+    # Drop the network events open tabs keep logging, so the buffer stays
+    # small. Only on sessions where a query could read the log: a session
+    # without it must not be recycled by the sweep for failing here
+    if NETWORK_COMPLETION and browser.context.get('performance_log'):
+        try:
+            browser.driver.get_log('performance')
+        except Exception as e:
+            logger.info(f"Performance log unavailable on {browser.name}, no longer draining it: {e}")
+            browser.context['performance_log'] = False
+
+def _sweep_idle_sessions():
+    """Tidies sessions nobody is using: idle tabs and the performance log."""
+    while True:
+        time.sleep(NOTEBOOK_TAB_SWEEP_INTERVAL)
+        get_browser_pool().sweep(_tidy_idle_session)
 
 def cleanup_orphaned_sessions():
     """
@@ -257,22 +375,39 @@ def cleanup_orphaned_sessions():
 
 
 def start_browser_initialization_thread():
-    """Starts the browser initialization in a background thread to not block app startup."""
+    """Warms every pool slot in background threads to not block app startup."""
     # First, clean up any orphaned sessions from previous runs
     cleanup_orphaned_sessions()
     
-    # Then start browser initialization
-    init_thread = threading.Thread(target=initialize_browser, daemon=True)
-    init_thread.start()
+    # Then start the browsers
+    get_browser_pool().warm()
+
 
+# Expected conditions that probe_selectors can evaluate page-side
+PROBE_MODES = {
+    EC.presence_of_element_located: PRESENCE,
+    EC.visibility_of_element_located: VISIBLE,
+    EC.element_to_be_clickable: CLICKABLE,
+}
 
 def find_element_by_priority(driver, selectors, condition=EC.presence_of_element_located, timeout=10):
     """
     Tries to find an element by iterating through a list of selectors.
     This implementation polls for the element to avoid a multiplicative timeout effect.
+    Each poll evaluates the whole list in one round trip (see dom_probe.py).
     """
+    mode = PROBE_MODES.get(condition)
     end_time = time.time() + timeout
     while time.time() < end_time:
+        if mode is not None:
+            try:
+                element = probe_selectors(driver, selectors, mode)['first']
+                if element:
+                    return element
+                time.sleep(0.2)
+                continue
+            except JavascriptException as e:
+                logger.debug(f"Selector probe failed, checking selectors one by one: {e}")
         for by, value in selectors:
             try:
                 element = condition((by, value))(driver)
@@ -290,39 +425,21 @@ def count_all_suggestions(driver):
     Counts all suggestion chip elements using multiple selectors.
     Returns the total count of unique suggestion elements.
     """
-    suggestion_elements = set()
-    for by, value in SUGGESTION_CHIP_SELECTORS:
-        try:
-            elements = driver.find_elements(by, value)
-            for elem in elements:
-                # Use element ID to avoid counting duplicates
-                try:
-                    suggestion_elements.add(elem.id)
-                except:
-                    pass
-        except Exception as e:
-            logger.debug(f"Could not find suggestions with selector {value}: {e}")
-            pass
-    
-    return len(suggestion_elements)
+    try:
+        return probe_selectors(driver, SUGGESTION_CHIP_SELECTORS)['unique']
+    except Exception as e:
+        logger.debug(f"Could not count suggestions: {e}")
+        return 0
 
 def count_save_to_note_buttons(driver):
     """
     Counts all 'Save to note' buttons using multiple selectors.
     Returns the total count of unique button elements.
     """
-    buttons = set()
-    for by, value in SAVE_TO_NOTE_SELECTORS:
-        try:
-            elements = driver.find_elements(by, value)
-            for elem in elements:
-                try:
-                    buttons.add(elem.id)
-                except:
-                    pass
-        except Exception as e:
-            pass
-    return len(buttons)
+    try:
+        return probe_selectors(driver, SAVE_TO_NOTE_SELECTORS)['unique']
+    except Exception:
+        return 0
 
 def safe_get_element_text(driver, selector, max_retries=15):
     """
@@ -365,56 +482,6 @@ def safe_get_element_text(driver, selector, max_retries=15):
     
     return ""
 
-def is_only_thinking_phrase(text):
-    """
-    Checks if the given text contains ONLY thinking phrases (and nothing else).
-    Returns True if yes, False if there's actual content.
-    """
-    if not text or not text.strip():
-        return False
-    
-    # Remove common punctuation and whitespace
-    cleaned = text.strip().rstrip('.').rstrip('...')
-    
-    # Check if the entire text matches any thinking phrase
-    for phrase in THINKING_PHRASES:
-        # 1. Exact match of cleaned text vs cleaned phrase
-        clean_phrase = phrase.lower().rstrip('.').rstrip('...')
-        if cleaned.lower() == clean_phrase:
-            # logger.debug(f"Thinking phrase match (exact): '{text}'")
-            return True
-            
-        # 2. Check if it starts with the phrase and is short enough
-        if cleaned.lower().startswith(clean_phrase) and len(cleaned) <= len(clean_phrase) + 5:
-            # logger.debug(f"Thinking phrase match (startswith): '{text}'")
-            return True
-            
-        # 3. Direct match against raw phrase (in case list has dots)
-        if text.strip().lower() == phrase.lower():
-            # logger.debug(f"Thinking phrase match (raw): '{text}'")
-            return True
-            
-    # 4. Heuristic: Check for common thinking verbs in short text
-    # This catches variations like "Finding key words...", "Finding connections...", etc.
-    # We use 'in' instead of 'startswith' to handle potential invisible characters at the start
-    THINKING_VERBS = [
-        "Finding", "Checking", "Scanning", "Reading", "Getting", 
-        "Thinking", "Working", "Parsing", "Sifting", "Analyzing", 
-        "Assessing", "Refining", "Reviewing", "Exploring", "Examining",
-        "Gathering", "Consulting"
-    ]
-    
-    if len(text) < 60:  # Increased to 60
-        text_lower = text.lower()
-        for verb in THINKING_VERBS:
-            if verb.lower() in text_lower:
-                logger.info(f"Heuristic thinking phrase match: '{text}' (contains {verb})")
-                return True
-                
-    return False
-
-
-
 @notebooklm_bp.route('/process_query', methods=['POST'])
 def process_query():
     """
@@ -442,86 +509,99 @@ def process_query():
     if dev_mode:
         logger.info("🔧 DEV MODE: Browser will remain open after query")
 
+    # Admission: wait for a browser in a fair, bounded queue, or fail fast
+    # Fairness and the per-user cap key on the client address: the body's
+    # user_id is client-supplied and unauthenticated, so it only labels logs
+    user_key = request.remote_addr or 'anonymous'
+    user_label = f"{user_key} ({data['user_id']})" if data.get('user_id') else user_key
+    scheduler = get_query_scheduler()
+    try:
+        ticket = scheduler.submit(user_key)
+    except QueueFull as e:
+        logger.warning(f"Rejecting query from {user_label}: {e}")
+        response = jsonify({'error': str(e), 'retry_after': round(e.retry_after)})
+        response.headers['Retry-After'] = str(max(1, round(e.retry_after)))
+        return response, 429
 
     def generate_full_process_response():
-        global browser_instance
-        
-        # 1. Initialize and Open
-        with browser_lock:
-            # Ensure we have a valid browser instance
-            if not browser_instance:
-                success, error_msg = initialize_browser()
-                if not success:
-                     yield f'data: {json.dumps({"error": f"Failed to initialize browser: {error_msg}"})}\n\n'
-                     return
+        # 1. Check out a warm browser session (queries run in parallel up to BROWSER_POOL_SIZE)
+        try:
+            browser = get_browser_pool().checkout(timeout=BROWSER_CHECKOUT_TIMEOUT)
+        except BrowserPoolTimeout as e:
+            yield sse_event({"error": f"No browser available: {e}"})
+            return
+        except Exception as e:
+            yield sse_event({"error": f"Failed to initialize browser: {e}"})
+            return
+        driver = browser.driver
+        failed = False
+        answered = False
+        query_started = time.time()
+        commands_before = webdriver_command_count(driver)
+
+        try:
+            # Repeat queries on a notebook reuse its already loaded tab
+            tab_warm = notebook_tabs(browser).open(driver, url)
+            target_id = url.split('/')[-1] if 'notebook/' in url else ''
+            if tab_warm and "notebooklm.google.com" in driver.current_url and target_id in driver.current_url:
+                logger.info(f"Reusing warm tab for {url}")
+                yield sse_event({"status": "opening_browser", "message": f"Reusing open tab for {url}"})
             else:
-                # Validate existing session
-                try:
-                    _ = browser_instance.current_url
-                except Exception as e:
-                    logger.warning(f"Found stale browser session during process_query: {e}. Re-initializing...")
-                    success, error_msg = initialize_browser()
-                    if not success:
-                        yield f'data: {json.dumps({"error": f"Failed to re-initialize browser: {error_msg}"})}\n\n'
-                        return
-            
-            try:
                 logger.info(f"Navigating to {url}...")
-                yield f'data: {json.dumps({"status": "opening_browser", "message": f"Navigating to {url}"})}\n\n'
-                
-                browser_instance.get(url)
-                
+                yield sse_event({"status": "opening_browser", "message": f"Navigating to {url}"})
+            
+                driver.get(url)
+            
                 # Wait for initial load - reduced from fixed sleep to smart wait check below
                 # time.sleep(5) 
-                
-                current_url = browser_instance.current_url
+            
+                current_url = driver.current_url
                 logger.info(f"Current URL after navigation: {current_url}")
-                
+            
                 if 'accounts.google.com' in current_url or 'signin' in current_url.lower():
                     logger.warning(f"Redirected to Google sign-in page.")
-                    yield f'data: {json.dumps({"status": "authentication_required", "message": "Redirected to Google sign-in. Waiting 5 minutes for manual login..."})}\n\n'
-                    
+                    yield sse_event({"status": "authentication_required", "message": "Redirected to Google sign-in. Waiting 5 minutes for manual login..."})
+                
                     # Wait up to 5 minutes for user to log in
                     auth_timeout = 300
                     auth_start_time = time.time()
                     logged_in = False
-                    
+                
                     while time.time() - auth_start_time < auth_timeout:
-                        if "notebooklm.google.com" in browser_instance.current_url and find_element_by_priority(browser_instance, CHAT_INPUT_SELECTORS, timeout=1):
+                        if "notebooklm.google.com" in driver.current_url and find_element_by_priority(driver, CHAT_INPUT_SELECTORS, timeout=1):
                             logged_in = True
                             break
                         time.sleep(2)
-                    
+                
                     if not logged_in:
                         logger.error("Timed out waiting for manual login.")
-                        yield f'data: {json.dumps({"error": "Timed out waiting for manual login."})}\n\n'
+                        yield sse_event({"error": "Timed out waiting for manual login."})
                         return
                     else:
                         logger.info("User logged in successfully.")
-                        yield f'data: {json.dumps({"status": "login_success", "message": "Login detected. Proceeding..."})}\n\n'
+                        yield sse_event({"status": "login_success", "message": "Login detected. Proceeding..."})
 
                 # Wait for page to fully load
                 # logger.info("Waiting for page to fully load...")
                 # time.sleep(5)
-                
+            
                 # Ensure we are on the correct page with retry logic
                 max_retries = 3
-                target_id = url.split('/')[-1] if 'notebook/' in url else ''
-                
+            
                 for i in range(max_retries):
-                    current_url = browser_instance.current_url
-                    
+                    current_url = driver.current_url
+                
                     # 1. Check if we are on the home page but want a specific notebook
                     if "notebook/" in url and "notebook/" not in current_url:
                         logger.warning(f"Attempt {i+1}/{max_retries}: Detected Home Page (or non-notebook page) '{current_url}' but target is '{url}'. Re-navigating...")
-                        browser_instance.get(url)
+                        driver.get(url)
                         time.sleep(8) # Increased wait time
                         continue
 
                     # 2. Check if we are on the WRONG notebook (ID mismatch)
                     if target_id and target_id not in current_url:
                         logger.warning(f"Attempt {i+1}/{max_retries}: ID mismatch. Current '{current_url}' vs Target '{url}'. Re-navigating...")
-                        browser_instance.get(url)
+                        driver.get(url)
                         time.sleep(8)
                         continue
 
@@ -529,347 +609,373 @@ def process_query():
                     logger.info(f"Successfully on target page: {current_url}")
                     break
                 else:
-                    logger.error(f"Failed to navigate to {url} after {max_retries} attempts. Current URL: {browser_instance.current_url}")
+                    logger.error(f"Failed to navigate to {url} after {max_retries} attempts. Current URL: {driver.current_url}")
 
-                logger.info(f"Page loaded. Current URL: {browser_instance.current_url}")
-                yield f'data: {json.dumps({"status": "browser_ready", "message": "NotebookLM interface loaded."})}\n\n'
+            logger.info(f"Page loaded. Current URL: {driver.current_url}")
+            yield sse_event({"status": "browser_ready", "message": "NotebookLM interface loaded."})
 
-                # 2. Query Logic
-                if "notebooklm.google.com" not in browser_instance.current_url:
-                     yield f'data: {json.dumps({"error": "Not on a NotebookLM page."})}\n\n'
-                     return
-                
-                # Track baseline for completion detection
-                response_elements_before = browser_instance.find_elements(*RESPONSE_CONTENT_SELECTOR)
-                
-                initial_response_count = len(browser_instance.find_elements(*RESPONSE_CONTENT_SELECTOR))
-                
-                logger.info("Attempting to find the chat input field...")
-                input_field = find_element_by_priority(browser_instance, CHAT_INPUT_SELECTORS, condition=EC.element_to_be_clickable, timeout=10)
-                if not input_field:
-                    raise NoSuchElementException("Could not find the chat input field.")
-                
-                logger.info(f"Entering query text: {query_text}")
-                input_field.clear()
-                input_field.send_keys(query_text)
-                
-                submit_button = find_element_by_priority(browser_instance, SUBMIT_BUTTON_SELECTORS, condition=EC.element_to_be_clickable, timeout=5)
-                if submit_button:
-                    logger.info("Clicking submit button...")
-                    submit_button.click()
-                else:
-                    logger.info("Submit button not found, sending RETURN key...")
-                    from selenium.webdriver.common.keys import Keys
-                    input_field.send_keys(Keys.RETURN)
-                
-                logger.info("Query submitted.")
-                yield f'data: {json.dumps({"status": "waiting_for_response"})}\n\n'
-
-                # 3. Stream the response
-                # STRATEGY: Simple and reliable
-                # 1. Wait for a NEW response element to appear
-                # 2. Stream ALL text changes (ignore content, just detect changes)
-                # 3. Stop when text hasn't changed for 6 seconds
-                # This ignores "Thinking" phrases entirely - we just stream what we see
-
-                def find_new_response_with_text(driver, initial_count, selector):
-                    try:
-                        response_elements = driver.find_elements(*selector)
-                        if len(response_elements) > initial_count:
-                            new_response_element = response_elements[-1]
-                            if new_response_element.is_displayed() and new_response_element.text.strip():
-                                return new_response_element
-                    except StaleElementReferenceException:
-                        return False
-                    return False
+            # 2. Query Logic
+            if "notebooklm.google.com" not in driver.current_url:
+                 yield sse_event({"error": "Not on a NotebookLM page."})
+                 return
+            
+            # Track baseline for completion detection
+            response_elements_before = driver.find_elements(*RESPONSE_CONTENT_SELECTOR)
+            
+            initial_response_count = len(driver.find_elements(*RESPONSE_CONTENT_SELECTOR))
+            
+            logger.info("Attempting to find the chat input field...")
+            input_field = find_element_by_priority(driver, CHAT_INPUT_SELECTORS, condition=EC.element_to_be_clickable, timeout=10)
+            if not input_field:
+                raise NoSuchElementException("Could not find the chat input field.")
+            
+            # Watch for the answer request from here on
+            completion = StreamCompletion(driver, COMPLETION_RPC_PATTERN)
+            if NETWORK_COMPLETION:
+                browser.context['performance_log'] = completion.start()
+
+            logger.info(f"Entering query text: {query_text}")
+            input_field.clear()
+            input_field.send_keys(query_text)
+            
+            submit_button = find_element_by_priority(driver, SUBMIT_BUTTON_SELECTORS, condition=EC.element_to_be_clickable, timeout=5)
+            if submit_button:
+                logger.info("Clicking submit button...")
+                submit_button.click()
+            else:
+                logger.info("Submit button not found, sending RETURN key...")
+                from selenium.webdriver.common.keys import Keys
+                input_field.send_keys(Keys.RETURN)
+            
+            logger.info("Query submitted.")
+            yield sse_event({"status": "waiting_for_response"})
 
-                # 3. Stream the response
-                # STRATEGY: Robust Clean-Text Streaming
-                # 1. Get raw text from DOM
-                # 2. Strip any "Thinking" phrases from the start of the text
-                # 3. Calculate chunks based on the CLEAN text (ignoring the raw thinking prefix)
-                # 4. If clean text is empty => status="thinking"
-                # 5. If clean text has content => status="streaming"
-
-                def find_new_response_with_text(driver, initial_count, selector):
-                    try:
-                        response_elements = driver.find_elements(*selector)
-                        if len(response_elements) > initial_count:
-                            new_response_element = response_elements[-1]
-                            if new_response_element.is_displayed() and new_response_element.text.strip():
-                                return new_response_element
-                    except StaleElementReferenceException:
-                        return False
+            # 3. Stream the response
+            # STRATEGY: Simple and reliable
+            # 1. Wait for a NEW response element to appear
+            # 2. Stream ALL text changes (ignore content, just detect changes)
+            # 3. Stop when text hasn't changed for 6 seconds
+            # This ignores "Thinking" phrases entirely - we just stream what we see
+
+            def find_new_response_with_text(driver, initial_count, selector):
+                try:
+                    response_elements = driver.find_elements(*selector)
+                    if len(response_elements) > initial_count:
+                        new_response_element = response_elements[-1]
+                        if new_response_element.is_displayed() and new_response_element.text.strip():
+                            return new_response_element
+                except StaleElementReferenceException:
                     return False
+                return False
 
-                def strip_thinking_phrase(text):
-                    """
-                    Removes any leading thinking phrase from the text.
-                    Returns the clean text.
-                    """
-                    text_lower = text.lower().strip()
-                    best_match_len = 0
-                    
-                    for phrase in THINKING_PHRASES:
-                        # Check keys: startswith phrase
-                        # We handle "..." and punctuation flexibly
-                        clean_phrase = phrase.lower().rstrip('.').strip()
-                        
-                        if text_lower.startswith(clean_phrase):
-                            # Ensure we don't match "Thinking" inside "ThinkingAbout"
-                            # Match if full string OR followed by punctuation/space
-                            match_len = len(clean_phrase)
-                            
-                            # Check what follows the match in the original text
-                            # We want to consume the phrase PLUS any trailing dots/whitespace
-                            
-                            # Original case insensitive match check
-                            if text[:match_len].lower() == clean_phrase:
-                                # Look ahead for dots/spaces
-                                remaining = text[match_len:]
-                                stripped_len = match_len
-                                
-                                # Consume ... and spaces
-                                while remaining and (remaining[0] == '.' or remaining[0].isspace()):
-                                    remaining = remaining[1:]
-                                    stripped_len += 1
-                                
-                                # Updates best match (greedy)
-                                if stripped_len > best_match_len:
-                                    best_match_len = stripped_len
-
-                    if best_match_len > 0:
-                        return text[best_match_len:]
-                    
-                    # Heuristic fallback for "Verbing..."
-                    if len(text) < 60:
-                         THINKING_VERBS = [
-                            "Finding", "Checking", "Scanning", "Reading", "Getting", 
-                            "Thinking", "Working", "Parsing", "Sifting", "Analyzing", 
-                            "Assessing", "Refining", "Reviewing", "Exploring", "Examining",
-                            "Gathering", "Consulting"
-                        ]
-                         for verb in THINKING_VERBS:
-                             if text.strip().startswith(verb):
-                                 # If it looks like a short thinking sentence, treat as empty
-                                 return ""
-                    
-                    return text
+            # 3. Stream the response
+            # STRATEGY: Robust Clean-Text Streaming
+            # 1. Get raw text from DOM
+            # 2. Strip any "Thinking" phrases from the start of the text
+            # 3. Calculate chunks based on the CLEAN text (ignoring the raw thinking prefix)
+            # 4. If clean text is empty => status="thinking"
+            # 5. If clean text has content => status="streaming"
 
+            def find_new_response_with_text(driver, initial_count, selector):
                 try:
-                    response_element = WebDriverWait(browser_instance, 50).until(
-                        lambda d: find_new_response_with_text(d, initial_response_count, RESPONSE_CONTENT_SELECTOR)
-                    )
-                    logger.info("Response element detected. Starting to stream.")
-                    # Don't send "streaming" yet, wait for actual content
-                except TimeoutException:
-                    logger.error("Timed out waiting for a response from NotebookLM.")
-                    yield f'data: {json.dumps({"error": "NotebookLM did not start generating a response in time."})}\n\n'
-                    return
-
-                last_clean_text = ""
-                end_time = time.time() + timeout
-                stream_completed = False
-                last_change_time = time.time()
-                SILENCE_TIMEOUT = 6
+                    response_elements = driver.find_elements(*selector)
+                    if len(response_elements) > initial_count:
+                        new_response_element = response_elements[-1]
+                        if new_response_element.is_displayed() and new_response_element.text.strip():
+                            return new_response_element
+                except StaleElementReferenceException:
+                    return False
+                return False
+
+            try:
+                response_element = WebDriverWait(driver, 50).until(
+                    lambda d: find_new_response_with_text(d, initial_response_count, RESPONSE_CONTENT_SELECTOR)
+                )
+                logger.info("Response element detected. Starting to stream.")
+                # Don't send "streaming" yet, wait for actual content
+            except TimeoutException:
+                logger.error("Timed out waiting for a response from NotebookLM.")
+                yield sse_event({"error": "NotebookLM did not start generating a response in time."})
+                return
+
+            last_clean_text = ""
+            end_time = time.time() + timeout
+            stream_completed = False
+            last_change_time = time.time()
+            SILENCE_TIMEOUT = 6  # fallback when the network completion isn't available
+            last_raw_text = None
+            last_raw_change_time = time.time()
+            
+            material_started = False
+            
+            # Buffer for small chunks to ensure we don't send "thinking" blips
+            # or tiny updates that cause jitter.
+            chunk_buffer = ""
+            MIN_WORD_COUNT = 10 
+
+            # Strips the leading "thinking" placeholder; incremental over the growing text
+            stripper = ThinkingPhraseStripper()
+
+            # Text changes are pushed by an observer on the page; each drain
+            # long-polls until something changes. Polling is the fallback.
+            watcher = ResponseWatcher(driver, RESPONSE_CONTENT_SELECTOR[1], initial_response_count)
+            use_watcher = watcher.install()
+            polls = 0
+
+            def read_response_text(wait):
+                nonlocal use_watcher, polls
+                if use_watcher:
+                    text = watcher.drain(wait)
+                    if text is not None:
+                        return text
+                    logger.warning("Response watcher lost (page replaced?); falling back to polling.")
+                    use_watcher = False
+                polls += 1
+                return safe_get_element_text(driver, RESPONSE_CONTENT_SELECTOR)
+
+            while time.time() < end_time:
+                # 1. Get Raw Text (blocks up to RESPONSE_DRAIN_WAIT for a change)
+                drain_wait = COMPLETION_SETTLE_SECONDS if completion.done else RESPONSE_DRAIN_WAIT
+                raw_text = read_response_text(min(drain_wait, max(0.0, end_time - time.time())))
+                if raw_text != last_raw_text:
+                    last_raw_text = raw_text
+                    last_raw_change_time = time.time()
+
+                # Completion (network): the answer request has finished and the
+                # page has stopped changing; the final flush below reads the rest
+                if completion.poll() and time.time() - max(last_raw_change_time, completion.done_at) > COMPLETION_SETTLE_SECONDS:
+                    logger.info("🎯 COMPLETION DETECTED: answer request finished and the page has settled")
+                    stream_completed = True
+                    break
                 
-                material_started = False
+                # 2. Clean Text (Strip Thinking)
+                current_clean_text = stripper.strip(raw_text)
                 
-                # Buffer for small chunks to ensure we don't send "thinking" blips
-                # or tiny updates that cause jitter.
-                chunk_buffer = ""
-                MIN_WORD_COUNT = 10 
-
-                while time.time() < end_time:
-                    # 1. Get Raw Text
-                    raw_text = safe_get_element_text(browser_instance, RESPONSE_CONTENT_SELECTOR)
-                    
-                    # 2. Clean Text (Strip Thinking)
-                    current_clean_text = strip_thinking_phrase(raw_text)
-                    
-                    # 3. Handle Thinking State - Just swallow it, don't report status="thinking"
-                    if not current_clean_text.strip():
+                # 3. Handle Thinking State - Just swallow it, don't report status="thinking"
+                if not current_clean_text.strip():
+                    if not use_watcher:
                         time.sleep(0.2)
-                        continue
+                    continue
+                
+                # 4. Handle Content Streaming
+                # Check for replacement (Discontinuity)
+                if last_clean_text and not current_clean_text.startswith(last_clean_text):
+                     logger.info(f"Discontinuity in CLEAN text. Resetting. (Old: '{last_clean_text[:20]}...', New: '{current_clean_text[:20]}...')")
+                     last_clean_text = ""
+                     chunk_buffer = "" # Reset buffer on discontinuity
+                
+                # Calculate Chunk
+                if len(current_clean_text) > len(last_clean_text):
+                    new_fragment = current_clean_text[len(last_clean_text):]
+                    chunk_buffer += new_fragment
                     
-                    # 4. Handle Content Streaming
-                    # Check for replacement (Discontinuity)
-                    if last_clean_text and not current_clean_text.startswith(last_clean_text):
-                         logger.info(f"Discontinuity in CLEAN text. Resetting. (Old: '{last_clean_text[:20]}...', New: '{current_clean_text[:20]}...')")
-                         last_clean_text = ""
-                         chunk_buffer = "" # Reset buffer on discontinuity
+                    # Only yield if we have enough words in the buffer OR it's been a while?
+                    # User requested: "replay back ... with data chunks that are greated than 10 words"
                     
-                    # Calculate Chunk
-                    if len(current_clean_text) > len(last_clean_text):
-                        new_fragment = current_clean_text[len(last_clean_text):]
-                        chunk_buffer += new_fragment
-                        
-                        # Only yield if we have enough words in the buffer OR it's been a while?
-                        # User requested: "replay back ... with data chunks that are greated than 10 words"
-                        
-                        buffer_word_count = len(chunk_buffer.split())
-                        
-                        if buffer_word_count >= MIN_WORD_COUNT:
-                             if not material_started:
-                                logger.info("Material content started (buffer threshold met).")
-                                yield f'data: {json.dumps({"status": "streaming"})}\n\n'
-                                material_started = True
-                             
-                             # Yield the whole buffer
-                             yield f'data: {json.dumps({"chunk": chunk_buffer})}\n\n'
-                             chunk_buffer = "" # Clear buffer
-                        
-                        last_clean_text = current_clean_text
-                        last_change_time = time.time()
+                    buffer_word_count = len(chunk_buffer.split())
                     
-                    # 5. Completion Detection (End of Data - Silence-based)
-                    # Check if content has stopped changing (no new chunks = end of stream)
-                    if material_started:
-                        silence_duration = time.time() - last_change_time
-                        if silence_duration > SILENCE_TIMEOUT:
-                             logger.info(f"🎯 COMPLETION DETECTED: No new content for {SILENCE_TIMEOUT}s (end of data chunks)")
-                             stream_completed = True
-                             break
+                    if buffer_word_count >= MIN_WORD_COUNT:
+                         if not material_started:
+                            logger.info("Material content started (buffer threshold met).")
+                            yield sse_event({"status": "streaming"})
+                            material_started = True
+                         
+                         # Yield the whole buffer
+                         yield sse_event({"chunk": chunk_buffer})
+                         chunk_buffer = "" # Clear buffer
                     
-                    time.sleep(0.2)
+                    last_clean_text = current_clean_text
+                    last_change_time = time.time()
                 
-                # Final flush - safely get any remaining text AND flush buffer
-                final_raw = safe_get_element_text(browser_instance, RESPONSE_CONTENT_SELECTOR)
-                final_clean = strip_thinking_phrase(final_raw)
+                # 5. Completion Detection (End of Data - Silence-based)
+                # Check if content has stopped changing (no new chunks = end of stream).
+                # Only the fallback: the network check above normally ends the stream first
+                if material_started:
+                    silence_duration = time.time() - last_change_time
+                    if silence_duration > SILENCE_TIMEOUT:
+                         logger.info(f"🎯 COMPLETION DETECTED: No new content for {SILENCE_TIMEOUT}s (end of data chunks)")
+                         stream_completed = True
+                         break
                 
-                # If there's new text we haven't seen in chunks checks
-                if len(final_clean) > len(last_clean_text):
-                    new_fragment = final_clean[len(last_clean_text):]
-                    chunk_buffer += new_fragment
+                if not use_watcher:
+                    time.sleep(0.2)
+            
+            # Final flush - safely get any remaining text AND flush buffer
+            final_raw = read_response_text(0)
+            if use_watcher:
+                watcher.uninstall()
+            logger.info(f"Response read with {watcher.round_trips} watcher round trip(s) and {polls} poll(s).")
+            final_clean = stripper.strip(final_raw)
+            
+            # If there's new text we haven't seen in chunks checks
+            if len(final_clean) > len(last_clean_text):
+                new_fragment = final_clean[len(last_clean_text):]
+                chunk_buffer += new_fragment
+            
+            # Flush any remaining buffer
+            if chunk_buffer:
+                if not material_started:
+                     yield sse_event({"status": "streaming"})
+                yield sse_event({"chunk": chunk_buffer})
+
+            # Signal end of streaming
+            yield sse_event({"status": "end_of_stream"})
+
+            # Determine final status
+            if not stream_completed:
+                logger.warning(f"Query timed out after {timeout} seconds - cleanup will proceed")
+                status_message = "timeout"
+            else:
+                method = 'network' if completion.done else 'silence'
+                if completion.failed:
+                    method += ' after the answer request failed'
+                logger.info(f"Query completed successfully ({method} completion)")
+                status_message = "complete"
+                answered = True
                 
-                # Flush any remaining buffer
-                if chunk_buffer:
-                    if not material_started:
-                         yield f'data: {json.dumps({"status": "streaming"})}\n\n'
-                    yield f'data: {json.dumps({"chunk": chunk_buffer})}\n\n'
-
-                # Signal end of streaming
-                yield f'data: {json.dumps({"status": "end_of_stream"})}\n\n'
-
-                # Determine final status
-                if not stream_completed:
-                    logger.warning(f"Query timed out after {timeout} seconds - cleanup will proceed")
-                    status_message = "timeout"
-                else:
-                    logger.info("Query completed successfully")
-                    status_message = "complete"
-                    
-                yield f'data: {json.dumps({"status": status_message})}\n\n'
+            yield sse_event({"status": status_message})
 
 
 
 
-            except Exception as e:
-                logger.error(f"An unexpected error occurred during the query stream: {e}", exc_info=True)
-                yield f'data: {json.dumps({"error": str(e)})}\n\n'
-            
-            finally:
-                # --- DEBUGGING: Capture screenshot before closing ---
-                try:
-                    if browser_instance:
-                        log_dir = os.environ.get('LOG_DIR', './logs')
-                        os.makedirs(log_dir, exist_ok=True)
-                        screenshot_path = os.path.join(log_dir, f"last_query_{int(time.time())}.png")
-                        browser_instance.save_screenshot(screenshot_path)
-                        logger.info(f"DEBUG: Saved post-query screenshot to {screenshot_path}")
-                except Exception as screenshot_err:
-                    logger.warning(f"DEBUG: Failed to save screenshot: {screenshot_err}")
-
-                # CLEANUP: Conditional based on dev_mode
-                if dev_mode:
-                    logger.info("🔧 DEV MODE: Keeping browser open for next query")
-                    yield f'data: {json.dumps({"status": "dev_mode_active", "message": "Browser kept open"})}\n\n'
-                else:
-                    logger.info("Cleaning up browser session (production mode)")
-                    reset_browser()
-                    yield f'data: {json.dumps({"status": "browser_closed"})}\n\n'
+        except Exception as e:
+            failed = True
+            logger.error(f"An unexpected error occurred during the query stream: {e}", exc_info=True)
+            yield sse_event({"error": str(e)})
+        
+        finally:
+            elapsed = max(time.time() - query_started, 0.001)
+            commands = webdriver_command_count(driver) - commands_before
+            logger.info(f"Query used {commands} WebDriver commands in {elapsed:.1f}s ({commands / elapsed:.1f}/s) on {browser.name}")
+
+            # --- DEBUGGING: Capture screenshot before releasing ---
+            try:
+                log_dir = os.environ.get('LOG_DIR', './logs')
+                os.makedirs(log_dir, exist_ok=True)
+                screenshot_path = os.path.join(log_dir, f"last_query_{browser.name}_{int(time.time())}.png")
+                driver.save_screenshot(screenshot_path)
+                logger.info(f"DEBUG: Saved post-query screenshot to {screenshot_path}")
+            except Exception as screenshot_err:
+                logger.warning(f"DEBUG: Failed to save screenshot: {screenshot_err}")
+
+            # A query that ended without an answer leaves its tab in an unknown
+            # state: the next query on this notebook loads it afresh. (After an
+            # exception the whole session is recycled below anyway.)
+            if not answered and not failed:
+                notebook_tabs(browser).forget(driver, url)
+
+            # Back to the pool; a session that failed (or hit BROWSER_MAX_USES) is recycled.
+            # Runs before the last yield so a client that disconnects now can't leak it.
+            get_browser_pool().checkin(browser, error=failed)
+            if dev_mode:
+                logger.info("🔧 DEV MODE: Keeping browser open for next query")
+                yield sse_event({"status": "dev_mode_active", "message": "Browser kept open"})
+            else:
+                yield sse_event({"status": "browser_released", "message": "Browser returned to the pool"})
 
 
-    return Response(stream_with_context(generate_full_process_response()), mimetype='text/event-stream')
+    def generate_admitted_response():
+        try:
+            while not scheduler.wait(ticket, QUERY_QUEUE_UPDATE_INTERVAL):
+                position, eta = scheduler.position(ticket)
+                if position:
+                    yield sse_event({
+                        "status": "queued",
+                        "position": position,
+                        "eta_seconds": round(eta),
+                        "message": f"Waiting for a browser: position {position}, about {round(eta)}s"
+                    })
+            yield from generate_full_process_response()
+        finally:
+            scheduler.release(ticket)
+
+    response = Response(stream_with_context(generate_admitted_response()), mimetype='text/event-stream')
+    # Also frees the ticket if the client leaves before the stream starts
+    response.call_on_close(lambda: scheduler.release(ticket))
+    return response
 
 @notebooklm_bp.route('/status', methods=['GET'])
 def get_status():
-    """Endpoint 2: Checks the status of the browser instance."""
-    with browser_lock:
-        if browser_instance:
-            try:
-                current_url = browser_instance.current_url
-                page_title = browser_instance.title
-                status = 'ready'
-                if 'accounts.google.com' in current_url or 'signin' in current_url.lower():
-                    status = 'authentication_required'
-                
-                return jsonify({
-                    'browser_active': True,
-                    'status': status,
-                    'current_url': current_url,
-                    'page_title': page_title
-                })
-            except Exception as e:
-                logger.error(f"Error getting browser status: {e}")
-                # IMPORTANT: If we can't get status, the session is likely dead. Reset it.
-                reset_browser()
-                return jsonify({'browser_active': False, 'status': 'error', 'error': str(e)}), 500
-        else:
-            return jsonify({'browser_active': False, 'status': 'inactive'})
+    """Endpoint 2: Checks the status of the browser pool."""
+    pool = get_browser_pool()
+    if not pool.sessions():
+        return jsonify({'browser_active': False, 'status': 'inactive', 'pool': pool.stats()})
+    try:
+        page = pool.inspect(lambda driver: (driver.current_url, driver.title))
+    except Exception as e:
+        # The session was dead; the pool has already dropped it
+        logger.error(f"Error getting browser status: {e}")
+        return jsonify({'browser_active': False, 'status': 'error', 'error': str(e), 'pool': pool.stats()}), 500
+    if page is None:
+        # Every session is running a query
+        return jsonify({'browser_active': True, 'status': 'busy', 'pool': pool.stats()})
+    current_url, page_title = page
+    status = 'ready'
+    if 'accounts.google.com' in current_url or 'signin' in current_url.lower():
+        status = 'authentication_required'
+    return jsonify({
+        'browser_active': True,
+        'status': status,
+        'current_url': current_url,
+        'page_title': page_title,
+        'pool': pool.stats()
+    })
+
+@notebooklm_bp.route('/query_queue', methods=['GET'])
+def query_queue_status():
+    """Admission queue metrics: depth, running queries, wait times, rejections."""
+    return jsonify(get_query_scheduler().stats())
 
 @notebooklm_bp.route('/close_browser', methods=['POST'])
 def close_browser_endpoint():
     """
     Endpoint for manually closing the browser (primarily for dev mode).
-    Allows users to close the browser session via UI button.
+    Allows users to close the browser sessions via UI button; sessions that
+    are running a query close when it finishes.
     """
-    global browser_instance
-    with browser_lock:
-        if browser_instance:
-            try:
-                logger.info("🔧 Manual browser close requested")
-                reset_browser()
-                return jsonify({
-                    'success': True, 
-                    'message': 'Browser closed successfully'
-                })
-            except Exception as e:
-                logger.error(f"Error closing browser: {e}")
-                return jsonify({
-                    'success': False, 
-                    'message': f'Error closing browser: {str(e)}'
-                }), 500
-        else:
-            return jsonify({
-                'success': False, 
-                'message': 'No active browser session to close'
-            })
+    pool = get_browser_pool()
+    if not pool.sessions():
+        return jsonify({
+            'success': False, 
+            'message': 'No active browser session to close'
+        })
+    try:
+        logger.info("🔧 Manual browser close requested")
+        closed = pool.reset()
+        return jsonify({
+            'success': True, 
+            'message': f'Closed {closed} browser session(s)'
+        })
+    except Exception as e:
+        logger.error(f"Error closing browser: {e}")
+        return jsonify({
+            'success': False, 
+            'message': f'Error closing browser: {str(e)}'
+        }), 500
 
 @notebooklm_bp.route('/browser_status', methods=['GET'])
 def browser_status_endpoint():
     """
     Get detailed browser status information.
     Useful for UI to show whether browser is active and what page it's on.
+    The url comes from an idle session (null while all are busy).
     """
-    global browser_instance
-    with browser_lock:
-        if browser_instance:
-            try:
-                current_url = browser_instance.current_url
-                session_id = browser_instance.session_id
-                return jsonify({
-                    'active': True,
-                    'url': current_url,
-                    'session_id': session_id,
-                    'on_notebooklm': 'notebooklm.google.com' in current_url
-                })
-            except Exception as e:
-                logger.warning(f"Browser session appears stale: {e}")
-                return jsonify({
-                    'active': False,
-                    'error': 'Browser session is stale'
-                })
-        else:
-            return jsonify({'active': False})
-
+    pool = get_browser_pool()
+    sessions = pool.sessions()
+    if not sessions:
+        return jsonify({'active': False})
+    try:
+        current_url = pool.inspect(lambda driver: driver.current_url)
+    except Exception as e:
+        logger.warning(f"Browser session appears stale: {e}")
+        return jsonify({
+            'active': False,
+            'error': 'Browser session is stale'
+        })
+    return jsonify({
+        'active': True,
+        'url': current_url,
+        'session_id': sessions[0]['session_id'],
+        'on_notebooklm': bool(current_url and 'notebooklm.google.com' in current_url),
+        'sessions': sessions
+    })
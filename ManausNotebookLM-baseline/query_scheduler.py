@@ -0,0 +1,171 @@
+"""
+Admission control for /api/process_query.
+
+Queries used to block silently inside their streaming generator while every
+browser was busy, with no bound on how many piled up. QueryScheduler admits
+at most `capacity` queries at once (one per pooled browser) and holds the
+rest in a bounded queue:
+
+* fairness: each user has a FIFO, and users are served round robin, so one
+  user's burst can't push everyone else back
+* backpressure: beyond `max_depth` queued queries overall, or
+  `max_per_user` for one user, submit() raises QueueFull straight away and
+  the endpoint answers 429
+* feedback: position() gives a ticket's place in the dispatch order and an
+  estimated wait, from a moving average of recent query durations
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict, deque
+from typing import Any, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+WAITING = "waiting"
+RUNNING = "running"
+DONE = "done"
+
+
+class QueueFull(Exception):
+    """Raised when a query can't be queued; retry_after is a hint in seconds"""
+
+    def __init__(self, message: str, retry_after: float):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class QueryTicket:
+    """One query's place in the scheduler."""
+
+    def __init__(self, user: str):
+        self.user = user
+        self.state = WAITING
+        self.enqueued_at = time.monotonic()
+        self.started_at: Optional[float] = None
+        self._admitted = threading.Event()
+
+
+class QueryScheduler:
+    """Bounded, per-user round-robin queue in front of `capacity` workers."""
+
+    def __init__(self, capacity: int, max_depth: int = 20, max_per_user: int = 3,
+                 initial_service_seconds: float = 60.0):
+        self.capacity = max(1, capacity)
+        self.max_depth = max(0, max_depth)
+        self.max_per_user = max(1, max_per_user)
+        self._lock = threading.Lock()
+        self._queues: "OrderedDict[str, Deque[QueryTicket]]" = OrderedDict()  # in service order
+        self._depth = 0
+        self._running = 0
+        # Metrics
+        self._service_seconds = initial_service_seconds  # moving average
+        self._waits: Deque[float] = deque(maxlen=200)
+        self._durations: Deque[float] = deque(maxlen=200)
+        self._admitted = 0
+        self._rejected = 0
+
+    def submit(self, user: str) -> QueryTicket:
+        """Queue a query (or admit it at once if a worker is free).
+
+        Raises:
+            QueueFull: the queue, or this user's share of it, is full
+        """
+        ticket = QueryTicket(user)
+        with self._lock:
+            if self._running < self.capacity and not self._depth:
+                self._start(ticket)
+                return ticket
+            user_queue = self._queues.get(user)
+            if self._depth >= self.max_depth or (user_queue and len(user_queue) >= self.max_per_user):
+                self._rejected += 1
+                retry_after = self._eta(self._depth + 1)
+                raise QueueFull(
+                    f"NotebookLM query queue is full ({self._depth} waiting); try again in about {round(retry_after)}s",
+                    retry_after,
+                )
+            self._queues.setdefault(user, deque()).append(ticket)
+            self._depth += 1
+        return ticket
+
+    def wait(self, ticket: QueryTicket, timeout: float) -> bool:
+        """Wait up to timeout seconds for the ticket to be admitted."""
+        return ticket._admitted.wait(timeout)
+
+    def position(self, ticket: QueryTicket) -> Tuple[int, float]:
+        """(1-based place in dispatch order, estimated seconds until admitted); (0, 0) once admitted."""
+        with self._lock:
+            if ticket.state != WAITING:
+                return 0, 0.0
+            users = list(self._queues)
+            own = self._queues[ticket.user]
+            index = own.index(ticket)
+            rank = users.index(ticket.user)
+            # Round robin: every user ahead in the rotation gets index + 1
+            # turns before ours, every user behind it gets index turns
+            ahead = index
+            for i, user in enumerate(users):
+                if user != ticket.user:
+                    ahead += min(len(self._queues[user]), index + (1 if i < rank else 0))
+            return ahead + 1, self._eta(ahead + 1)
+
+    def release(self, ticket: QueryTicket) -> None:
+        """Finish or abandon a ticket; safe to call more than once."""
+        with self._lock:
+            if ticket.state == WAITING:
+                user_queue = self._queues.get(ticket.user)
+                if user_queue and ticket in user_queue:
+                    user_queue.remove(ticket)
+                    self._depth -= 1
+                    if not user_queue:
+                        del self._queues[ticket.user]
+            elif ticket.state == RUNNING:
+                duration = time.monotonic() - ticket.started_at
+                self._service_seconds = 0.8 * self._service_seconds + 0.2 * duration
+                self._durations.append(duration)
+                self._running -= 1
+                self._dispatch()
+            ticket.state = DONE
+
+    def _start(self, ticket: QueryTicket) -> None:
+        ticket.state = RUNNING
+        ticket.started_at = time.monotonic()
+        self._waits.append(ticket.started_at - ticket.enqueued_at)
+        self._running += 1
+        self._admitted += 1
+        ticket._admitted.set()
+
+    def _dispatch(self) -> None:
+        while self._running < self.capacity and self._queues:
+            user, user_queue = next(iter(self._queues.items()))
+            ticket = user_queue.popleft()
+            self._depth -= 1
+            del self._queues[user]
+            if user_queue:
+                self._queues[user] = user_queue  # back of the rotation
+            self._start(ticket)
+
+    def _eta(self, position: int) -> float:
+        # Queries ahead are served `capacity` at a time; the running ones
+        # are assumed half done on average
+        return (position - 0.5) * self._service_seconds / self.capacity
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            waits = sorted(self._waits)
+            durations = sorted(self._durations)
+            return {
+                "capacity": self.capacity,
+                "running": self._running,
+                "queued": self._depth,
+                "queued_by_user": {user: len(q) for user, q in self._queues.items()},
+                "max_depth": self.max_depth,
+                "max_per_user": self.max_per_user,
+                "admitted_total": self._admitted,
+                "rejected_total": self._rejected,
+                "avg_wait_seconds": round(sum(waits) / len(waits), 2) if waits else 0.0,
+                "p95_wait_seconds": round(waits[int(0.95 * (len(waits) - 1))], 2) if waits else 0.0,
+                "avg_query_seconds": round(self._service_seconds, 1),
+                "median_query_seconds": round(durations[len(durations) // 2], 1) if durations else 0.0,
+            }
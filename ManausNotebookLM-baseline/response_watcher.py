@@ -0,0 +1,117 @@
+"""
+Page-side streaming of the NotebookLM answer text.
+
+process_query used to re-read the whole `.message-content` text every 200ms,
+one WebDriver round trip (plus stale-element retries) per poll whether or not
+anything had changed. ResponseWatcher instead injects a MutationObserver
+that keeps the latest answer text on the page, and drains it with
+execute_async_script as a long poll:
+
+* a drain returns as soon as the text changes (or after `wait` seconds)
+* only the changed tail crosses the wire: the page remembers what Python
+  already has and returns (common prefix length, new tail)
+
+If the page replaces its document (navigation, reload) the state is gone and
+drain() returns None, so the caller can fall back to polling.
+"""
+
+import logging
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# arguments: css selector, number of matching elements before the query
+_INSTALL_SCRIPT = """
+const selector = arguments[0], initialCount = arguments[1];
+const previous = window.__nlmResponseWatch;
+if (previous) previous.observer.disconnect();
+const state = {text: '', confirmed: '', waiter: null};
+const read = () => {
+  const elements = document.querySelectorAll(selector);
+  if (elements.length <= initialCount) return;
+  const text = elements[elements.length - 1].innerText;
+  if (text !== state.text) {
+    state.text = text;
+    if (state.waiter) { const wake = state.waiter; state.waiter = null; wake(); }
+  }
+};
+let scheduled = false;
+state.observer = new MutationObserver(() => {
+  // Coalesce a burst of mutations into one innerText read
+  if (scheduled) return;
+  scheduled = true;
+  setTimeout(() => { scheduled = false; read(); }, 50);
+});
+state.observer.observe(document.body, {childList: true, subtree: true, characterData: true});
+window.__nlmResponseWatch = state;
+read();
+return true;
+"""
+
+# arguments: wait in ms, async callback
+_DRAIN_SCRIPT = """
+const waitMs = arguments[0], done = arguments[arguments.length - 1];
+const state = window.__nlmResponseWatch;
+if (!state) { done(null); return; }
+const flush = () => {
+  const text = state.text, old = state.confirmed;
+  const limit = Math.min(text.length, old.length);
+  let keep = 0;
+  while (keep < limit && text.charCodeAt(keep) === old.charCodeAt(keep)) keep++;
+  state.confirmed = text;
+  done({keep: keep, tail: text.slice(keep)});
+};
+if (state.text !== state.confirmed) { flush(); return; }
+const timer = setTimeout(() => { state.waiter = null; flush(); }, waitMs);
+state.waiter = () => { clearTimeout(timer); flush(); };
+"""
+
+_UNINSTALL_SCRIPT = """
+const state = window.__nlmResponseWatch;
+if (state) { state.observer.disconnect(); delete window.__nlmResponseWatch; }
+"""
+
+
+class ResponseWatcher:
+    """Streams the text of the newest response element via a page-side observer."""
+
+    def __init__(self, driver, css_selector: str, initial_count: int):
+        self.driver = driver
+        self.css_selector = css_selector
+        self.initial_count = initial_count
+        self.text = ""
+        self.round_trips = 0
+
+    def install(self) -> bool:
+        """Start observing; False if the script couldn't be injected."""
+        try:
+            self.driver.execute_script(_INSTALL_SCRIPT, self.css_selector, self.initial_count)
+            self.round_trips += 1
+            self.text = ""  # the page starts from nothing confirmed too
+            return True
+        except Exception as e:
+            logger.warning(f"Could not install response watcher, falling back to polling: {e}")
+            return False
+
+    def drain(self, wait: float) -> Optional[str]:
+        """Full response text, after waiting up to `wait` seconds for a change.
+
+        Returns None if the watcher was lost (the page was replaced).
+        """
+        # The driver's script timeout (30s by default) must exceed the wait
+        try:
+            result = self.driver.execute_async_script(_DRAIN_SCRIPT, int(wait * 1000))
+        except Exception as e:
+            logger.warning(f"Response watcher drain failed: {e}")
+            return None
+        self.round_trips += 1
+        if result is None:
+            return None
+        self.text = self.text[:result["keep"]] + result["tail"]
+        return self.text
+
+    def uninstall(self) -> None:
+        try:
+            self.driver.execute_script(_UNINSTALL_SCRIPT)
+        except Exception:
+            pass
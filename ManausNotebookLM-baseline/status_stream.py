@@ -0,0 +1,177 @@
+"""
+Shared studio-status pollers for the artifact status SSE stream.
+
+Every browser watching a notebook used to poll /api/mcp/status itself, so N
+viewers meant N upstream polls. StatusHub runs at most one poller thread per
+notebook, however many subscribers it has, and fans its results out:
+
+* a new subscriber first gets a full snapshot, then only diffs
+  (added / changed / removed artifacts)
+* the poll interval is short while something is generating and backs off
+  (doubling up to a maximum) while nothing changes
+* the poller stops as soon as its last subscriber leaves
+"""
+
+import logging
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Studio statuses that mean "still generating"
+ACTIVE_STATUSES = {"in_progress", "processing", "pending"}
+
+
+def diff_artifacts(old: Dict[str, Dict[str, Any]], new: Dict[str, Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Changes between two {artifact id: artifact} snapshots, or None if equal."""
+    added = [a for key, a in new.items() if key not in old]
+    changed = [a for key, a in new.items() if key in old and old[key] != a]
+    removed = [key for key in old if key not in new]
+    if not (added or changed or removed):
+        return None
+    return {"added": added, "changed": changed, "removed": removed}
+
+
+class Subscription:
+    """One subscriber's event queue."""
+
+    def __init__(self, notebook_id: str):
+        self.notebook_id = notebook_id
+        self.events: "queue.Queue[Dict[str, Any]]" = queue.Queue()
+
+    def get(self, timeout: float) -> Optional[Dict[str, Any]]:
+        """Next event, or None if nothing arrived within timeout."""
+        try:
+            return self.events.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+
+class NotebookPoller:
+    """Polls one notebook's studio status while it has subscribers."""
+
+    def __init__(self, notebook_id: str, fetch: Callable[[str], List[Dict[str, Any]]],
+                 on_idle: Callable[["NotebookPoller"], None],
+                 min_interval: float, max_interval: float):
+        self.notebook_id = notebook_id
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._fetch = fetch
+        self._on_idle = on_idle
+        self._lock = threading.Lock()
+        self._subscribers: List[Subscription] = []
+        self._snapshot: Optional[Dict[str, Dict[str, Any]]] = None
+        self._wake = threading.Event()
+        self._thread = threading.Thread(target=self._run, name=f"status-poller-{notebook_id}", daemon=True)
+        self.interval = min_interval
+
+    def start(self) -> None:
+        self._thread.start()
+
+    def add(self, sub: Subscription) -> None:
+        with self._lock:
+            self._subscribers.append(sub)
+            if self._snapshot is not None:
+                sub.events.put({"type": "snapshot", "artifacts": list(self._snapshot.values())})
+            # else: the first poll sends everyone a snapshot
+
+    def remove(self, sub: Subscription) -> bool:
+        """Drop a subscriber; returns True if none are left."""
+        with self._lock:
+            if sub in self._subscribers:
+                self._subscribers.remove(sub)
+            empty = not self._subscribers
+        if empty:
+            self._wake.set()  # let the loop notice and exit now
+        return empty
+
+    @property
+    def subscriber_count(self) -> int:
+        with self._lock:
+            return len(self._subscribers)
+
+    def _publish(self, event: Dict[str, Any]) -> None:
+        with self._lock:
+            for sub in self._subscribers:
+                sub.events.put(event)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                if not self._subscribers:
+                    break
+            try:
+                artifacts = self._fetch(self.notebook_id)
+            except Exception as e:
+                logger.warning(f"Status poll for {self.notebook_id} failed: {e}")
+                self._publish({"type": "error", "error": str(e)})
+                self.interval = min(self.interval * 2, self.max_interval)
+            else:
+                current = {a["id"]: a for a in artifacts if a.get("id")}
+                with self._lock:
+                    previous = self._snapshot
+                    self._snapshot = current
+                    if previous is None:
+                        event = {"type": "snapshot", "artifacts": list(current.values())}
+                    else:
+                        changes = diff_artifacts(previous, current)
+                        event = {"type": "diff", **changes} if changes else None
+                if event is not None:
+                    self._publish(event)
+
+                # Poll fast while something is generating or just changed
+                active = any(a.get("status") in ACTIVE_STATUSES for a in current.values())
+                if active or (previous is not None and event is not None):
+                    self.interval = self.min_interval
+                else:
+                    self.interval = min(self.interval * 2, self.max_interval)
+
+            self._wake.wait(self.interval)
+            self._wake.clear()
+        self._on_idle(self)
+
+
+class StatusHub:
+    """At most one NotebookPoller per notebook, shared by all its subscribers."""
+
+    def __init__(self, fetch: Callable[[str], List[Dict[str, Any]]],
+                 min_interval: float = 5.0, max_interval: float = 60.0):
+        self._fetch = fetch
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self._lock = threading.Lock()
+        self._pollers: Dict[str, NotebookPoller] = {}
+
+    def subscribe(self, notebook_id: str) -> Subscription:
+        sub = Subscription(notebook_id)
+        with self._lock:
+            poller = self._pollers.get(notebook_id)
+            if poller is None:
+                poller = NotebookPoller(notebook_id, self._fetch, self._retire, self.min_interval, self.max_interval)
+                self._pollers[notebook_id] = poller
+                poller.add(sub)
+                poller.start()
+            else:
+                poller.add(sub)
+        return sub
+
+    def unsubscribe(self, sub: Subscription) -> None:
+        with self._lock:
+            poller = self._pollers.get(sub.notebook_id)
+            if poller is not None and poller.remove(sub):
+                # Forget it now so a new subscriber starts a fresh poller
+                del self._pollers[sub.notebook_id]
+
+    def _retire(self, poller: NotebookPoller) -> None:
+        with self._lock:
+            if self._pollers.get(poller.notebook_id) is poller:
+                del self._pollers[poller.notebook_id]
+        logger.info(f"Stopped status poller for {poller.notebook_id} (no subscribers)")
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                nb: {"subscribers": p.subscriber_count, "interval": p.interval}
+                for nb, p in self._pollers.items()
+            }
@@ -0,0 +1,151 @@
+"""
+Recognising NotebookLM's "thinking" placeholders ("Reading documents...",
+"Finding key words...") in the answer text.
+
+The phrase and verb tables are compiled once into anchored regexes, so a
+check is one match against the start of the text rather than a loop over
+every phrase on a lowercased copy of the whole answer. Texts too long to be
+a placeholder are rejected by length before any matching.
+
+ThinkingPhraseStripper is the incremental form of strip_thinking_phrase for
+the streaming loop: once the answer has grown past the point where the
+leading placeholder (or its absence) is decided, later calls on the growing
+text only compare that decided prefix.
+"""
+
+import logging
+import re
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+THINKING_PHRASES = [
+    "Thinking",
+    "Reading documents",
+    "Gathering facts",
+    "Parsing the data",
+    "Sifting through pages",
+    "Working on it",
+    "Analyzing",
+    "Checking sources",
+    "Gathering info",
+    "Just a sec",
+    "Assessing relevance",
+    "Searching your docs",
+    "Refining the answer",
+    "Scanning the text",
+    "Scanning your sources",
+    "Finding relevant info",
+    "Finding key words",
+    "Finding connections",
+    "Opening your notes",
+    "Reviewing the content",
+    "Exploring your material",
+    "Checking the scope",
+    "Checking your uploads",
+    "Examining the specifics",
+    "Checking the scope...",
+    "Checking your uploads...",
+    "Examining the specifics...",
+    "Finding key words...",
+    "Finding relevant info...",
+    "Getting the gist",
+    "Getting the gist...",
+    "Reading full chapters",
+    "Reading full chapters..."
+]
+
+# Verbs that mark a short text as a placeholder even if the exact phrase is
+# new to us ("Finding connections...", "Consulting your notes...")
+THINKING_VERBS = [
+    "Finding", "Checking", "Scanning", "Reading", "Getting",
+    "Thinking", "Working", "Parsing", "Sifting", "Analyzing",
+    "Assessing", "Refining", "Reviewing", "Exploring", "Examining",
+    "Gathering", "Consulting"
+]
+
+# Texts shorter than this are checked against THINKING_VERBS
+VERB_HEURISTIC_MAX_LEN = 60
+# A placeholder may carry a few extra characters ("Thinking…", "Analyzing (2)")
+PHRASE_SLACK = 5
+
+_CLEAN_PHRASES = sorted({p.lower().rstrip('.').strip() for p in THINKING_PHRASES}, key=len, reverse=True)
+_MAX_PHRASE_LEN = len(_CLEAN_PHRASES[0])
+
+# Longest phrase first, so a phrase wins over any shorter one it extends
+_PHRASE_PATTERN = '|'.join(re.escape(p) for p in _CLEAN_PHRASES)
+_LEADING_PHRASE_RE = re.compile(f'(?:{_PHRASE_PATTERN})[.\\s]*', re.IGNORECASE)
+_PHRASE_PREFIX_RE = re.compile(f'(?:{_PHRASE_PATTERN})', re.IGNORECASE)
+_VERB_ANYWHERE_RE = re.compile('|'.join(re.escape(v) for v in THINKING_VERBS), re.IGNORECASE)
+_LEADING_VERB_RE = re.compile(f"\\s*(?:{'|'.join(re.escape(v) for v in THINKING_VERBS)})")
+
+
+def is_only_thinking_phrase(text: str) -> bool:
+    """
+    Checks if the given text contains ONLY thinking phrases (and nothing else).
+    Returns True if yes, False if there's actual content.
+    """
+    if not text:
+        return False
+    cleaned = text.strip().rstrip('.')
+    if not cleaned:
+        return False
+    # A known phrase, possibly with a few extra characters
+    if len(cleaned) <= _MAX_PHRASE_LEN + PHRASE_SLACK:
+        match = _PHRASE_PREFIX_RE.match(cleaned)
+        if match and len(cleaned) <= match.end() + PHRASE_SLACK:
+            return True
+    # Heuristic: a thinking verb anywhere in short text (in, not startswith,
+    # to get past invisible characters at the start)
+    if len(text) < VERB_HEURISTIC_MAX_LEN:
+        match = _VERB_ANYWHERE_RE.search(text)
+        if match:
+            logger.debug(f"Heuristic thinking phrase match: '{text}' (contains {match.group(0)})")
+            return True
+    return False
+
+
+def _thinking_prefix_length(text: str) -> Optional[int]:
+    """Characters of leading placeholder (with its dots/spaces) to drop; None if the whole text is one."""
+    match = _LEADING_PHRASE_RE.match(text)
+    if match:
+        return match.end()
+    if len(text) < VERB_HEURISTIC_MAX_LEN and _LEADING_VERB_RE.match(text):
+        # Looks like a short thinking sentence: treat as empty
+        return None
+    return 0
+
+
+def strip_thinking_phrase(text: str) -> str:
+    """
+    Removes any leading thinking phrase from the text.
+    Returns the clean text.
+    """
+    cut = _thinking_prefix_length(text)
+    if cut is None:
+        return ""
+    return text[cut:] if cut else text
+
+
+class ThinkingPhraseStripper:
+    """strip_thinking_phrase for a text that keeps growing (the streamed answer)."""
+
+    def __init__(self):
+        self._decided: Optional[str] = None  # prefix that fixes the cut
+        self._cut = 0
+
+    def strip(self, text: str) -> str:
+        if self._decided is not None and text.startswith(self._decided):
+            return text[self._cut:] if self._cut else text
+        cut = _thinking_prefix_length(text)
+        if cut is None:
+            return ""
+        # The cut can't change any more once the text is past the verb
+        # heuristic and the longest phrase, and something other than the
+        # placeholder's dots/spaces follows it
+        if len(text) >= VERB_HEURISTIC_MAX_LEN and cut < len(text):
+            self._decided = text[:max(cut + 1, _MAX_PHRASE_LEN + 1)]
+            self._cut = cut
+        else:
+            self._decided = None
+        return text[cut:] if cut else text
@@ -36,6 +36,51 @@ interface BrainstormData {
     groups: BrainstormGroup[];
 }
 
+/**
+ * Reads an OpenAI-style streamed chat completion ("stream": true) and passes
+ * the text so far to onText as deltas arrive (at most every 100ms).
+ * Returns the complete text.
+ */
+const readChatCompletionStream = async (response: Response, onText: (text: string) => void): Promise<string> => {
+    const reader = response.body?.getReader();
+    if (!reader) throw new Error("Response body is not readable");
+
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let text = '';
+    let lastUpdate = 0;
+
+    // eslint-disable-next-line no-constant-condition
+    while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop() || '';
+
+        for (const line of lines) {
+            const payload = line.trim();
+            if (!payload.startsWith('data:')) continue;
+            const data = payload.slice(5).trim();
+            if (data === '[DONE]') continue;
+            try {
+                text += JSON.parse(data).choices?.[0]?.delta?.content || '';
+            } catch (e) {
+                console.error("Error parsing completion chunk:", e);
+            }
+        }
+
+        const now = Date.now();
+        if (now - lastUpdate > 100) {
+            onText(text);
+            lastUpdate = now;
+        }
+    }
+    onText(text);
+    return text;
+};
+
 const AIQueryRefinementModal: React.FC<AIQueryRefinementModalProps> = ({ initialText, onClose, onPaste }) => {
     // Helper to load from localStorage with fallback
     const usePersistedState = <T,>(key: string, initialValue: T): [T, React.Dispatch<React.SetStateAction<T>>] => {
@@ -707,7 +752,7 @@ Important:
                             { role: "system", content: "You are a helpful AI assistant." },
                             { role: "user", content: fullPrompt }
                         ],
-                        stream: false,
+                        stream: true,
                         temperature: 0.7
                     })
                 });
@@ -725,6 +770,12 @@ Important:
                     }
                 }
 
+                if (contentType && contentType.includes('text/event-stream')) {
+                    const text = await readChatCompletionStream(response, setGeneratedResponse);
+                    setGeneratedResponse(text || "No response generated.");
+                    return;
+                }
+
                 if (!contentType || !contentType.includes('application/json')) {
                     throw new Error("Received HTML instead of JSON. This usually means the API proxy is not working (e.g., on static hosting).");
                 }
@@ -759,10 +810,16 @@ Important:
                         notebooklm_url: notebookUrl,
                         query: fullPrompt,
                         timeout: 300,
-                        dev_mode: devMode  // Pass dev mode flag to backend
+                        dev_mode: devMode,  // Pass dev mode flag to backend
+                        user_id: userId  // Labels queue logs; fairness is per client address
                     })
                 });
 
+                if (response.status === 429) {
+                    // Query queue is full; the backend says when to retry
+                    const errData = await response.json().catch(() => ({}));
+                    throw new Error(errData.error || 'NotebookLM is busy, please try again shortly.');
+                }
                 if (!response.ok) {
                     throw new Error(`API Error: ${response.statusText}`);
                 }
@@ -805,6 +862,10 @@ Important:
                                         // Also ensure VNC is visible
                                         setIsVNCVisible(true);
                                     }
+                                    // Waiting for a free browser: show the queue position
+                                    if (data.status === 'queued' && !currentText) {
+                                        setGeneratedResponse(`Queued for NotebookLM: position ${data.position}, about ${data.eta_seconds}s`);
+                                    }
 
                                     console.log("Status:", data.status, data.message);
                                 } else if (data.error) {
@@ -838,7 +899,7 @@ Important:
                             { role: "system", content: "You are a helpful AI assistant." },
                             { role: "user", content: fullPrompt }
                         ],
-                        stream: false
+                        stream: true
                     })
                 });
 
@@ -854,6 +915,11 @@ Important:
                         throw new Error(`API Error (${response.status}): ${errText.slice(0, 100)}...`);
                     }
                 }
+                if (contentType && contentType.includes('text/event-stream')) {
+                    const text = await readChatCompletionStream(response, setGeneratedResponse);
+                    setGeneratedResponse(text || "No response generated.");
+                    return;
+                }
                 const data = await response.json();
                 setGeneratedResponse(data.choices?.[0]?.message?.content || "No response generated.");
 
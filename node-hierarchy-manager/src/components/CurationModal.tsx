@@ -1,7 +1,7 @@
 import React, { useState, useEffect, useMemo, useRef } from 'react';
 import { NotebookLMService } from '../services/NotebookLMService';
 import type { NotebookLMNotebook } from '../services/NotebookLMService';
-import { McpService } from '../services/McpService';
+import { McpService, ArtifactJobError } from '../services/McpService';
 import type { DocumentNode } from '../types';
 
 interface CurationModalProps {
@@ -19,6 +19,9 @@ export const CurationModal: React.FC<CurationModalProps> = ({ node, onClose /*,
     const [isDropdownOpen, setIsDropdownOpen] = useState(false);
     const dropdownRef = useRef<HTMLDivElement>(null);
     const isMountedRef = useRef(false); // Track if component has mounted
+    // Idempotency key of a generation whose outcome is unknown (e.g. network
+    // error): generating again with the same request reuses it
+    const pendingGenerationRef = useRef<{ key: string; request: string } | null>(null);
 
     // 2. Artifact Configuration State
     // Initialize from localStorage to prevent race condition
@@ -129,15 +132,24 @@ export const CurationModal: React.FC<CurationModalProps> = ({ node, onClose /*,
         // Construct final title
         const finalTitle = `${subjectArea ? subjectArea + ' - ' : ''}${artifactDetailName || 'Artifact'}`;
 
+        const params = {
+            notebook_id: selectedNotebookId,
+            artifact_type: artifactType,
+            prompt: promptText,
+            title: finalTitle,
+            node_id: node.nodeID // Pass the hierarchy node ID
+        };
+        // One key per user action; a retry of the same request keeps it
+        const request = JSON.stringify(params);
+        const pending = pendingGenerationRef.current?.request === request
+            ? pendingGenerationRef.current
+            : { key: crypto.randomUUID(), request };
+        pendingGenerationRef.current = pending;
+
         try {
             // Call McpService to start generation and polling
-            await McpService.createArtifact({
-                notebook_id: selectedNotebookId,
-                artifact_type: artifactType,
-                prompt: promptText,
-                title: finalTitle,
-                node_id: node.nodeID // Pass the hierarchy node ID
-            });
+            await McpService.createArtifact(params, pending.key);
+            pendingGenerationRef.current = null;
 
             setStatusMessage('Generation successfully started!');
             // "stop the process after artifact started generating - do not download and do not display"
@@ -148,6 +160,9 @@ export const CurationModal: React.FC<CurationModalProps> = ({ node, onClose /*,
 
         } catch (err: any) {
             console.error('Generation failed:', err);
+            if (err instanceof ArtifactJobError) {
+                pendingGenerationRef.current = null; // settled: a retry is a new action
+            }
             setStatusMessage('');
             alert('Generation failed: ' + (err.response?.data?.error || err.message));
         } finally {
@@ -26,6 +26,29 @@ export interface StudioStatusResponse {
     artifacts: any[];
 }
 
+export interface ArtifactJob {
+    job_id: string;
+    job_status: 'queued' | 'running' | 'succeeded' | 'failed';
+    artifact_type: string;
+    notebook_id: string;
+    result?: any;
+    error?: string;
+}
+
+/**
+ * The server gave a definite answer: the request was rejected or the job failed.
+ * Retrying with the same Idempotency-Key would only return the same job, so a
+ * retry of the user's action needs a new key.
+ */
+export class ArtifactJobError extends Error {}
+
+// POST attempts for one createArtifact call when the outcome is unknown
+// (network error or gateway error)
+const SUBMIT_ATTEMPTS = 3;
+
+const isRetryableSubmitError = (err: any): boolean =>
+    axios.isAxiosError(err) && (!err.response || [502, 503, 504].includes(err.response.status));
+
 export const McpService = {
     async listNotebooks(): Promise<Notebook[]> {
         const response = await axios.get(`${API_BASE_URL}/api/mcp/notebooks`);
@@ -36,8 +59,13 @@ export const McpService = {
     },
 
     /**
-     * Creates an artifact and starts a background poller to track its status.
+     * Creates an artifact and tracks its status in the background.
      * When complete, it inserts the record into Supabase.
+     *
+     * idempotencyKey identifies the user's action: create it once per action
+     * and pass the same key when retrying it, so the server returns the job
+     * it already queued instead of generating the artifact twice. After an
+     * ArtifactJobError the action is settled and a new attempt needs a new key.
      */
     async createArtifact(params: {
         notebook_id: string;
@@ -45,15 +73,60 @@ export const McpService = {
         title: string;
         node_id?: number | null; // Optional node ID from hierarchy
         [key: string]: any; // Allow other params
-    }): Promise<any> {
-        const response = await axios.post(`${API_BASE_URL}/api/mcp/generate_artifact`, params);
+    }, idempotencyKey: string): Promise<any> {
+        const response = await this.submitArtifactJob(params, idempotencyKey);
+
+        if (response.data.status !== 'accepted') {
+            throw new ArtifactJobError(response.data.error || 'Failed to create artifact');
+        }
+
+        // Wait until NotebookLM has accepted the generation request
+        const job = await this.waitForJob(response.data.job_id);
+        if (job.job_status === 'failed') {
+            throw new ArtifactJobError(job.error || 'Failed to create artifact');
+        }
+
+        // Fire and Forget: Start polling in background
+        this.startPolling(params.notebook_id, params.artifact_type, params.title, params.node_id);
+        return job.result;
+    },
+
+    async submitArtifactJob(params: Record<string, any>, idempotencyKey: string) {
+        // The server queues the job (202); the key makes a retried POST reuse it
+        for (let attempt = 1; ; attempt++) {
+            try {
+                return await axios.post(`${API_BASE_URL}/api/mcp/generate_artifact`, params, {
+                    headers: { 'Idempotency-Key': idempotencyKey },
+                });
+            } catch (err: any) {
+                if (attempt >= SUBMIT_ATTEMPTS || !isRetryableSubmitError(err)) {
+                    throw err;
+                }
+                await new Promise(resolve => setTimeout(resolve, 1000 * attempt));
+            }
+        }
+    },
 
+    async getJob(jobId: string): Promise<ArtifactJob> {
+        const response = await axios.get(`${API_BASE_URL}/api/mcp/jobs/${jobId}`);
         if (response.data.status === 'success') {
-            // Fire and Forget: Start polling in background
-            this.startPolling(params.notebook_id, params.artifact_type, params.title, params.node_id);
             return response.data;
         }
-        throw new Error(response.data.error || 'Failed to create artifact');
+        throw new Error(response.data.error || 'Failed to get job');
+    },
+
+    async waitForJob(jobId: string, intervalMs = 1000, timeoutMs = 5 * 60 * 1000): Promise<ArtifactJob> {
+        const deadline = Date.now() + timeoutMs;
+        while (true) {
+            const job = await this.getJob(jobId);
+            if (job.job_status === 'succeeded' || job.job_status === 'failed') {
+                return job;
+            }
+            if (Date.now() >= deadline) {
+                throw new Error('Timed out waiting for artifact generation to start');
+            }
+            await new Promise(resolve => setTimeout(resolve, intervalMs));
+        }
     },
 
     async getStatus(notebookId: string): Promise<any[]> {
@@ -90,57 +163,68 @@ export const McpService = {
         return blob;
     },
 
-    // --- Background Polling Logic ---
-
-    startPolling(notebookId: string, artifactType: string, title: string, nodeId?: number | null) {
-        console.log(`[McpService] Starting background polling for ${artifactType} in ${notebookId}`);
-
-        const POLL_INTERVAL = 10000; // 10 seconds
-        const MAX_ATTEMPTS = 60; // 10 minutes total
-        let attempts = 0;
-
-        const poll = async () => {
-            attempts++;
-            try {
-                const artifacts = await this.getStatus(notebookId);
-
-                // Find the most recent artifact of this type
-                // Logic: Filter by type, sort by creation time (or assume API returns newest first)
-                // Note: The API returns artifacts with 'created_at' timestamp
-
-                // Simple heuristic: Look for a completed artifact created in the last few minutes
-                // Or just look for the newest one and see if it's completed
-
-                // Map frontend types to backend types if needed, or rely on string match
-                // We'll trust the list is sorted by recent
-                const match = artifacts.find(a =>
-                    (a.type === artifactType || artifactType.includes(a.type)) &&
-                    (a.status === 'completed')
-                );
-
-                if (match) {
-                    console.log(`[McpService] Artifact found and completed:`, match);
-                    await this.saveToSupabase(notebookId, match, title, nodeId);
-                    return; // Stop polling
-                }
-
-                if (attempts >= MAX_ATTEMPTS) {
-                    console.log(`[McpService] Polling timed out for ${notebookId}`);
-                    return;
-                }
-
-                // Continue polling
-                setTimeout(poll, POLL_INTERVAL);
+    // --- Background Status Tracking ---
 
-            } catch (err) {
-                console.error(`[McpService] Polling error:`, err);
-                // Retry even on error, unless max attempts reached
-                if (attempts < MAX_ATTEMPTS) setTimeout(poll, POLL_INTERVAL);
+    /**
+     * Subscribes to the server's status stream for a notebook. The server
+     * shares one upstream poller per notebook and sends a snapshot followed
+     * by diffs; onArtifacts gets the full current list after each event.
+     * Returns a function that closes the stream.
+     */
+    watchStatus(notebookId: string, onArtifacts: (artifacts: any[]) => void): () => void {
+        const source = new EventSource(`${API_BASE_URL}/api/mcp/status/${notebookId}/stream`);
+        const artifacts = new Map<string, any>();
+
+        source.onmessage = (message) => {
+            const event = JSON.parse(message.data);
+            if (event.type === 'snapshot') {
+                artifacts.clear();
+                event.artifacts.forEach((a: any) => artifacts.set(a.id, a));
+            } else if (event.type === 'diff') {
+                [...event.added, ...event.changed].forEach((a: any) => artifacts.set(a.id, a));
+                event.removed.forEach((id: string) => artifacts.delete(id));
+            } else {
+                console.error(`[McpService] Status stream error:`, event.error);
+                return;
             }
+            onArtifacts([...artifacts.values()]);
         };
+        // EventSource reconnects by itself after network errors
+
+        return () => source.close();
+    },
 
-        // Start the first poll after a delay to allow backend to initialize the task
-        setTimeout(poll, POLL_INTERVAL);
+    startPolling(notebookId: string, artifactType: string, title: string, nodeId?: number | null) {
+        console.log(`[McpService] Watching status of ${artifactType} in ${notebookId}`);
+
+        const MAX_WAIT = 10 * 60 * 1000; // 10 minutes total
+        let done = false;
+
+        const stop = this.watchStatus(notebookId, async (artifacts) => {
+            if (done) return;
+
+            // Map frontend types to backend types if needed, or rely on string match
+            // We'll trust the list is sorted by recent
+            const match = artifacts.find(a =>
+                (a.type === artifactType || artifactType.includes(a.type)) &&
+                (a.status === 'completed')
+            );
+
+            if (match) {
+                done = true;
+                stop();
+                clearTimeout(timer);
+                console.log(`[McpService] Artifact found and completed:`, match);
+                await this.saveToSupabase(notebookId, match, title, nodeId);
+            }
+        });
+
+        const timer = setTimeout(() => {
+            if (done) return;
+            done = true;
+            stop();
+            console.log(`[McpService] Status tracking timed out for ${notebookId}`);
+        }, MAX_WAIT);
     },
 
     async saveToSupabase(notebookId: string, artifact: any, title: string, nodeId?: number | null) {
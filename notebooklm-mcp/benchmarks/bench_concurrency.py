@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""Load test: concurrent tool calls against one MCP server.
+
+Fires --calls notebook_query calls at once through an in-memory FastMCP client
+and reports throughput. The NotebookLM client is replaced by a fake whose
+query() blocks for --latency seconds (like a real httpx call), so no network
+or credentials are needed.
+
+Two servers are compared:
+- async: the real server (tool bodies offloaded to the bounded tool pool)
+- blocking: the same tool body run directly on the event loop, which is what
+  a sync tool does on FastMCP versions without thread offloading
+
+Usage:
+    python benchmarks/bench_concurrency.py
+    python benchmarks/bench_concurrency.py --calls 32 --latency 0.5
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from fastmcp import Client, FastMCP
+
+from notebooklm_mcp import server
+from notebooklm_mcp.pool import ClientPool
+
+
+class _FakeClient:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def query(self, notebook_id, query_text, source_ids=None, conversation_id=None,
+              use_cache=True, on_answer=None):
+        time.sleep(self.latency)
+        return {"answer": f"answer for {notebook_id}", "conversation_id": "c", "cached": False}
+
+
+async def _run(mcp: FastMCP, calls: int) -> float:
+    async with Client(mcp) as client:
+        start = time.perf_counter()
+        results = await asyncio.gather(*(
+            client.call_tool("notebook_query", {"notebook_id": f"nb{i}", "query": "q"})
+            for i in range(calls)
+        ))
+        elapsed = time.perf_counter() - start
+    failed = [r for r in results if r.data.get("status") != "success"]
+    if failed:
+        raise RuntimeError(f"{len(failed)} calls failed: {failed[0].data}")
+    return elapsed
+
+
+def _blocking_server() -> FastMCP:
+    """Same tool body, but blocking the event loop while it runs."""
+    mcp = FastMCP(name="blocking")
+    body = server.notebook_query.__wrapped__
+
+    @mcp.tool()
+    async def notebook_query(notebook_id: str, query: str) -> dict:
+        return body(notebook_id, query)
+
+    return mcp
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Load test concurrent MCP tool calls")
+    parser.add_argument("--calls", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.25, help="Seconds per fake NotebookLM request")
+    args = parser.parse_args()
+
+    server._pool = ClientPool(["default"], lambda profile: _FakeClient(args.latency))
+    workers = server._tool_executor._max_workers
+
+    print(f"{args.calls} concurrent notebook_query calls, {args.latency}s each, tool pool={workers}")
+    rows = [
+        ("blocking", _blocking_server()),
+        ("async", server.mcp),
+    ]
+    baseline = None
+    for name, mcp in rows:
+        elapsed = asyncio.run(_run(mcp, args.calls))
+        throughput = args.calls / elapsed
+        baseline = baseline or throughput
+        print(f"  {name:9} {elapsed:6.2f}s  {throughput:6.1f} calls/s  x{throughput / baseline:4.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""Compare JSON backends on batchexecute-shaped payloads.
+
+Runs the client's real parse/build paths (_parse_response, _extract_rpc_result,
+_parse_query_response, _build_request_body) once per installed backend.
+
+Usage:
+    python benchmarks/bench_json.py
+    python benchmarks/bench_json.py --fixture captured_list.txt --query-fixture captured_query.txt
+
+Fixtures are raw response bodies (starting with )]}') captured from DevTools:
+--fixture for batchexecute RPCs, --query-fixture for GenerateFreeFormStreamed.
+Without --fixture, synthetic payloads sized like a large account are used.
+"""
+
+import argparse
+import json
+import os
+import random
+import string
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from notebooklm_mcp import codec
+from notebooklm_mcp.api_client import NotebookLMClient
+
+
+def _rand_text(n: int) -> str:
+    return "".join(random.choice(string.ascii_letters + "   ") for _ in range(n))
+
+
+def _frame(rpc_id: str | None, payload) -> str:
+    """Wrap a payload in a single wrb.fr frame with its byte count line."""
+    chunk = json.dumps([["wrb.fr", rpc_id, json.dumps(payload), None, None, None, "generic"]])
+    return f"{len(chunk)}\n{chunk}\n"
+
+
+def synthetic_list_response(notebooks: int = 300, sources: int = 20) -> str:
+    data = []
+    for _ in range(notebooks):
+        data.append([
+            _rand_text(40),
+            [[[_rand_text(36)], _rand_text(60), [None, 1, [1735000000, 0]]] for _ in range(sources)],
+            _rand_text(36),
+            None,
+            None,
+            [1, False, True, None, None, [1735000000, 0], None, None, [1734000000, 0]],
+        ])
+    return ")]}'\n" + _frame(NotebookLMClient.RPC_LIST_NOTEBOOKS, [data])
+
+
+def synthetic_query_response(chunks: int = 150, step: int = 80) -> str:
+    body = ")]}'\n"
+    answer = ""
+    for i in range(chunks):
+        answer += _rand_text(step)
+        kind = 2 if i < 5 else 1
+        body += _frame(None, [[answer, None, [], None, [[], None, None, None, kind]]])
+    return body
+
+
+def _bench(fn, repeat: int) -> float:
+    fn()  # warm-up
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark JSON backends")
+    parser.add_argument("--fixture", action="append", default=[], help="Raw batchexecute response body")
+    parser.add_argument("--query-fixture", action="append", default=[], help="Raw streamed query response body")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    random.seed(42)
+    # name -> (is_query, raw response text)
+    workloads = {}
+    for is_query, paths in ((False, args.fixture), (True, args.query_fixture)):
+        for path in paths:
+            with open(path, encoding="utf-8") as f:
+                workloads[os.path.basename(path)] = (is_query, f.read())
+    if not workloads:
+        workloads["list_notebooks(300x20)"] = (False, synthetic_list_response())
+        workloads["query_stream(150 chunks)"] = (True, synthetic_query_response())
+
+    # Bypass __init__ (it fetches the homepage); only the pure helpers are used
+    client = NotebookLMClient.__new__(NotebookLMClient)
+    client.csrf_token = "AAAA:1700000000000"
+    request_params = [[[[_rand_text(36)]] for _ in range(50)], _rand_text(400), None, [2, None, [1]], _rand_text(36)]
+
+    backends = codec.available_backends()
+    print(f"Backends: {', '.join(backends)}  (repeat={args.repeat})")
+    print()
+
+    results: dict[str, dict[str, float]] = {}
+    for backend in backends:
+        codec.use(backend)
+        row = {}
+        for name, (is_query, text) in workloads.items():
+            if is_query:
+                row[name] = _bench(lambda text=text: client._parse_query_response(text), args.repeat)
+            else:
+                def parse_rpc(text=text):
+                    parsed = client._parse_response(text)
+                    for chunk in parsed:
+                        for item in chunk if isinstance(chunk, list) else []:
+                            if isinstance(item, list) and len(item) > 2 and item[0] == "wrb.fr":
+                                client._extract_rpc_result(parsed, item[1])
+                row[name] = _bench(parse_rpc, args.repeat)
+        row["build_request_body"] = _bench(
+            lambda: client._build_request_body(NotebookLMClient.RPC_GET_NOTEBOOK, request_params),
+            args.repeat * 50,
+        )
+        results[backend] = row
+
+    baseline = results.get("json", {})
+    width = max(len(n) for n in next(iter(results.values())))
+    print(f"{'workload'.ljust(width)}  " + "  ".join(f"{b:>16}" for b in backends))
+    for name in next(iter(results.values())):
+        cells = []
+        for backend in backends:
+            ms = results[backend][name]
+            speedup = baseline.get(name, ms) / ms if ms else 0
+            cells.append(f"{ms:8.3f}ms x{speedup:4.1f}")
+        print(f"{name.ljust(width)}  " + "  ".join(f"{c:>16}" for c in cells))
+
+    codec.use()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
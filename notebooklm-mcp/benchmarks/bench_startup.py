@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""Measure MCP server cold start.
+
+Two numbers are reported:
+
+1. Import time of notebooklm_mcp.server (python -X importtime), with the
+   heaviest modules listed so regressions are easy to attribute.
+2. Time to first tool response: spawn `python -m notebooklm_mcp.server` over
+   stdio, perform the MCP handshake and call one tool. Without credentials the
+   tool returns an auth error, which still measures server start-up.
+
+Usage:
+    python benchmarks/bench_startup.py
+    python benchmarks/bench_startup.py --runs 5 --max-import-ms 2000 --max-first-response-ms 5000
+
+Exits non-zero when a --max-* budget is exceeded, so it can gate CI.
+"""
+
+import argparse
+import json
+import os
+import queue
+import statistics
+import subprocess
+import sys
+import threading
+import time
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src")
+
+
+def _env() -> dict[str, str]:
+    env = os.environ.copy()
+    env["PYTHONPATH"] = f"{SRC_DIR}{os.pathsep}{env.get('PYTHONPATH', '')}"
+    return env
+
+
+def measure_import(top: int = 10) -> tuple[float, list[tuple[float, str]]]:
+    """Return (total ms, [(self ms, module), ...]) for importing the server."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import notebooklm_mcp.server"],
+        capture_output=True,
+        text=True,
+        env=_env(),
+        check=True,
+    )
+    total_us = 0
+    modules = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            self_us, cumulative_us = int(parts[0]), int(parts[1])
+        except ValueError:
+            continue  # header line
+        name = parts[2].strip()
+        modules.append((self_us / 1000, name))
+        if name == "notebooklm_mcp.server":
+            total_us = cumulative_us
+    modules.sort(reverse=True)
+    return total_us / 1000, modules[:top]
+
+
+class _StdioSession:
+    """Minimal newline-delimited JSON-RPC client for an MCP stdio server."""
+
+    def __init__(self, cmd: list[str]):
+        self.proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            env=_env(),
+        )
+        self._lines: queue.Queue[str] = queue.Queue()
+        threading.Thread(target=self._pump, daemon=True).start()
+
+    def _pump(self) -> None:
+        for line in self.proc.stdout:
+            self._lines.put(line)
+
+    def send(self, message: dict) -> None:
+        self.proc.stdin.write(json.dumps(message) + "\n")
+        self.proc.stdin.flush()
+
+    def wait_for(self, request_id: int, timeout: float) -> dict:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutError(f"No response to request {request_id} within {timeout}s")
+            try:
+                line = self._lines.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                continue  # stray print() output
+            if message.get("id") == request_id:
+                return message
+
+    def close(self) -> None:
+        self.proc.kill()
+        self.proc.wait()
+
+
+def measure_first_response(tool: str, arguments: dict, timeout: float) -> tuple[float, float]:
+    """Return (ms to initialize result, ms to first tool result) from process spawn."""
+    start = time.perf_counter()
+    session = _StdioSession([sys.executable, "-m", "notebooklm_mcp.server"])
+    try:
+        session.send({
+            "jsonrpc": "2.0",
+            "id": 1,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": "2025-06-18",
+                "capabilities": {},
+                "clientInfo": {"name": "bench_startup", "version": "0"},
+            },
+        })
+        session.wait_for(1, timeout)
+        initialized_ms = (time.perf_counter() - start) * 1000
+
+        session.send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        session.send({
+            "jsonrpc": "2.0",
+            "id": 2,
+            "method": "tools/call",
+            "params": {"name": tool, "arguments": arguments},
+        })
+        session.wait_for(2, timeout)
+        first_response_ms = (time.perf_counter() - start) * 1000
+    finally:
+        session.close()
+    return initialized_ms, first_response_ms
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark MCP server cold start")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--tool", default="notebook_list")
+    parser.add_argument("--arguments", default='{"max_results": 1}', help="Tool arguments as JSON")
+    parser.add_argument("--timeout", type=float, default=60.0)
+    parser.add_argument("--max-import-ms", type=float, default=None)
+    parser.add_argument("--max-first-response-ms", type=float, default=None)
+    args = parser.parse_args()
+
+    import_runs = []
+    heaviest = []
+    for _ in range(args.runs):
+        total, heaviest = measure_import()
+        import_runs.append(total)
+    import_ms = statistics.median(import_runs)
+
+    print(f"Import notebooklm_mcp.server: median {import_ms:.0f}ms over {args.runs} runs")
+    print("Heaviest modules (self time, last run):")
+    for self_ms, name in heaviest:
+        print(f"  {self_ms:8.1f}ms  {name}")
+    print()
+
+    init_runs, first_runs = [], []
+    for _ in range(args.runs):
+        init_ms, first_ms = measure_first_response(args.tool, json.loads(args.arguments), args.timeout)
+        init_runs.append(init_ms)
+        first_runs.append(first_ms)
+    first_ms = statistics.median(first_runs)
+
+    print(f"Spawn -> initialize result:   median {statistics.median(init_runs):.0f}ms")
+    print(f"Spawn -> first '{args.tool}' result: median {first_ms:.0f}ms")
+
+    failed = False
+    if args.max_import_ms is not None and import_ms > args.max_import_ms:
+        print(f"FAIL: import time {import_ms:.0f}ms exceeds budget {args.max_import_ms:.0f}ms")
+        failed = True
+    if args.max_first_response_ms is not None and first_ms > args.max_first_response_ms:
+        print(f"FAIL: first response {first_ms:.0f}ms exceeds budget {args.max_first_response_ms:.0f}ms")
+        failed = True
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
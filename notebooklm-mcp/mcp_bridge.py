@@ -1,8 +1,22 @@
+"""Bridge between the Flask backend and notebooklm_mcp.
+
+Two ways to run it:
+
+- One shot: `mcp_bridge.py --json-input` reads one JSON command from stdin,
+  prints one JSON result and exits.
+- Worker: `mcp_bridge.py --serve` (stdin/stdout) or `--socket PATH` (Unix
+  socket) stays up with a warm client and speaks JSON lines. Each request is
+  {"id": ..., "command": ..., ...} and each reply is {"id": ..., "result": {...}}.
+  Requests are handled concurrently, so replies can arrive out of order.
+"""
+
 import sys
 import os
 import json
+import threading
 import traceback
 import argparse
+from concurrent.futures import ThreadPoolExecutor
 
 # Add src to path so we can import notebooklm_mcp
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,7 +24,8 @@ src_path = os.path.join(current_dir, 'src')
 sys.path.append(src_path)
 
 try:
-    from notebooklm_mcp.server import get_client
+    from notebooklm_mcp import codec
+    from notebooklm_mcp.server import get_client, warm_client_in_background
 except ImportError:
     print(json.dumps({"status": "error", "error": "Could not import notebooklm_mcp.server. Check python path."}))
     sys.exit(1)
@@ -140,6 +155,90 @@ def poll_status(nb_id):
     except Exception as e:
         return {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
 
+def handle_command(input_data):
+    """Run one JSON command and return its result dict."""
+    command = input_data.get('command')
+    if command == 'ping':
+        return {"status": "success", "pid": os.getpid()}
+    elif command == 'list':
+        return list_notebooks()
+    elif command == 'query':
+        n_id = input_data.get('notebook_id')
+        q_text = input_data.get('query')
+        if not n_id or not q_text:
+            return {"status": "error", "error": "Missing notebook_id or query in JSON input"}
+        return query_notebook(n_id, q_text)
+    elif command == 'create':
+        return create_artifact(input_data)
+    elif command == 'status':
+        n_id = input_data.get('notebook_id')
+        if not n_id:
+            return {"status": "error", "error": "Missing notebook_id"}
+        return poll_status(n_id)
+    return {"status": "error", "error": f"Unknown command in JSON: {command}"}
+
+def serve_lines(rfile, wfile, workers=4):
+    """Answer JSON-line requests from rfile on wfile until EOF."""
+    write_lock = threading.Lock()
+
+    def reply(request_id, result):
+        line = codec.dumps({"id": request_id, "result": result}) + "\n"
+        with write_lock:
+            wfile.write(line)
+            wfile.flush()
+
+    def run(request_id, input_data):
+        try:
+            result = handle_command(input_data)
+        except Exception as e:
+            result = {"status": "error", "error": str(e), "traceback": traceback.format_exc()}
+        try:
+            reply(request_id, result)
+        except (BrokenPipeError, ValueError, OSError):
+            pass  # the caller went away
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bridge") as executor:
+        for line in rfile:
+            if not line.strip():
+                continue
+            try:
+                input_data = codec.loads(line)
+            except codec.JSONDecodeError:
+                reply(None, {"status": "error", "error": "Invalid JSON input"})
+                continue
+            if not isinstance(input_data, dict):
+                reply(None, {"status": "error", "error": "JSON input must be an object"})
+                continue
+            executor.submit(run, input_data.get('id'), input_data)
+
+def serve_stdio(workers):
+    # Library warnings go to stderr; stdout carries only protocol lines
+    out = sys.stdout
+    sys.stdout = sys.stderr
+    warm_client_in_background()
+    serve_lines(sys.stdin, out, workers)
+
+def serve_socket(path, workers):
+    import socketserver
+
+    class Handler(socketserver.StreamRequestHandler):
+        def handle(self):
+            rfile = self.connection.makefile('r', encoding='utf-8')
+            wfile = self.connection.makefile('w', encoding='utf-8')
+            serve_lines(rfile, wfile, workers)
+
+    class Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        daemon_threads = True
+
+    if os.path.exists(path):
+        os.unlink(path)
+    sys.stdout = sys.stderr
+    warm_client_in_background()
+    with Server(path, Handler) as server:
+        os.chmod(path, 0o600)
+        print(f"mcp_bridge listening on {path}", file=sys.stderr)
+        server.serve_forever()
+
 def main():
     parser = argparse.ArgumentParser(description="Bridge to NotebookLM MCP")
     parser.add_argument('command', choices=['list', 'query', 'create', 'status'], nargs='?', help="Command to execute")
@@ -149,34 +248,26 @@ def main():
     # If using stdin for args (safer for long queries):
     parser.add_argument('--json-input', action='store_true', help="Read arguments from JSON stdin")
 
+    # Long-lived worker modes
+    parser.add_argument('--serve', action='store_true', help="Serve JSON-line requests on stdin/stdout")
+    parser.add_argument('--socket', help="Serve JSON-line requests on this Unix socket path")
+    parser.add_argument('--workers', type=int, default=4, help="Concurrent requests per worker (default: 4)")
+
     args = parser.parse_args()
+
+    if args.socket:
+        serve_socket(args.socket, args.workers)
+        return
+    if args.serve:
+        serve_stdio(args.workers)
+        return
     
     result = {"status": "error", "error": "Unknown command"}
 
     if args.json_input:
         try:
-            input_data = json.load(sys.stdin)
-            command = input_data.get('command')
-            if command == 'list':
-                result = list_notebooks()
-            elif command == 'query':
-                n_id = input_data.get('notebook_id')
-                q_text = input_data.get('query')
-                if not n_id or not q_text:
-                     result = {"status": "error", "error": "Missing notebook_id or query in JSON input"}
-                else:
-                    result = query_notebook(n_id, q_text)
-            elif command == 'create':
-                result = create_artifact(input_data)
-            elif command == 'status':
-                n_id = input_data.get('notebook_id')
-                if not n_id:
-                     result = {"status": "error", "error": "Missing notebook_id"}
-                else:
-                    result = poll_status(n_id)
-            else:
-                result = {"status": "error", "error": f"Unknown command in JSON: {command}"}
-        except json.JSONDecodeError:
+            result = handle_command(codec.loads(sys.stdin.read()))
+        except codec.JSONDecodeError:
              result = {"status": "error", "error": "Invalid JSON input"}
     else:
         # CLI args mode
@@ -188,7 +279,7 @@ def main():
             else:
                 result = query_notebook(args.notebook_id, args.query)
 
-    print(json.dumps(result))
+    print(codec.dumps(result))
 
 if __name__ == "__main__":
     main()
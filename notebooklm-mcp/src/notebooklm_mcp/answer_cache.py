@@ -0,0 +1,183 @@
+"""Persistent answer cache for NotebookLM queries.
+
+Answers are stored in SQLite, keyed by:
+- notebook ID
+- a fingerprint of the queried sources (IDs and titles)
+- the normalized question
+- a fingerprint of the notebook's chat configuration
+
+Adding, removing or renaming a source changes the fingerprint, and so does
+changing the chat goal/length, so stale answers are never served. Each entry
+also records a fingerprint of the notebook's whole source set: storing an
+answer prunes the notebook's entries made under another source set or chat
+configuration, and expired ones, but keeps answers for other source subsets
+of the same notebook.
+
+Opt-in: set NOTEBOOKLM_ANSWER_CACHE=1 (default location
+~/.notebooklm-mcp/answers.db) or NOTEBOOKLM_ANSWER_CACHE=/path/to/answers.db.
+NOTEBOOKLM_ANSWER_CACHE_TTL sets the maximum entry age in seconds (default: 7 days).
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS answers (
+    notebook_id TEXT NOT NULL,
+    source_fingerprint TEXT NOT NULL,
+    chat_fingerprint TEXT NOT NULL,
+    question TEXT NOT NULL,
+    answer TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    hits INTEGER NOT NULL DEFAULT 0,
+    notebook_fingerprint TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (notebook_id, source_fingerprint, chat_fingerprint, question)
+)
+"""
+
+
+def normalize_question(question: str) -> str:
+    """Case-fold and collapse whitespace so trivially different phrasings share an entry."""
+    return " ".join(question.casefold().split())
+
+
+def fingerprint(value: Any) -> str:
+    """Stable short hash of any JSON-serializable value.
+
+    Always the stdlib encoder with fixed options, not the configurable codec:
+    the key must be byte-identical in every process sharing the database.
+    """
+    encoded = json.dumps(value, sort_keys=True, ensure_ascii=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()[:32]
+
+
+class AnswerCache:
+    """SQLite-backed answer cache, safe to share between threads."""
+
+    def __init__(self, path: str | Path, ttl_seconds: float = DEFAULT_TTL_SECONDS):
+        self.path = Path(path)
+        self.ttl_seconds = ttl_seconds
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(answers)")}
+        if "notebook_fingerprint" not in columns:
+            # Databases from before the column: their entries are pruned by
+            # the next put() for their notebook
+            self._conn.execute(
+                "ALTER TABLE answers ADD COLUMN notebook_fingerprint TEXT NOT NULL DEFAULT ''"
+            )
+        self._conn.commit()
+
+    @classmethod
+    def from_env(cls) -> "AnswerCache | None":
+        """Build the cache from NOTEBOOKLM_ANSWER_CACHE, or None if disabled."""
+        setting = os.environ.get("NOTEBOOKLM_ANSWER_CACHE", "").strip()
+        if setting.lower() in ("", "0", "false", "no"):
+            return None
+        if setting.lower() in ("1", "true", "yes"):
+            path = Path.home() / ".notebooklm-mcp" / "answers.db"
+        else:
+            path = Path(setting).expanduser()
+        ttl = float(os.environ.get("NOTEBOOKLM_ANSWER_CACHE_TTL", DEFAULT_TTL_SECONDS))
+        return cls(path, ttl_seconds=ttl)
+
+    def get(
+        self,
+        notebook_id: str,
+        source_fingerprint: str,
+        chat_fingerprint: str,
+        question: str,
+    ) -> str | None:
+        """Return the cached answer, or None on a miss or expired entry."""
+        key = (notebook_id, source_fingerprint, chat_fingerprint, normalize_question(question))
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT answer, created_at FROM answers WHERE notebook_id = ? "
+                "AND source_fingerprint = ? AND chat_fingerprint = ? AND question = ?",
+                key,
+            ).fetchone()
+            if row is None:
+                return None
+            answer, created_at = row
+            if self.ttl_seconds and time.time() - created_at > self.ttl_seconds:
+                self._conn.execute(
+                    "DELETE FROM answers WHERE notebook_id = ? AND source_fingerprint = ? "
+                    "AND chat_fingerprint = ? AND question = ?",
+                    key,
+                )
+                self._conn.commit()
+                return None
+            self._conn.execute(
+                "UPDATE answers SET hits = hits + 1 WHERE notebook_id = ? "
+                "AND source_fingerprint = ? AND chat_fingerprint = ? AND question = ?",
+                key,
+            )
+            self._conn.commit()
+            return answer
+
+    def put(
+        self,
+        notebook_id: str,
+        source_fingerprint: str,
+        chat_fingerprint: str,
+        question: str,
+        answer: str,
+        notebook_fingerprint: str = "",
+    ) -> None:
+        """Store an answer and drop the notebook's stale entries.
+
+        Stale: made under another chat configuration or another notebook
+        source set (notebook_fingerprint, a fingerprint of all the notebook's
+        sources), or past the TTL. Entries for other source subsets of the
+        current source set stay.
+        """
+        now = time.time()
+        expired_before = now - self.ttl_seconds if self.ttl_seconds else 0.0
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM answers WHERE notebook_id = ? "
+                "AND (chat_fingerprint != ? OR notebook_fingerprint != ? OR created_at < ?)",
+                (notebook_id, chat_fingerprint, notebook_fingerprint, expired_before),
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO answers "
+                "(notebook_id, source_fingerprint, chat_fingerprint, question, answer, created_at, "
+                "notebook_fingerprint) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    notebook_id,
+                    source_fingerprint,
+                    chat_fingerprint,
+                    normalize_question(question),
+                    answer,
+                    now,
+                    notebook_fingerprint,
+                ),
+            )
+            self._conn.commit()
+
+    def invalidate(self, notebook_id: str | None = None) -> int:
+        """Drop all entries for a notebook (or every entry). Returns rows removed."""
+        with self._lock:
+            if notebook_id is None:
+                cursor = self._conn.execute("DELETE FROM answers")
+            else:
+                cursor = self._conn.execute(
+                    "DELETE FROM answers WHERE notebook_id = ?", (notebook_id,)
+                )
+            self._conn.commit()
+            return cursor.rowcount
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
@@ -4,18 +4,29 @@
 Reverse-engineered internal API. See CLAUDE.md for full documentation.
 """
 
-import json
 import os
 import re
-import subprocess
 import sys
+import threading
+import time
 import urllib.parse
-from dataclasses import dataclass
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, replace
 from datetime import datetime, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import httpx
 
+from . import codec
+
+if TYPE_CHECKING:
+    from .answer_cache import AnswerCache
+
+
+# Upper bound on the queries one query_many call keeps in flight, whatever
+# concurrency the caller asks for: each is a NotebookLM request on one account
+MAX_QUERY_CONCURRENCY = max(1, int(os.environ.get("NOTEBOOKLM_MAX_QUERY_CONCURRENCY", "8")))
 
 # Ownership constants (from metadata position 0)
 OWNERSHIP_MINE = 1
@@ -77,6 +88,63 @@ class Notebook:
         return "shared_with_me"
 
 
+SOURCE_FIELDS = ("id", "title", "source_type", "source_type_name", "drive_doc_id", "can_sync")
+
+
+def unwrap_notebook(result: Any) -> list:
+    """Notebook array from a get_notebook result (the data is wrapped in an outer array)."""
+    if result and isinstance(result, list):
+        return result[0] if isinstance(result[0], list) else result
+    return []
+
+
+def notebook_source_entries(notebook_data: list) -> list[list]:
+    """Raw source entries of an unwrapped notebook, without decoding them."""
+    # Sources are in notebook_data[1]
+    sources_data = notebook_data[1] if len(notebook_data) > 1 else []
+    if not isinstance(sources_data, list):
+        return []
+    return [src for src in sources_data if isinstance(src, list) and len(src) >= 3]
+
+
+def parse_source(src: list, fields: set[str] | None = None) -> dict:
+    """Decode one raw source entry, building only the requested fields (None = all)."""
+    # Source structure: [[id], title, [metadata...], [null, 2]]
+    wanted = set(SOURCE_FIELDS) if fields is None else fields
+    source: dict[str, Any] = {}
+    if "id" in wanted:
+        source["id"] = src[0][0] if src[0] and isinstance(src[0], list) else None
+    if "title" in wanted:
+        source["title"] = src[1] if len(src) > 1 else "Untitled"
+    if not wanted & {"source_type", "source_type_name", "drive_doc_id", "can_sync"}:
+        return source
+
+    metadata = src[2] if len(src) > 2 else []
+    source_type = None
+    drive_doc_id = None
+    if isinstance(metadata, list):
+        if len(metadata) > 4:
+            source_type = metadata[4]
+        # Drive doc info at metadata[0]
+        if len(metadata) > 0 and isinstance(metadata[0], list):
+            drive_doc_id = metadata[0][0] if metadata[0] else None
+
+    if "source_type" in wanted:
+        source["source_type"] = source_type
+    if "source_type_name" in wanted:
+        source["source_type_name"] = NotebookLMClient._get_source_type_name(source_type)
+    if "drive_doc_id" in wanted:
+        source["drive_doc_id"] = drive_doc_id
+    if "can_sync" in wanted:
+        # Google Docs (type 1) and Slides/Sheets (type 2) are stored in Drive
+        # and can be synced if they have a drive_doc_id (Drive docs AND Gemini Notes)
+        source["can_sync"] = drive_doc_id is not None and source_type in (
+            NotebookLMClient.SOURCE_TYPE_GOOGLE_DOCS,
+            NotebookLMClient.SOURCE_TYPE_GOOGLE_OTHER,
+        )
+    return source
+
+
 class NotebookLMClient:
     """Client for NotebookLM MCP internal API."""
 
@@ -196,6 +264,9 @@ class NotebookLMClient:
     SOURCE_TYPE_GOOGLE_OTHER = 2
     SOURCE_TYPE_PASTED_TEXT = 4
 
+    # Seconds between checks for cookies rotated by other processes
+    TOKEN_SYNC_INTERVAL = 5.0
+
     # Query endpoint (different from batchexecute - streaming gRPC-style)
     QUERY_ENDPOINT = "/_/LabsTailwindUi/data/google.internal.labs.tailwind.orchestration.v1.LabsTailwindOrchestrationService/GenerateFreeFormStreamed"
 
@@ -213,7 +284,14 @@ class NotebookLMClient:
         "sec-ch-ua-platform": '"Windows"',
     }
 
-    def __init__(self, cookies: dict[str, str], csrf_token: str = "", session_id: str = ""):
+    def __init__(
+        self,
+        cookies: dict[str, str],
+        csrf_token: str = "",
+        session_id: str = "",
+        answer_cache: "AnswerCache | None" = None,
+        profile: str | None = None,
+    ):
         """
         Initialize the client.
 
@@ -221,11 +299,21 @@ class NotebookLMClient:
             cookies: Dict of Google auth cookies (SID, SSID, HSID, APISID, SAPISID, etc.)
             csrf_token: CSRF token (optional - will be auto-extracted from page if not provided)
             session_id: Session ID (optional - will be auto-extracted from page if not provided)
+            answer_cache: Optional persistent cache for repeated query() questions
+            profile: Auth profile whose token cache is read/updated and followed for
+                     cookies rotated by other processes (None: NOTEBOOKLM_PROFILE, not followed)
         """
-        self.cookies = cookies
+        # Own copy: cookies are updated in place on rotation
+        self.cookies = dict(cookies)
         self.csrf_token = csrf_token
         self._client: httpx.Client | None = None
         self._session_id = session_id
+        self._answer_cache = answer_cache
+        self.profile = profile
+
+        # Last token-cache state seen by _adopt_rotated_tokens
+        self._seen_tokens = None
+        self._tokens_checked_at = time.monotonic()
 
         # Conversation cache for follow-up queries
         # Key: conversation_id, Value: list of ConversationTurn objects
@@ -234,6 +322,8 @@ class NotebookLMClient:
         # Request counter for _reqid parameter (required for query endpoint)
         import random
         self._reqid_counter = random.randint(100000, 999999)
+        # Tool calls run concurrently on worker threads
+        self._reqid_lock = threading.Lock()
 
         # ALWAYS refresh CSRF token on initialization - they expire quickly (minutes)
         # Even if a CSRF token was provided, it may be stale
@@ -261,55 +351,28 @@ class NotebookLMClient:
 
             # Check if redirected to login (cookies expired)
             if "accounts.google.com" in str(response.url):
-                # Attempt self-healing: run auth tool in headless mode
+                # Attempt self-healing: run auth tool in headless mode.
+                # reauthenticate() makes concurrent processes share one run.
                 try:
-                    # Prefer running via python module to ensure we use the same code version
-                    # (Especially important during development/testing)
-                    cmd = [sys.executable, "-m", "notebooklm_mcp.auth_cli", "--headless"]
-                    
-                    # Ensure the subprocess can find the module (propagate PYTHONPATH or add src)
-                    env = os.environ.copy()
-                    
-                    # If running from source, __file__ is .../src/notebooklm_mcp/api_client.py
-                    # We want PYTHONPATH to include .../src
-                    current_file = os.path.abspath(__file__)
-                    if "src" in current_file:
-                        src_root = os.path.dirname(os.path.dirname(current_file))
-                        current_pythonpath = env.get("PYTHONPATH", "")
-                        if src_root not in current_pythonpath:
-                            env["PYTHONPATH"] = f"{src_root}{os.pathsep}{current_pythonpath}"
-
-                    # Capture both stdout and stderr to avoid leaking to parent stdout
-                    subprocess.run(cmd, check=True, capture_output=True, env=env, text=True)
-                    
-                    # Reload tokens from disk (the CLI tool just updated them)
-                    from .auth import load_cached_tokens
-                    new_tokens = load_cached_tokens()
-                    if new_tokens:
-                        self.cookies = new_tokens.cookies
-                        self.csrf_token = new_tokens.csrf_token
-                        self._session_id = new_tokens.session_id
-                    else:
-                        raise ValueError("Self-healing failed: Could not load new tokens from cache.")
-                    
+                    from .auth import reauthenticate
+                    new_tokens = reauthenticate(self.profile)
+                    self.cookies = dict(new_tokens.cookies)
+                    self.csrf_token = new_tokens.csrf_token
+                    self._session_id = new_tokens.session_id
+
                     # One-time retry
                     # Update cookies for the retry
                     cookie_header = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
                     headers["Cookie"] = cookie_header
-                    
+
                     with httpx.Client(headers=headers, follow_redirects=True, timeout=15.0) as retry_client:
                         response = retry_client.get(f"{self.BASE_URL}/")
                         if "accounts.google.com" in str(response.url):
                             raise ValueError("Self-healing failed: Still redirected to login.")
-                            
-                except (subprocess.CalledProcessError, Exception) as e:
+
+                except Exception as e:
                     error_msg = str(e)
-                    if isinstance(e, subprocess.CalledProcessError) and e.stderr:
-                        # e.stderr is already a string because text=True was used in run()
-                        stderr_content = e.stderr if isinstance(e.stderr, str) else e.stderr.decode(errors='replace')
-                        error_msg += f"\nStderr: {stderr_content}"
-                    
-                    print(f"[WARN] Self-healing failed: {error_msg}")
+                    print(f"[WARN] Self-healing failed: {error_msg}", file=sys.stderr)
                     raise ValueError(
                         f"Cookies have expired and self-healing failed: {error_msg}\n"
                         "Please run 'notebooklm-mcp-auth' manually."
@@ -363,45 +426,92 @@ class NotebookLMClient:
         significantly improving performance for subsequent API calls.
         """
         try:
-            import time
             from .auth import AuthTokens, save_tokens_to_cache, load_cached_tokens
 
             # Load existing cache or create new
-            cached = load_cached_tokens()
-            
-            # If we just refreshed via CLI, our memory state might be stale
-            # But normally this function is called AFTER we extracted new tokens from HTML
-            # so we want to write memory -> disk.
-            
-            # UNIQUE CASE: If we called this during self-healing (after CLI run),
-            # we want to load disk -> memory.
-            # We can detect this by checking if our current cookies are empty or we explicitly flagged it.
-            # Simplified approach: The caller (self-healing block) should handle the reload logic manually
-            # or we add a 'reload' flag.
-            # For now, let's keep this as write-only (memory -> disk) as implied by the method name.
-            # The self-healing block will manually reload.
-            
+            cached = load_cached_tokens(self.profile)
+
+            # This is write-only (memory -> disk). After a self-healing CLI run the
+            # caller reloads disk -> memory itself.
             if cached:
+                if (
+                    cached.cookies == self.cookies
+                    and cached.csrf_token == self.csrf_token
+                    and cached.session_id == self._session_id
+                ):
+                    # Nothing new - don't bump mtime and make every other process re-read
+                    return
                 # Update existing cache with new tokens
-                cached.cookies = self.cookies
-                cached.csrf_token = self.csrf_token
-                cached.session_id = self._session_id
+                cached = replace(
+                    cached,
+                    cookies=dict(self.cookies),
+                    csrf_token=self.csrf_token,
+                    session_id=self._session_id,
+                )
             else:
                 # Create new cache entry
                 cached = AuthTokens(
-                    cookies=self.cookies,
+                    cookies=dict(self.cookies),
                     csrf_token=self.csrf_token,
                     session_id=self._session_id,
                     extracted_at=time.time(),
                 )
 
-            save_tokens_to_cache(cached, silent=True)
+            save_tokens_to_cache(cached, silent=True, profile=self.profile)
         except Exception:
             # Silently fail - caching is an optimization, not critical
             pass
 
+    def refresh_session(self) -> list[str]:
+        """Renew the CSRF token, session ID and any rotated cookies now.
+
+        Same homepage fetch as client construction (including self-healing on
+        expired cookies); used by the keep-alive scheduler so this happens
+        between user requests instead of during one.
+
+        Returns:
+            Names of cookies the server rotated
+        """
+        before = dict(self.cookies)
+        self._refresh_auth_tokens()
+        if self._client is not None:
+            self._client.headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+        return sorted(name for name, value in self.cookies.items() if before.get(name) != value)
+
+    def _adopt_rotated_tokens(self) -> None:
+        """Pick up cookies another process (bridge, Flask app, auth CLI) rotated.
+
+        Only for clients backed by a profile's token cache. Checks at most every
+        TOKEN_SYNC_INTERVAL seconds, and the check itself is a stat() unless the
+        file changed (see auth.load_cached_tokens).
+        """
+        if self.profile is None:
+            return
+        now = time.monotonic()
+        if now - self._tokens_checked_at < self.TOKEN_SYNC_INTERVAL:
+            return
+        self._tokens_checked_at = now
+
+        from .auth import load_cached_tokens
+
+        tokens = load_cached_tokens(self.profile)
+        if tokens is None or tokens == self._seen_tokens:
+            return
+        self._seen_tokens = tokens
+        if tokens.cookies == self.cookies:
+            return
+
+        self.cookies = dict(tokens.cookies)
+        if tokens.csrf_token:
+            self.csrf_token = tokens.csrf_token
+        if tokens.session_id:
+            self._session_id = tokens.session_id
+        if self._client is not None:
+            self._client.headers["Cookie"] = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
+
     def _get_client(self) -> httpx.Client:
         """Get or create HTTP client."""
+        self._adopt_rotated_tokens()
         if self._client is None:
             # Build cookie string
             cookie_str = "; ".join(f"{k}={v}" for k, v in self.cookies.items())
@@ -422,11 +532,19 @@ class NotebookLMClient:
     def _build_request_body(self, rpc_id: str, params: Any) -> str:
         """Build the batchexecute request body."""
         # The params need to be JSON-encoded, then wrapped in the RPC structure
-        # Use separators to match Chrome's compact format (no spaces)
-        params_json = json.dumps(params, separators=(',', ':'))
+        # codec.dumps emits Chrome's compact format (no spaces)
+        return self._encode_f_req([[rpc_id, codec.dumps(params), None, "generic"]])
+
+    def _build_batch_request_body(self, calls: list[tuple[str, Any]]) -> str:
+        """Build a body carrying several RPCs, tagged "1", "2", ... in call order."""
+        return self._encode_f_req([
+            [rpc_id, codec.dumps(params), None, str(i)]
+            for i, (rpc_id, params) in enumerate(calls, start=1)
+        ])
 
-        f_req = [[[rpc_id, params_json, None, "generic"]]]
-        f_req_json = json.dumps(f_req, separators=(',', ':'))
+    def _encode_f_req(self, entries: list[list]) -> str:
+        f_req = [entries]
+        f_req_json = codec.dumps(f_req)
 
         # URL encode (safe='' encodes all characters including /)
         body_parts = [f"f.req={urllib.parse.quote(f_req_json, safe='')}"]
@@ -483,17 +601,17 @@ class NotebookLMClient:
                 if i < len(lines):
                     json_str = lines[i]
                     try:
-                        data = json.loads(json_str)
+                        data = codec.loads(json_str)
                         results.append(data)
-                    except json.JSONDecodeError:
+                    except codec.JSONDecodeError:
                         pass
                 i += 1
             except ValueError:
                 # Not a byte count, try to parse as JSON
                 try:
-                    data = json.loads(line)
+                    data = codec.loads(line)
                     results.append(data)
-                except json.JSONDecodeError:
+                except codec.JSONDecodeError:
                     pass
                 i += 1
 
@@ -509,8 +627,8 @@ class NotebookLMClient:
                             result_str = item[2]
                             if isinstance(result_str, str):
                                 try:
-                                    return json.loads(result_str)
-                                except json.JSONDecodeError:
+                                    return codec.loads(result_str)
+                                except codec.JSONDecodeError:
                                     return result_str
                             return result_str
         return None
@@ -534,6 +652,53 @@ class NotebookLMClient:
         parsed = self._parse_response(response.text)
         return self._extract_rpc_result(parsed, rpc_id)
 
+    def _call_rpcs(
+        self,
+        calls: list[tuple[str, Any]],
+        path: str = "/",
+        timeout: float | None = None,
+    ) -> list[Any]:
+        """Execute several RPCs in one batchexecute request.
+
+        Returns one result per call, in call order (None where the server
+        returned no result for a call).
+        """
+        if len(calls) == 1:
+            rpc_id, params = calls[0]
+            return [self._call_rpc(rpc_id, params, path, timeout)]
+
+        client = self._get_client()
+        body = self._build_batch_request_body(calls)
+        url = self._build_url(",".join(dict.fromkeys(rpc_id for rpc_id, _ in calls)), path)
+        if timeout:
+            response = client.post(url, content=body, timeout=timeout)
+        else:
+            response = client.post(url, content=body)
+        response.raise_for_status()
+        parsed = self._parse_response(response.text)
+
+        results: list[Any] = [None] * len(calls)
+        for chunk in parsed:
+            if not isinstance(chunk, list):
+                continue
+            for item in chunk:
+                # ["wrb.fr", rpc_id, result_json, null, null, null, "<tag>"]
+                if not (isinstance(item, list) and len(item) >= 7 and item[0] == "wrb.fr"):
+                    continue
+                try:
+                    index = int(item[6]) - 1
+                except (TypeError, ValueError):
+                    continue
+                if 0 <= index < len(calls) and item[1] == calls[index][0]:
+                    result = item[2]
+                    if isinstance(result, str):
+                        try:
+                            result = codec.loads(result)
+                        except codec.JSONDecodeError:
+                            pass
+                    results[index] = result
+        return results
+
     # =========================================================================
     # Conversation Management (for query follow-ups)
     # =========================================================================
@@ -602,8 +767,18 @@ class NotebookLMClient:
     # Notebook Operations
     # =========================================================================
 
-    def list_notebooks(self, debug: bool = False) -> list[Notebook]:
-        """List all notebooks."""
+    def list_notebooks(self, debug: bool = False, fields: set[str] | None = None) -> list[Notebook]:
+        """List all notebooks.
+
+        Args:
+            debug: Print request/response details
+            fields: Notebook fields the caller will use. Sources and timestamps
+                are only decoded when "sources" / "created_at" / "modified_at"
+                are included (None = decode everything).
+        """
+        want_sources = fields is None or "sources" in fields
+        want_created = fields is None or "created_at" in fields
+        want_modified = fields is None or "modified_at" in fields
         client = self._get_client()
 
         # [null, 1, null, [2]] - params for list notebooks
@@ -669,15 +844,19 @@ class NotebookLMClient:
 
                         # metadata[5] = [seconds, nanos] = last modified
                         # metadata[8] = [seconds, nanos] = created
-                        if len(metadata) > 5:
+                        if want_modified and len(metadata) > 5:
                             modified_at = parse_timestamp(metadata[5])
-                        if len(metadata) > 8:
+                        if want_created and len(metadata) > 8:
                             created_at = parse_timestamp(metadata[8])
 
                     sources = []
+                    source_count = 0
                     if isinstance(sources_data, list):
                         for src in sources_data:
                             if isinstance(src, list) and len(src) >= 2:
+                                source_count += 1
+                                if not want_sources:
+                                    continue
                                 # Source structure: [[source_id], title, metadata, ...]
                                 src_ids = src[0] if src[0] else []
                                 src_title = src[1] if len(src) > 1 else "Untitled"
@@ -694,7 +873,7 @@ class NotebookLMClient:
                         notebooks.append(Notebook(
                             id=notebook_id,
                             title=title,
-                            source_count=len(sources),
+                            source_count=source_count,
                             sources=sources,
                             is_owned=is_owned,
                             is_shared=is_shared,
@@ -826,6 +1005,10 @@ class NotebookLMClient:
         params = [notebook_id, [[None, None, None, None, None, None, None, chat_settings]]]
         result = self._call_rpc(self.RPC_RENAME_NOTEBOOK, params, f"/notebook/{notebook_id}")
 
+        # Cached answers were generated under the old settings
+        if self._answer_cache is not None:
+            self._answer_cache.invalidate(notebook_id)
+
         if result:
             # Response format: [title, null, id, emoji, null, metadata, null, [[goal_code, prompt?], [length_code]]]
             settings = result[7] if len(result) > 7 else None
@@ -961,49 +1144,8 @@ class NotebookLMClient:
     def get_notebook_sources_with_types(self, notebook_id: str) -> list[dict]:
         """Get all sources from a notebook with their type information.
     """
-        result = self.get_notebook(notebook_id)
-
-        sources = []
-        # The notebook data is wrapped in an outer array
-        if result and isinstance(result, list) and len(result) >= 1:
-            notebook_data = result[0] if isinstance(result[0], list) else result
-            # Sources are in notebook_data[1]
-            sources_data = notebook_data[1] if len(notebook_data) > 1 else []
-
-            if isinstance(sources_data, list):
-                for src in sources_data:
-                    if isinstance(src, list) and len(src) >= 3:
-                        # Source structure: [[id], title, [metadata...], [null, 2]]
-                        source_id = src[0][0] if src[0] and isinstance(src[0], list) else None
-                        title = src[1] if len(src) > 1 else "Untitled"
-                        metadata = src[2] if len(src) > 2 else []
-
-                        source_type = None
-                        drive_doc_id = None
-                        if isinstance(metadata, list):
-                            if len(metadata) > 4:
-                                source_type = metadata[4]
-                            # Drive doc info at metadata[0]
-                            if len(metadata) > 0 and isinstance(metadata[0], list):
-                                drive_doc_id = metadata[0][0] if metadata[0] else None
-
-                        # Google Docs (type 1) and Slides/Sheets (type 2) are stored in Drive
-                        # and can be synced if they have a drive_doc_id
-                        can_sync = drive_doc_id is not None and source_type in (
-                            self.SOURCE_TYPE_GOOGLE_DOCS,
-                            self.SOURCE_TYPE_GOOGLE_OTHER,
-                        )
-
-                        sources.append({
-                            "id": source_id,
-                            "title": title,
-                            "source_type": source_type,
-                            "source_type_name": self._get_source_type_name(source_type),
-                            "drive_doc_id": drive_doc_id,
-                            "can_sync": can_sync,  # True for Drive docs AND Gemini Notes
-                        })
-
-        return sources
+        notebook_data = unwrap_notebook(self.get_notebook(notebook_id))
+        return [parse_source(src) for src in notebook_source_entries(notebook_data)]
 
     @staticmethod
     def _get_source_type_name(source_type: int | None) -> str:
@@ -1019,66 +1161,12 @@ class NotebookLMClient:
     def add_url_source(self, notebook_id: str, url: str) -> dict | None:
         """Add a URL (website or YouTube) as a source to a notebook.
     """
-        client = self._get_client()
-
-        # URL source params structure:
-        source_data = [None, None, [url], None, None, None, None, None, None, None, 1]
-        params = [
-            [source_data],
-            notebook_id,
-            [2],
-            [1, None, None, None, None, None, None, None, None, None, [1]]
-        ]
-        body = self._build_request_body(self.RPC_ADD_SOURCE, params)
-        source_path = f"/notebook/{notebook_id}"
-        url_endpoint = self._build_url(self.RPC_ADD_SOURCE, source_path)
-
-        response = client.post(url_endpoint, content=body)
-        response.raise_for_status()
-
-        parsed = self._parse_response(response.text)
-        result = self._extract_rpc_result(parsed, self.RPC_ADD_SOURCE)
-
-        if result and isinstance(result, list) and len(result) > 0:
-            source_list = result[0] if result else []
-            if source_list and len(source_list) > 0:
-                source_data = source_list[0]
-                source_id = source_data[0][0] if source_data[0] else None
-                source_title = source_data[1] if len(source_data) > 1 else "Untitled"
-                return {"id": source_id, "title": source_title}
-        return None
+        return self.add_sources(notebook_id, [{"url": url}])[0]
 
     def add_text_source(self, notebook_id: str, text: str, title: str = "Pasted Text") -> dict | None:
         """Add pasted text as a source to a notebook.
     """
-        client = self._get_client()
-
-        # Text source params structure:
-        source_data = [None, [title, text], None, 2, None, None, None, None, None, None, 1]
-        params = [
-            [source_data],
-            notebook_id,
-            [2],
-            [1, None, None, None, None, None, None, None, None, None, [1]]
-        ]
-        body = self._build_request_body(self.RPC_ADD_SOURCE, params)
-        source_path = f"/notebook/{notebook_id}"
-        url_endpoint = self._build_url(self.RPC_ADD_SOURCE, source_path)
-
-        response = client.post(url_endpoint, content=body)
-        response.raise_for_status()
-
-        parsed = self._parse_response(response.text)
-        result = self._extract_rpc_result(parsed, self.RPC_ADD_SOURCE)
-
-        if result and isinstance(result, list) and len(result) > 0:
-            source_list = result[0] if result else []
-            if source_list and len(source_list) > 0:
-                source_data = source_list[0]
-                source_id = source_data[0][0] if source_data[0] else None
-                source_title = source_data[1] if len(source_data) > 1 else title
-                return {"id": source_id, "title": source_title}
-        return None
+        return self.add_sources(notebook_id, [{"text": text, "title": title}])[0]
 
     def add_drive_source(
         self,
@@ -1089,44 +1177,71 @@ class NotebookLMClient:
     ) -> dict | None:
         """Add a Google Drive document as a source to a notebook.
     """
-        client = self._get_client()
+        source = {"document_id": document_id, "title": title, "mime_type": mime_type}
+        return self.add_sources(notebook_id, [source])[0]
 
-        # Drive source params structure (verified from network capture):
-        source_data = [
-            [document_id, mime_type, 1, title],  # Drive document info at position 0
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            None,
-            1
+    def add_sources(self, notebook_id: str, sources: list[dict]) -> list[dict | None]:
+        """Add several sources to a notebook with one batchexecute request.
+
+        Each source is one of:
+            {"url": ...}
+            {"text": ..., "title": ...}
+            {"document_id": ..., "title": ..., "mime_type": ...}
+
+        Returns {"id", "title"} per source in order, or None where adding failed.
+        """
+        calls = [
+            (self.RPC_ADD_SOURCE, self._add_source_params(notebook_id, source))
+            for source in sources
         ]
-        params = [
+        results = self._call_rpcs(calls, f"/notebook/{notebook_id}")
+        return [
+            self._parse_added_source(result, source.get("title", "Untitled"))
+            for source, result in zip(sources, results)
+        ]
+
+    @staticmethod
+    def _add_source_params(notebook_id: str, source: dict) -> list:
+        if "url" in source:
+            # URL source params structure:
+            source_data = [None, None, [source["url"]], None, None, None, None, None, None, None, 1]
+        elif "text" in source:
+            # Text source params structure:
+            title = source.get("title", "Pasted Text")
+            source_data = [None, [title, source["text"]], None, 2, None, None, None, None, None, None, 1]
+        elif "document_id" in source:
+            # Drive source params structure (verified from network capture):
+            mime_type = source.get("mime_type", "application/vnd.google-apps.document")
+            source_data = [
+                [source["document_id"], mime_type, 1, source.get("title", "")],  # Drive document info at position 0
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                None,
+                1
+            ]
+        else:
+            raise ValueError(f"Unsupported source: {source}")
+        return [
             [source_data],
             notebook_id,
             [2],
             [1, None, None, None, None, None, None, None, None, None, [1]]
         ]
-        body = self._build_request_body(self.RPC_ADD_SOURCE, params)
-        source_path = f"/notebook/{notebook_id}"
-        url_endpoint = self._build_url(self.RPC_ADD_SOURCE, source_path)
-
-        response = client.post(url_endpoint, content=body)
-        response.raise_for_status()
-
-        parsed = self._parse_response(response.text)
-        result = self._extract_rpc_result(parsed, self.RPC_ADD_SOURCE)
 
+    @staticmethod
+    def _parse_added_source(result: Any, default_title: str) -> dict | None:
         if result and isinstance(result, list) and len(result) > 0:
             source_list = result[0] if result else []
             if source_list and len(source_list) > 0:
                 source_data = source_list[0]
                 source_id = source_data[0][0] if source_data[0] else None
-                source_title = source_data[1] if len(source_data) > 1 else document_name
+                source_title = source_data[1] if len(source_data) > 1 else default_title
                 return {"id": source_id, "title": source_title}
         return None
 
@@ -1136,12 +1251,18 @@ class NotebookLMClient:
         query_text: str,
         source_ids: list[str] | None = None,
         conversation_id: str | None = None,
+        use_cache: bool = True,
+        on_answer: Callable[[str], None] | None = None,
     ) -> dict | None:
         """Query the notebook with a question.
 
         Supports both new conversations and follow-up queries. For follow-ups,
         the conversation history is automatically included from the cache.
 
+        When the client has an answer cache, first questions in a conversation
+        are answered from it if the notebook's sources and chat settings are
+        unchanged since the answer was generated.
+
         Args:
             notebook_id: The notebook UUID
             query_text: The question to ask
@@ -1149,6 +1270,9 @@ class NotebookLMClient:
             conversation_id: Optional conversation ID for follow-up questions.
                            If None, starts a new conversation.
                            If provided and exists in cache, includes conversation history.
+            use_cache: Set False to bypass the answer cache for this call
+            on_answer: Optional callback receiving the answer text so far each time
+                       the streamed response grows (not called for thinking steps)
 
         Returns:
             Dict with:
@@ -1156,19 +1280,42 @@ class NotebookLMClient:
             - conversation_id: ID to use for follow-up questions
             - turn_number: Which turn this is in the conversation (1 = first)
             - is_follow_up: Whether this was a follow-up query
+            - cached: Whether the answer came from the answer cache
             - raw_response: The raw parsed response (for debugging)
         """
         import uuid
 
         client = self._get_client()
 
+        # Determine if this is a new conversation or follow-up
+        is_new_conversation = conversation_id is None
+        # Follow-ups depend on conversation history, so only first turns are cacheable
+        use_cache = use_cache and is_new_conversation and self._answer_cache is not None
+
         # If no source_ids provided, get them from the notebook
-        if source_ids is None:
+        notebook_data = None
+        if source_ids is None or use_cache:
             notebook_data = self.get_notebook(notebook_id)
+        if source_ids is None:
             source_ids = self._extract_source_ids_from_notebook(notebook_data)
 
-        # Determine if this is a new conversation or follow-up
-        is_new_conversation = conversation_id is None
+        cache_key = None
+        if use_cache:
+            *cache_key, notebook_fingerprint = self._answer_cache_key(notebook_data, source_ids)
+            cached_answer = self._answer_cache.get(notebook_id, *cache_key, query_text)
+            if cached_answer is not None:
+                conversation_id = str(uuid.uuid4())
+                # Seed the conversation so follow-ups carry this turn as history
+                self._cache_conversation_turn(conversation_id, query_text, cached_answer)
+                return {
+                    "answer": cached_answer,
+                    "conversation_id": conversation_id,
+                    "turn_number": 1,
+                    "is_follow_up": False,
+                    "cached": True,
+                    "raw_response": "",
+                }
+
         if is_new_conversation:
             conversation_id = str(uuid.uuid4())
             conversation_history = None
@@ -1191,10 +1338,10 @@ class NotebookLMClient:
         ]
 
         # Use compact JSON format matching Chrome (no spaces)
-        params_json = json.dumps(params, separators=(",", ":"))
+        params_json = codec.dumps(params)
 
         f_req = [None, params_json]
-        f_req_json = json.dumps(f_req, separators=(",", ":"))
+        f_req_json = codec.dumps(f_req)
 
         # URL encode with safe='' to encode all characters including /
         body_parts = [f"f.req={urllib.parse.quote(f_req_json, safe='')}"]
@@ -1203,11 +1350,13 @@ class NotebookLMClient:
         # Add trailing & to match NotebookLM's format
         body = "&".join(body_parts) + "&"
 
-        self._reqid_counter += 100000  # Increment counter
+        with self._reqid_lock:
+            self._reqid_counter += 100000  # Increment counter
+            reqid = self._reqid_counter
         url_params = {
             "bl": os.environ.get("NOTEBOOKLM_BL", "boq_labs-tailwind-frontend_20251221.14_p0"),
             "hl": "en",
-            "_reqid": str(self._reqid_counter),
+            "_reqid": str(reqid),
             "rt": "c",
         }
         if self._session_id:
@@ -1216,15 +1365,24 @@ class NotebookLMClient:
         query_string = urllib.parse.urlencode(url_params)
         url = f"{self.BASE_URL}{self.QUERY_ENDPOINT}?{query_string}"
 
-        response = client.post(url, content=body)
-        response.raise_for_status()
+        if on_answer is None:
+            response = client.post(url, content=body)
+            response.raise_for_status()
+            response_text = response.text
+        else:
+            response_text = self._stream_query_response(client, url, body, on_answer)
 
         # Parse streaming response
-        answer_text = self._parse_query_response(response.text)
+        answer_text = self._parse_query_response(response_text)
 
         # Cache this turn for future follow-ups (only if we got an answer)
         if answer_text:
             self._cache_conversation_turn(conversation_id, query_text, answer_text)
+            if cache_key is not None:
+                self._answer_cache.put(
+                    notebook_id, *cache_key, query_text, answer_text,
+                    notebook_fingerprint=notebook_fingerprint,
+                )
 
         # Calculate turn number
         turns = self._conversation_cache.get(conversation_id, [])
@@ -1235,9 +1393,88 @@ class NotebookLMClient:
             "conversation_id": conversation_id,
             "turn_number": turn_number,
             "is_follow_up": not is_new_conversation,
-            "raw_response": response.text[:1000] if response.text else "",  # Truncate for debugging
+            "cached": False,
+            "raw_response": response_text[:1000] if response_text else "",  # Truncate for debugging
         }
 
+    def query_many(
+        self,
+        notebook_ids: list[str],
+        query_text: str,
+        concurrency: int = 4,
+    ) -> Iterator[dict]:
+        """Ask the same question across several notebooks in parallel.
+
+        Each notebook gets a new conversation. Results are yielded as soon as
+        each query finishes (completion order, not input order), so callers
+        can show answers while slower notebooks are still running.
+
+        Args:
+            notebook_ids: Notebook UUIDs to query (duplicates are ignored)
+            query_text: The question to ask
+            concurrency: Maximum number of queries in flight at once (capped at
+                MAX_QUERY_CONCURRENCY)
+
+        Yields:
+            Dict per notebook with:
+            - notebook_id: The notebook UUID
+            - status: "success" or "error"
+            - answer / conversation_id: On success
+            - error: On failure
+            - elapsed_seconds: Wall time of this notebook's query
+        """
+        # Make sure the shared HTTP client exists before the workers race to create it
+        self._get_client()
+        yield from fan_out_queries(self.query, notebook_ids, query_text, concurrency)
+
+    def _answer_cache_key(self, notebook_data: Any, source_ids: list[str]) -> tuple[str, str, str]:
+        """Return the (source, chat settings, notebook source set) fingerprints for the answer cache."""
+        from .answer_cache import fingerprint
+
+        titles: dict[str, str] = {}
+        chat_settings = None
+        try:
+            notebook_info = notebook_data[0]
+            for source in notebook_info[1] or []:
+                if isinstance(source, list) and len(source) > 1 and isinstance(source[0], list):
+                    titles[source[0][0]] = source[1]
+            # Same position as in the configure_chat response
+            if len(notebook_info) > 7:
+                chat_settings = notebook_info[7]
+        except (IndexError, TypeError):
+            pass
+
+        sources = sorted((sid, titles.get(sid)) for sid in source_ids)
+        return fingerprint(sources), fingerprint(chat_settings), fingerprint(sorted(titles.items()))
+
+    def _stream_query_response(
+        self,
+        client: httpx.Client,
+        url: str,
+        body: str,
+        on_answer: Callable[[str], None],
+    ) -> str:
+        """POST a query and report the answer as its chunks arrive.
+
+        Returns the full response text for _parse_query_response, so the final
+        answer is chosen exactly as in the non-streaming path.
+        """
+        lines = []
+        longest = ""
+        with client.stream("POST", url, content=body) as response:
+            response.raise_for_status()
+            for line in response.iter_lines():
+                lines.append(line)
+                stripped = line.strip()
+                # Byte-count lines and the anti-XSSI prefix carry no text
+                if not stripped.startswith("["):
+                    continue
+                text, is_answer = self._extract_answer_from_chunk(stripped)
+                if is_answer and text and len(text) > len(longest):
+                    longest = text
+                    on_answer(text)
+        return "\n".join(lines)
+
     def _extract_source_ids_from_notebook(self, notebook_data: Any) -> list[str]:
         """Extract source IDs from notebook data.
     """
@@ -1347,8 +1584,8 @@ class NotebookLMClient:
             Tuple of (text, is_answer) where is_answer is True for actual answers (type 1)
         """
         try:
-            data = json.loads(json_str)
-        except json.JSONDecodeError:
+            data = codec.loads(json_str)
+        except codec.JSONDecodeError:
             return None, False
 
         if not isinstance(data, list) or len(data) == 0:
@@ -1365,8 +1602,8 @@ class NotebookLMClient:
                 continue
 
             try:
-                inner_data = json.loads(inner_json_str)
-            except json.JSONDecodeError:
+                inner_data = codec.loads(inner_json_str)
+            except codec.JSONDecodeError:
                 continue
 
             # Type indicator is at inner_data[0][4][-1]: 1 = answer, 2 = thinking
@@ -2676,6 +2913,56 @@ class NotebookLMClient:
             self._client = None
 
 
+def fan_out_queries(
+    query_fn: Callable[..., dict | None],
+    notebook_ids: list[str],
+    query_text: str,
+    concurrency: int = 4,
+) -> Iterator[dict]:
+    """Run query_fn(notebook_id, query_text=...) on a bounded thread pool.
+
+    Shared by NotebookLMClient.query_many and the multi-profile ClientPool.
+    Yields one result dict per unique notebook ID in completion order; see
+    NotebookLMClient.query_many for the fields. concurrency is capped at
+    MAX_QUERY_CONCURRENCY.
+    """
+    notebook_ids = list(dict.fromkeys(notebook_ids))
+    if not notebook_ids:
+        return
+
+    def _run(notebook_id: str) -> dict:
+        started = time.perf_counter()
+        try:
+            result = query_fn(notebook_id, query_text=query_text)
+            if not result:
+                raise ValueError("Failed to query notebook")
+            return {
+                "notebook_id": notebook_id,
+                "status": "success",
+                "answer": result.get("answer", ""),
+                "conversation_id": result.get("conversation_id"),
+                "cached": result.get("cached", False),
+                "elapsed_seconds": round(time.perf_counter() - started, 2),
+            }
+        except Exception as e:
+            return {
+                "notebook_id": notebook_id,
+                "status": "error",
+                "error": str(e),
+                "elapsed_seconds": round(time.perf_counter() - started, 2),
+            }
+
+    workers = max(1, min(concurrency, MAX_QUERY_CONCURRENCY, len(notebook_ids)))
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notebooklm-query")
+    try:
+        futures = [executor.submit(_run, nb_id) for nb_id in notebook_ids]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        # If the caller stops early, don't start queries nobody will read
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
 def extract_cookies_from_chrome_export(cookie_header: str) -> dict[str, str]:
     """
     Extract cookies from a copy-pasted cookie header value.
@@ -6,8 +6,11 @@ If the user is not logged in, prompts them to log in via the Chrome window.
 
 import json
 import os
+import tempfile
+import threading
 import time
-from dataclasses import dataclass
+from contextlib import contextmanager
+from dataclasses import dataclass, replace
 from pathlib import Path
 
 
@@ -55,24 +58,112 @@ class AuthTokens:
         return "; ".join(f"{k}={v}" for k, v in self.cookies.items())
 
 
-def get_cache_path() -> Path:
-    """Get the path to the auth cache file."""
+DEFAULT_PROFILE = "default"
+
+
+def get_profile_dir(profile: str | None = None) -> Path:
+    """Get the directory holding a profile's auth cache and Chrome profile.
+
+    The default profile lives directly in ~/.notebooklm-mcp (as it always has).
+    Named profiles live in ~/.notebooklm-mcp/profiles/<name>. The profile
+    defaults to the NOTEBOOKLM_PROFILE environment variable.
+    """
+    profile = profile or os.environ.get("NOTEBOOKLM_PROFILE") or DEFAULT_PROFILE
     cache_dir = Path.home() / ".notebooklm-mcp"
-    cache_dir.mkdir(exist_ok=True)
-    return cache_dir / "auth.json"
+    if profile != DEFAULT_PROFILE:
+        if not profile.replace("-", "").replace("_", "").isalnum():
+            raise ValueError(f"Invalid profile name: {profile!r}")
+        cache_dir = cache_dir / "profiles" / profile
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def get_cache_path(profile: str | None = None) -> Path:
+    """Get the path to the auth cache file."""
+    return get_profile_dir(profile) / "auth.json"
+
+
+def list_profiles() -> list[str]:
+    """List profiles that have cached tokens, default profile first."""
+    base = Path.home() / ".notebooklm-mcp"
+    profiles = [DEFAULT_PROFILE] if (base / "auth.json").exists() else []
+    profiles_dir = base / "profiles"
+    if profiles_dir.is_dir():
+        profiles.extend(
+            sorted(p.name for p in profiles_dir.iterdir() if (p / "auth.json").exists())
+        )
+    return profiles
+
+
+@contextmanager
+def file_lock(path: Path, timeout: float | None = None):
+    """Hold an exclusive advisory lock on path (created if missing).
+
+    Works across processes. Raises TimeoutError if not acquired in time.
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    with open(path, "a+b") as f:
+        while True:
+            try:
+                if os.name == "nt":
+                    import msvcrt
+                    f.seek(0)
+                    msvcrt.locking(f.fileno(), msvcrt.LK_NBLCK, 1)
+                else:
+                    import fcntl
+                    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                break
+            except OSError:
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"Timed out waiting for lock {path}")
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                import msvcrt
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                import fcntl
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+# In-memory copy of each cache file: path -> ((mtime_ns, inode, size), tokens).
+# Re-read only when the file is replaced or modified by another process.
+_token_cache: dict[Path, tuple[tuple[int, int, int], AuthTokens]] = {}
+_token_cache_lock = threading.Lock()
+
+
+def _file_signature(path: Path) -> tuple[int, int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_ino, st.st_size
 
 
-def load_cached_tokens() -> AuthTokens | None:
+def load_cached_tokens(profile: str | None = None) -> AuthTokens | None:
     """Load tokens from cache if they exist.
 
     Note: We no longer reject tokens based on age. The functional check
     (redirect to login during CSRF refresh) is the real validity test.
     Cookies often last much longer than any arbitrary time limit.
+
+    The parsed file is kept in memory and only re-read when its mtime, inode
+    or size changes, so calling this per request costs one stat(). Each call
+    returns its own copy, so callers may modify the result freely.
     """
-    cache_path = get_cache_path()
-    if not cache_path.exists():
+    cache_path = get_cache_path(profile)
+    signature = _file_signature(cache_path)
+    if signature is None:
         return None
 
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_path)
+        if cached and cached[0] == signature:
+            return replace(cached[1], cookies=dict(cached[1].cookies))
+
     try:
         with open(cache_path) as f:
             data = json.load(f)
@@ -83,26 +174,152 @@ def load_cached_tokens() -> AuthTokens | None:
         if tokens.is_expired():
             print("Note: Cached tokens are older than 1 week. They may still work.")
 
+        with _token_cache_lock:
+            _token_cache[cache_path] = (signature, replace(tokens, cookies=dict(tokens.cookies)))
         return tokens
+    except OSError:
+        return None
     except (json.JSONDecodeError, KeyError, TypeError) as e:
         print(f"Failed to load cached tokens: {e}")
         return None
 
 
-def save_tokens_to_cache(tokens: AuthTokens, silent: bool = False) -> None:
+def save_tokens_to_cache(tokens: AuthTokens, silent: bool = False, profile: str | None = None) -> None:
     """Save tokens to cache.
 
+    The file is written to a temporary name and renamed over auth.json while
+    holding auth.json.lock, so concurrent readers see either the old or the
+    new tokens, never a partial file.
+
     Args:
         tokens: AuthTokens to save
         silent: If True, don't print confirmation message (for auto-updates)
+        profile: Auth profile to save to (default: NOTEBOOKLM_PROFILE or "default")
     """
-    cache_path = get_cache_path()
-    with open(cache_path, "w") as f:
-        json.dump(tokens.to_dict(), f, indent=2)
+    cache_path = get_cache_path(profile)
+    with file_lock(cache_path.with_name(cache_path.name + ".lock"), timeout=30):
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, prefix=".auth-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(tokens.to_dict(), f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+        # Our own write: prime the in-memory copy instead of re-reading it.
+        # Copy the cookies so later mutation by the caller doesn't leak in.
+        signature = _file_signature(cache_path)
+        if signature is not None:
+            with _token_cache_lock:
+                _token_cache[cache_path] = (signature, replace(tokens, cookies=dict(tokens.cookies)))
     if not silent:
         print(f"Auth tokens cached to {cache_path}")
 
 
+# ============================================================================
+# Single-flight re-authentication
+# ============================================================================
+#
+# Every process using these tokens (MCP server, bridge, Flask app) may notice
+# expired cookies at the same moment. Only one headless auth_cli run may
+# happen at a time per profile: the others wait on a lock file and then reuse
+# the tokens it wrote (reauth_state.json records when a run last succeeded, so
+# a plain cookie rotation written to auth.json doesn't count). After a failed run, a circuit breaker makes callers
+# fail fast for NOTEBOOKLM_REAUTH_COOLDOWN seconds instead of relaunching Chrome.
+
+REAUTH_COOLDOWN_SECONDS = 300.0
+REAUTH_TIMEOUT_SECONDS = 120.0
+
+
+def _read_reauth_state(state_path: Path) -> dict:
+    try:
+        with open(state_path) as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return state if isinstance(state, dict) else {}
+
+
+def _check_reauth_breaker(state_path: Path, cooldown: float) -> None:
+    """Raise if a re-auth failed less than cooldown seconds ago."""
+    state = _read_reauth_state(state_path)
+    remaining = state.get("failed_at", 0) + cooldown - time.time()
+    if remaining > 0:
+        raise ValueError(
+            f"Re-authentication failed recently ({state.get('error', 'unknown error')}). "
+            f"Not retrying for another {int(remaining)}s. "
+            "Run 'notebooklm-mcp-auth' manually to fix it now."
+        )
+
+
+def reauthenticate(
+    profile: str | None = None,
+    python: str | None = None,
+    timeout: float = REAUTH_TIMEOUT_SECONDS,
+) -> AuthTokens:
+    """Refresh cookies with a headless auth_cli run, at most one at a time.
+
+    If another process completes a refresh of the profile while we wait for
+    the lock, its tokens are returned without launching Chrome again.
+
+    Args:
+        profile: Auth profile to refresh (default: NOTEBOOKLM_PROFILE or "default")
+        python: Interpreter to run auth_cli with (default: this one)
+        timeout: Seconds to wait for the lock, and for the auth run itself
+
+    Raises:
+        ValueError: If the refresh fails, or failed within the cooldown period
+    """
+    import subprocess
+    import sys
+
+    profile_dir = get_profile_dir(profile)
+    state_path = profile_dir / "reauth_state.json"
+    cooldown = float(os.environ.get("NOTEBOOKLM_REAUTH_COOLDOWN", REAUTH_COOLDOWN_SECONDS))
+
+    _check_reauth_breaker(state_path, cooldown)
+    seen_success = _read_reauth_state(state_path).get("succeeded_at", 0)
+
+    with file_lock(profile_dir / "reauth.lock", timeout=timeout):
+        # Someone else finished a refresh (or gave up) while we were waiting
+        _check_reauth_breaker(state_path, cooldown)
+        if _read_reauth_state(state_path).get("succeeded_at", 0) > seen_success:
+            tokens = load_cached_tokens(profile)
+            if tokens:
+                return tokens
+
+        cmd = [python or sys.executable, "-m", "notebooklm_mcp.auth_cli", "--headless"]
+        env = os.environ.copy()
+        if profile:
+            env["NOTEBOOKLM_PROFILE"] = profile
+        # Make sure the subprocess imports this copy of the package (running from src/)
+        src_root = str(Path(__file__).resolve().parent.parent)
+        if src_root not in env.get("PYTHONPATH", ""):
+            env["PYTHONPATH"] = f"{src_root}{os.pathsep}{env.get('PYTHONPATH', '')}"
+
+        try:
+            # Capture output so it never leaks onto an MCP stdio stream
+            subprocess.run(cmd, check=True, capture_output=True, env=env, text=True, timeout=timeout)
+            tokens = load_cached_tokens(profile)
+            if not tokens:
+                raise ValueError("Could not load new tokens from cache.")
+        except Exception as e:
+            error_msg = str(e)
+            if isinstance(e, subprocess.CalledProcessError) and e.stderr:
+                error_msg += f"\nStderr: {e.stderr}"
+            with open(state_path, "w") as f:
+                json.dump({"failed_at": time.time(), "error": error_msg[:500]}, f)
+            raise ValueError(f"Self-healing failed: {error_msg}") from e
+
+        # Also clears the breaker: a success record has no failed_at
+        with open(state_path, "w") as f:
+            json.dump({"succeeded_at": time.time()}, f)
+        return tokens
+
+
 def extract_tokens_via_chrome_devtools() -> AuthTokens | None:
     """
     Extract auth tokens using Chrome DevTools.
@@ -20,6 +20,7 @@ Usage:
 """
 
 import json
+import os
 import re
 import sys
 import time
@@ -32,6 +33,7 @@ from .auth import (
     REQUIRED_COOKIES,
     extract_csrf_from_page_source,
     get_cache_path,
+    get_profile_dir,
     save_tokens_to_cache,
     validate_cookies,
 )
@@ -85,7 +87,8 @@ def launch_chrome(port: int, headless: bool = False) -> bool:
 
     # Chrome 136+ requires a non-default user-data-dir for remote debugging
     # We use a persistent directory so Google login is remembered across runs
-    profile_dir = Path.home() / ".notebooklm-mcp" / "chrome-profile"
+    # Each auth profile (NOTEBOOKLM_PROFILE) gets its own Chrome profile / Google login
+    profile_dir = get_profile_dir() / "chrome-profile"
     profile_dir.mkdir(parents=True, exist_ok=True)
 
     # Cleanup stale locks before launching
@@ -305,7 +308,7 @@ def is_chrome_profile_locked(profile_dir: str | None = None) -> bool:
     if profile_dir is None:
         # Check OUR profile, not the default Chrome profile
         # We use a separate profile so we can run alongside the user's main Chrome
-        profile_dir = str(Path.home() / ".notebooklm-mcp" / "chrome-profile")
+        profile_dir = str(get_profile_dir() / "chrome-profile")
 
     # Chrome creates a "SingletonLock" file when the profile is in use
     lock_file = Path(profile_dir) / "SingletonLock"
@@ -668,6 +671,7 @@ EXAMPLES:
   notebooklm-mcp-auth --file               # Guided file import (recommended)
   notebooklm-mcp-auth --file ~/cookies.txt # Direct file import
   notebooklm-mcp-auth                      # Auto mode (close Chrome first)
+  notebooklm-mcp-auth --profile work2      # Add a second account to the client pool
 
 After authentication, start the MCP server with: notebooklm-mcp
         """
@@ -701,8 +705,19 @@ After authentication, start the MCP server with: notebooklm-mcp
         help="Run in headless mode (no visible UI, shorter timeout)"
     )
 
+    parser.add_argument(
+        "--profile",
+        default=None,
+        help="Auth profile to authenticate (default: NOTEBOOKLM_PROFILE or 'default'). "
+             "Each profile is a separate Google account used by the client pool."
+    )
+
     args = parser.parse_args()
 
+    if args.profile:
+        # get_profile_dir()/get_cache_path() read this; also inherited by Chrome helpers
+        os.environ["NOTEBOOKLM_PROFILE"] = args.profile
+
     if args.show_tokens:
         cache_path = get_cache_path()
         if cache_path.exists():
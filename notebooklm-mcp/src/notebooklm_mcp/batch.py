@@ -0,0 +1,239 @@
+"""Dependency-aware execution of batched tool calls.
+
+A batch is a list of operations:
+
+    {"id": "nb", "tool": "notebook_create", "args": {"title": "Research"}}
+    {"id": "src1", "tool": "notebook_add_url",
+     "args": {"notebook_id": "$nb.notebook.id", "url": "https://example.com"}}
+
+A string argument of the form "$<op id>.<path>" is replaced by a value from
+that operation's result (path segments are dict keys or list indexes) and
+makes the operation depend on it. "after": ["op id", ...] adds dependencies
+without a reference.
+
+Operations run as soon as their dependencies succeed, up to a concurrency
+limit (never more than MAX_BATCH_CONCURRENCY). Ready operations that share a
+group key (e.g. sources added to the same notebook) are handed to a group
+runner together, so they can share one batchexecute request. An operation
+whose dependency failed is skipped.
+"""
+
+import os
+import time
+from collections.abc import Callable, Collection, Hashable
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any
+
+RunOne = Callable[[str, dict], dict]
+RunGroup = Callable[[list[tuple[str, dict]]], list[dict]]
+GroupKey = Callable[[str, dict], Hashable | None]
+
+# Upper bound on a batch's worker threads, whatever concurrency the caller
+# asks for. They are separate from the server's tool pool: a running batch
+# holds one tool thread plus up to this many of its own.
+MAX_BATCH_CONCURRENCY = max(1, int(os.environ.get("NOTEBOOKLM_MAX_BATCH_CONCURRENCY", "8")))
+
+
+@dataclass
+class Operation:
+    id: str
+    tool: str
+    args: dict[str, Any]
+    after: set[str] = field(default_factory=set)
+
+
+def _references(value: Any, ids: Collection[str]) -> set[str]:
+    """Operation IDs referenced anywhere in an argument value."""
+    if isinstance(value, str):
+        ref = _split_reference(value, ids)
+        return {ref[0]} if ref else set()
+    if isinstance(value, dict):
+        return set().union(*(_references(v, ids) for v in value.values()))
+    if isinstance(value, list):
+        return set().union(*(_references(v, ids) for v in value))
+    return set()
+
+
+def _split_reference(value: str, ids: Collection[str]) -> tuple[str, list[str]] | None:
+    if not value.startswith("$"):
+        return None
+    op_id, _, path = value[1:].partition(".")
+    if op_id not in ids:
+        return None  # an ordinary string that happens to start with "$"
+    return op_id, path.split(".") if path else []
+
+
+def parse_operations(raw: list[dict], tools: Collection[str]) -> list[Operation]:
+    """Validate a batch and work out each operation's dependencies.
+
+    Raises:
+        ValueError: on unknown tools, duplicate or unknown IDs, or cycles
+    """
+    if not raw:
+        raise ValueError("Batch has no operations")
+    ids = [str(op.get("id") or f"op{i}") for i, op in enumerate(raw)]
+    duplicates = {i for i in ids if ids.count(i) > 1}
+    if duplicates:
+        raise ValueError(f"Duplicate operation id(s): {', '.join(sorted(duplicates))}")
+
+    operations = []
+    for op_id, op in zip(ids, raw):
+        tool = op.get("tool")
+        if tool not in tools:
+            raise ValueError(f"Operation '{op_id}': unknown or unsupported tool '{tool}'")
+        args = op.get("args") or {}
+        if not isinstance(args, dict):
+            raise ValueError(f"Operation '{op_id}': args must be an object")
+        after = set(op.get("after") or []) | _references(args, ids)
+        unknown = after - set(ids)
+        if unknown:
+            raise ValueError(f"Operation '{op_id}' depends on unknown id(s): {', '.join(sorted(unknown))}")
+        operations.append(Operation(op_id, tool, args, after))
+
+    # Reject cycles up front; otherwise the batch would stall
+    done: set[str] = set()
+    pending = list(operations)
+    while pending:
+        ready = [op for op in pending if op.after <= done]
+        if not ready:
+            raise ValueError(
+                f"Dependency cycle between: {', '.join(op.id for op in pending)}"
+            )
+        done.update(op.id for op in ready)
+        pending = [op for op in pending if op.id not in done]
+    return operations
+
+
+def resolve_references(value: Any, results: dict[str, dict]) -> Any:
+    """Replace "$<op id>.<path>" strings with values from earlier results."""
+    if isinstance(value, str):
+        ref = _split_reference(value, results)
+        if ref is None:
+            return value
+        op_id, path = ref
+        current: Any = results[op_id]
+        for part in path:
+            if isinstance(current, list) and part.lstrip("-").isdigit():
+                current = current[int(part)]
+            elif isinstance(current, dict) and part in current:
+                current = current[part]
+            else:
+                raise ValueError(f"Reference {value}: no '{part}' in result of '{op_id}'")
+        return current
+    if isinstance(value, dict):
+        return {k: resolve_references(v, results) for k, v in value.items()}
+    if isinstance(value, list):
+        return [resolve_references(v, results) for v in value]
+    return value
+
+
+def _failed(result: dict) -> bool:
+    return result.get("status") == "error"
+
+
+def run_batch(
+    operations: list[Operation],
+    run_one: RunOne,
+    run_group: RunGroup | None = None,
+    group_key: GroupKey | None = None,
+    concurrency: int = 4,
+    stop_on_error: bool = False,
+    on_result: Callable[[dict], None] | None = None,
+) -> list[dict]:
+    """Run a parsed batch and return one entry per operation, in input order.
+
+    Args:
+        operations: From parse_operations
+        run_one: Runs a single tool call and returns its result dict
+        run_group: Runs several (tool, args) calls together, one result per call
+        group_key: Returns a key for calls that may share a run_group call (None = never)
+        concurrency: Maximum tool calls / groups in flight (capped at MAX_BATCH_CONCURRENCY)
+        stop_on_error: Don't start new operations after the first failure
+        on_result: Called with each entry as it completes
+    """
+    entries: dict[str, dict] = {}
+    results: dict[str, dict] = {}
+    pending = list(operations)
+    running: dict[Future, list[tuple[Operation, float]]] = {}
+    stopped = False
+    concurrency = max(1, min(concurrency, MAX_BATCH_CONCURRENCY))
+
+    def _finish(op: Operation, status: str, result: dict | None, error: str | None, started: float | None) -> None:
+        entry: dict[str, Any] = {"id": op.id, "tool": op.tool, "status": status}
+        if result is not None:
+            entry["result"] = result
+            results[op.id] = result
+        if error is not None:
+            entry["error"] = error
+        if started is not None:
+            entry["elapsed_seconds"] = round(time.monotonic() - started, 3)
+        entries[op.id] = entry
+        if on_result is not None:
+            on_result(entry)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="notebooklm-batch") as executor:
+        while pending or running:
+            # Skip operations that can no longer run
+            for op in list(pending):
+                failed_deps = [d for d in op.after if d in entries and entries[d]["status"] != "success"]
+                if failed_deps or stopped:
+                    reason = (
+                        f"Dependency failed: {', '.join(sorted(failed_deps))}" if failed_deps
+                        else "Not started: an earlier operation failed"
+                    )
+                    pending.remove(op)
+                    _finish(op, "skipped", None, reason, None)
+
+            ready = [op for op in pending if all(d in results and not _failed(results[d]) for d in op.after)]
+
+            # Resolve references now that dependencies are done, then group
+            batches: dict[Hashable, list[tuple[Operation, dict]]] = {}
+            singles: list[tuple[Operation, dict]] = []
+            for op in ready:
+                if len(running) + len(batches) + len(singles) >= concurrency:
+                    break
+                pending.remove(op)
+                try:
+                    args = resolve_references(op.args, results)
+                except (ValueError, IndexError) as e:
+                    _finish(op, "error", None, str(e), None)
+                    continue
+                key = group_key(op.tool, args) if run_group and group_key else None
+                if key is None:
+                    singles.append((op, args))
+                else:
+                    batches.setdefault(key, []).append((op, args))
+
+            now = time.monotonic()
+            for op, args in singles:
+                running[executor.submit(run_one, op.tool, args)] = [(op, now)]
+            for members in batches.values():
+                if len(members) == 1:
+                    op, args = members[0]
+                    running[executor.submit(run_one, op.tool, args)] = [(op, now)]
+                else:
+                    future = executor.submit(run_group, [(op.tool, args) for op, args in members])
+                    running[future] = [(op, now) for op, _ in members]
+
+            if not running:
+                continue  # everything left was just skipped or failed to resolve
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                members = running.pop(future)
+                try:
+                    outcome = future.result()
+                    group_results = outcome if len(members) > 1 else [outcome]
+                except Exception as e:
+                    group_results = [{"status": "error", "error": str(e)}] * len(members)
+                for (op, started), result in zip(members, group_results):
+                    if not isinstance(result, dict):
+                        result = {"status": "success", "result": result}
+                    if _failed(result):
+                        stopped = stopped or stop_on_error
+                        _finish(op, "error", result, result.get("error"), started)
+                    else:
+                        _finish(op, "success", result, None, started)
+
+    return [entries[op.id] for op in operations]
@@ -0,0 +1,141 @@
+"""Pluggable JSON codec for NotebookLM MCP.
+
+batchexecute frames are JSON inside JSON, so every RPC pays for at least two
+decodes and two encodes. This module picks the fastest available backend:
+orjson, then msgspec, then the stdlib json module.
+
+Set NOTEBOOKLM_JSON_BACKEND=orjson|msgspec|json to force a backend.
+
+Callers must go through the module (``codec.loads``/``codec.dumps``) rather
+than importing the functions directly, so that ``use()`` can swap backends.
+"""
+
+import json
+import os
+from typing import Any
+
+# All backends raise (a subclass of) this on invalid input
+JSONDecodeError = json.JSONDecodeError
+
+BACKENDS = ("orjson", "msgspec", "json")
+
+backend = "json"
+
+
+def _json_loads(s: str | bytes) -> Any:
+    return json.loads(s)
+
+
+def _json_dumps(obj: Any) -> str:
+    # Compact format matching Chrome (no spaces)
+    return json.dumps(obj, separators=(",", ":"))
+
+
+loads = _json_loads
+dumps = _json_dumps
+
+
+def _build_orjson():
+    import orjson
+
+    def _loads(s: str | bytes) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            # orjson rejects a few inputs the stdlib accepts (NaN, Infinity).
+            # Let the stdlib decide, it raises JSONDecodeError if really invalid.
+            return json.loads(s)
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            # Non-str dict keys, ints wider than 64 bits, ...
+            return _json_dumps(obj)
+
+    return _loads, _dumps
+
+
+def _build_msgspec():
+    import msgspec
+
+    decoder = msgspec.json.Decoder()
+    encoder = msgspec.json.Encoder()
+
+    def _loads(s: str | bytes) -> Any:
+        try:
+            return decoder.decode(s)
+        except msgspec.DecodeError:
+            return json.loads(s)
+
+    def _dumps(obj: Any) -> str:
+        try:
+            return encoder.encode(obj).decode()
+        except (TypeError, msgspec.EncodeError):
+            return _json_dumps(obj)
+
+    return _loads, _dumps
+
+
+_BUILDERS = {
+    "orjson": _build_orjson,
+    "msgspec": _build_msgspec,
+}
+
+
+def available_backends() -> list[str]:
+    """Return the backends that can be imported in this environment."""
+    names = []
+    for name in BACKENDS:
+        if name == "json":
+            names.append(name)
+            continue
+        try:
+            _BUILDERS[name]()
+        except ImportError:
+            continue
+        names.append(name)
+    return names
+
+
+def use(name: str | None = None) -> str:
+    """Select the JSON backend.
+
+    Args:
+        name: orjson|msgspec|json, or None to pick the fastest installed one
+
+    Returns:
+        The name of the backend now in use
+
+    Raises:
+        ValueError: If the name is unknown
+        ImportError: If the requested backend is not installed
+    """
+    global backend, loads, dumps
+
+    if name is not None and name not in BACKENDS:
+        raise ValueError(f"Unknown JSON backend '{name}'. Use one of: {', '.join(BACKENDS)}")
+
+    candidates = [name] if name else list(BACKENDS)
+    for candidate in candidates:
+        if candidate == "json":
+            loads, dumps = _json_loads, _json_dumps
+            backend = "json"
+            return backend
+        try:
+            loads, dumps = _BUILDERS[candidate]()
+        except ImportError:
+            if name:
+                raise
+            continue
+        backend = candidate
+        return backend
+
+    return backend
+
+
+try:
+    use(os.environ.get("NOTEBOOKLM_JSON_BACKEND") or None)
+except (ImportError, ValueError):
+    # Requested backend unavailable - never fail import over an optimization
+    use()
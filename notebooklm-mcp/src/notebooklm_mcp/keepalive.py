@@ -0,0 +1,133 @@
+"""Background session keep-alive.
+
+CSRF tokens go stale within minutes of inactivity, and Google rotates some
+cookies over time. Without a keep-alive, the first request after an idle
+period pays for a homepage fetch - or a full headless re-authentication.
+
+The scheduler refreshes every pooled profile's session on a fixed interval
+(NotebookLMClient.refresh_session: one authenticated page fetch that renews the
+CSRF token and session ID, captures rotated cookies and writes them to the
+token cache). Failures are tracked per profile and exposed through health(),
+so auth problems show up before a user request hits them.
+
+Opt-in: set NOTEBOOKLM_KEEPALIVE_INTERVAL to a number of seconds (e.g. 600).
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .pool import ClientPool
+
+# A profile is reported unhealthy after this many failed refreshes in a row
+UNHEALTHY_AFTER_FAILURES = 2
+
+
+@dataclass
+class _ProfileState:
+    last_attempt_at: float | None = None
+    last_success_at: float | None = None
+    consecutive_failures: int = 0
+    last_error: str | None = None
+    rotated_cookies: int = 0
+
+
+class KeepAlive:
+    """Periodically refresh the sessions of every profile in a ClientPool.
+
+    Takes a pool getter rather than a pool, since the server replaces its pool
+    when new auth tokens are saved.
+    """
+
+    def __init__(self, get_pool: Callable[[], "ClientPool"], interval_seconds: float):
+        if interval_seconds <= 0:
+            raise ValueError("interval_seconds must be positive")
+        self.get_pool = get_pool
+        self.interval_seconds = interval_seconds
+        self._state: dict[str, _ProfileState] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="notebooklm-keepalive", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def _run(self) -> None:
+        # The first tick waits a full interval: start-up just refreshed everything
+        while not self._stop.wait(self.interval_seconds):
+            self.tick()
+
+    def tick(self) -> None:
+        """Refresh every profile once."""
+        try:
+            pool = self.get_pool()
+        except Exception:
+            return
+        for profile in pool.profiles:
+            if self._stop.is_set():
+                return
+            self._refresh(pool, profile)
+
+    def _refresh(self, pool: "ClientPool", profile: str) -> None:
+        started = time.time()
+        try:
+            rotated = pool.get_member(profile).refresh_session()
+        except Exception as e:
+            with self._lock:
+                state = self._state.setdefault(profile, _ProfileState())
+                state.last_attempt_at = started
+                state.consecutive_failures += 1
+                state.last_error = str(e)
+            return
+        with self._lock:
+            state = self._state.setdefault(profile, _ProfileState())
+            state.last_attempt_at = started
+            state.last_success_at = time.time()
+            state.consecutive_failures = 0
+            state.last_error = None
+            state.rotated_cookies += len(rotated)
+
+    def health(self) -> dict[str, Any]:
+        """Keep-alive status per profile, suitable for alerting."""
+        now = time.time()
+        with self._lock:
+            profiles = [
+                {
+                    "profile": profile,
+                    "healthy": state.consecutive_failures < UNHEALTHY_AFTER_FAILURES,
+                    "last_success_age_seconds": (
+                        round(now - state.last_success_at) if state.last_success_at else None
+                    ),
+                    "consecutive_failures": state.consecutive_failures,
+                    "last_error": state.last_error,
+                    "rotated_cookies": state.rotated_cookies,
+                }
+                for profile, state in self._state.items()
+            ]
+        return {
+            "running": self._thread is not None and self._thread.is_alive(),
+            "interval_seconds": self.interval_seconds,
+            "healthy": all(p["healthy"] for p in profiles),
+            "profiles": profiles,
+        }
+
+
+def interval_from_env() -> float:
+    """NOTEBOOKLM_KEEPALIVE_INTERVAL in seconds; 0 (the default) disables keep-alive."""
+    try:
+        return max(0.0, float(os.environ.get("NOTEBOOKLM_KEEPALIVE_INTERVAL", "0")))
+    except ValueError:
+        return 0.0
@@ -0,0 +1,118 @@
+"""Cursor pagination, field selection and size budgets for tool results.
+
+NotebookLM returns whole collections in one RPC (every notebook, every source
+of a notebook), and a large account can easily produce a tool result worth
+tens of thousands of LLM tokens. Tools trim results here:
+
+- fields: only the requested keys are built and returned
+- cursor: an opaque token for the next page, returned as next_cursor
+- max_tokens: stop adding items once the serialized page would exceed the
+  budget (estimated at ~4 bytes of JSON per token)
+
+Cursors record the position and the ID of the last item returned, so a page
+boundary survives items being added or removed between calls.
+"""
+
+import base64
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from . import codec
+
+# Rough bytes of compact JSON per LLM token
+BYTES_PER_TOKEN = 4
+
+
+def estimate_tokens(value: Any) -> int:
+    """Approximate LLM tokens needed for a JSON-serializable value."""
+    return len(codec.dumps(value).encode()) // BYTES_PER_TOKEN + 1
+
+
+def resolve_fields(
+    requested: Iterable[str] | None,
+    available: Iterable[str],
+    default: Iterable[str],
+) -> set[str]:
+    """Validate requested field names; None means the default set."""
+    if requested is None:
+        return set(default)
+    fields = {f.strip() for f in requested if f and f.strip()}
+    unknown = fields - set(available)
+    if unknown:
+        raise ValueError(
+            f"Unknown field(s): {', '.join(sorted(unknown))}. "
+            f"Available: {', '.join(sorted(available))}"
+        )
+    return fields
+
+
+def encode_cursor(offset: int, last_id: str | None) -> str:
+    return base64.urlsafe_b64encode(codec.dumps([offset, last_id]).encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[int, str | None]:
+    """Return (offset, last_id) from a cursor made by encode_cursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        offset, last_id = codec.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(offset, int) or offset < 0:
+            raise ValueError
+    except Exception:
+        raise ValueError(f"Invalid cursor: {cursor}") from None
+    return offset, last_id
+
+
+def _start_index(items: list, key: Callable[[Any], str], cursor: str) -> int:
+    if not cursor:
+        return 0
+    offset, last_id = decode_cursor(cursor)
+    if last_id is None or (0 < offset <= len(items) and key(items[offset - 1]) == last_id):
+        return min(offset, len(items))
+    # Items shifted since the last page: resume after the last item we returned
+    for i, item in enumerate(items):
+        if key(item) == last_id:
+            return i + 1
+    return min(offset, len(items))
+
+
+def paginate(
+    items: list,
+    key: Callable[[Any], str],
+    render: Callable[[Any], dict],
+    cursor: str = "",
+    limit: int = 0,
+    max_tokens: int = 0,
+) -> tuple[list[dict], str | None]:
+    """Render one page of items.
+
+    Args:
+        items: Full collection, in a stable order
+        key: Returns an item's ID (stored in the cursor)
+        render: Builds the returned dict for an item; only called for items on the page
+        cursor: next_cursor from the previous page, or "" for the first page
+        limit: Maximum items per page (0 = no limit)
+        max_tokens: Approximate token budget for the page (0 = no limit).
+            At least one item is always returned so paging makes progress.
+
+    Returns:
+        (page, next_cursor) where next_cursor is None on the last page
+    """
+    start = _start_index(items, key, cursor)
+    end = len(items) if limit <= 0 else min(len(items), start + limit)
+
+    page: list[dict] = []
+    used = 0
+    index = start
+    while index < end:
+        rendered = render(items[index])
+        if max_tokens > 0:
+            cost = estimate_tokens(rendered)
+            if page and used + cost > max_tokens:
+                break
+            used += cost
+        page.append(rendered)
+        index += 1
+
+    if index >= len(items):
+        return page, None
+    return page, encode_cursor(index, key(items[index - 1]) if index > 0 else None)
@@ -0,0 +1,393 @@
+"""Multi-account client pool.
+
+NotebookLM rate-limits per Google account. ClientPool keeps one warm
+NotebookLMClient per auth profile (see auth.get_profile_dir) and hands them
+out per call:
+
+- Reads and queries go to the least busy healthy profile that can see the
+  notebook (owned or shared with it).
+- Writes to an existing notebook go to the profile that owns it.
+- A profile that fails repeatedly (auth, rate limit, network) is taken out of
+  rotation for a cooldown period.
+
+With a single profile the pool is a thin wrapper around one client and never
+makes extra requests.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .api_client import Notebook, NotebookLMClient
+
+# Consecutive failures before a profile is taken out of rotation
+DEFAULT_FAILURE_THRESHOLD = 3
+# Seconds a failing profile stays out of rotation
+DEFAULT_COOLDOWN_SECONDS = 300.0
+# Minimum seconds between notebook-ownership refreshes triggered by unknown IDs
+MEMBERSHIP_REFRESH_SECONDS = 60.0
+
+
+def _is_profile_failure(error: Exception) -> bool:
+    """Whether an error says something about the profile rather than the request."""
+    import httpx
+
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status in (401, 403, 429) or status >= 500
+    if isinstance(error, httpx.TransportError):
+        return True
+    # Raised by _refresh_auth_tokens when cookies are dead
+    return isinstance(error, ValueError) and "expired" in str(error).lower()
+
+
+@dataclass
+class _Member:
+    profile: str
+    client: "NotebookLMClient | None" = None
+    outstanding: int = 0
+    consecutive_failures: int = 0
+    disabled_until: float = 0.0
+    last_error: str | None = None
+    total_requests: int = 0
+    create_lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def healthy(self, now: float) -> bool:
+        return self.disabled_until <= now
+
+
+class PooledClient:
+    """A NotebookLMClient bound to one pool member.
+
+    Attribute access is forwarded to the underlying client; every method call
+    is counted as an outstanding request and its outcome feeds the member's
+    health.
+    """
+
+    def __init__(self, pool: "ClientPool", member: _Member):
+        self._pool = pool
+        self._member = member
+
+    @property
+    def profile(self) -> str:
+        return self._member.profile
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._pool._client_for(self._member), name)
+        if not callable(attr):
+            return attr
+
+        def _call(*args: Any, **kwargs: Any) -> Any:
+            self._pool._begin(self._member)
+            try:
+                result = attr(*args, **kwargs)
+            except Exception as e:
+                self._pool._end(self._member, e)
+                raise
+            self._pool._end(self._member, None)
+            self._pool._observe(self._member, name, args, kwargs, result)
+            return result
+
+        return _call
+
+
+class ClientPool:
+    """Route NotebookLM calls across several authenticated profiles."""
+
+    def __init__(
+        self,
+        profiles: list[str],
+        factory: Callable[[str], "NotebookLMClient"],
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        cooldown_seconds: float = DEFAULT_COOLDOWN_SECONDS,
+    ):
+        if not profiles:
+            raise ValueError("ClientPool needs at least one profile")
+        self._members = [_Member(profile) for profile in dict.fromkeys(profiles)]
+        self._by_profile = {m.profile: m for m in self._members}
+        self._factory = factory
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._lock = threading.Lock()
+        # notebook_id -> owning profile, and notebook_id -> profiles that can read it
+        self._owner: dict[str, str] = {}
+        self._readers: dict[str, set[str]] = {}
+        self._membership_refreshed_at = 0.0
+
+    @property
+    def profiles(self) -> list[str]:
+        return [m.profile for m in self._members]
+
+    # ------------------------------------------------------------------
+    # Routing
+    # ------------------------------------------------------------------
+
+    def get(self, notebook_id: str | None = None, write: bool = False) -> PooledClient:
+        """Pick a client for a call.
+
+        Args:
+            notebook_id: Notebook the call targets, if any
+            write: True if the call modifies the notebook (routes to its owner)
+        """
+        return PooledClient(self, self._choose(notebook_id, write))
+
+    def ranked(self, notebook_id: str | None = None, write: bool = False) -> list[PooledClient]:
+        """Clients in the order to try them: get()'s pick, then every other profile.
+
+        For calls keyed by something the pool can't map to a profile (e.g. a
+        source ID), where the first profile may not be able to see it.
+        """
+        first = self._choose(notebook_id, write)
+        return [PooledClient(self, first)] + [
+            PooledClient(self, m) for m in self._members if m is not first
+        ]
+
+    def _choose(self, notebook_id: str | None, write: bool) -> _Member:
+        if len(self._members) == 1:
+            return self._members[0]
+
+        if notebook_id and notebook_id not in self._readers:
+            self._refresh_membership()
+
+        with self._lock:
+            now = time.monotonic()
+            candidates = self._members
+            if notebook_id and notebook_id in self._readers:
+                owner = self._owner.get(notebook_id)
+                if write and owner:
+                    # Only the owner can write; don't fail over to a profile that can't
+                    return self._by_profile[owner]
+                readers = self._readers[notebook_id]
+                candidates = [m for m in self._members if m.profile in readers] or candidates
+
+            healthy = [m for m in candidates if m.healthy(now)]
+            # Everyone is cooling down: use whoever recovers first rather than failing
+            pool = healthy or sorted(candidates, key=lambda m: m.disabled_until)[:1]
+            return min(pool, key=lambda m: (m.outstanding, m.total_requests))
+
+    def _refresh_membership(self, force: bool = False) -> None:
+        """List notebooks on every healthy profile to learn ownership."""
+        now = time.monotonic()
+        with self._lock:
+            if not force and now - self._membership_refreshed_at < MEMBERSHIP_REFRESH_SECONDS:
+                return
+            self._membership_refreshed_at = now
+        try:
+            self.list_notebooks()
+        except Exception:
+            pass  # route without ownership info; the call itself will report errors
+
+    def _client_for(self, member: _Member) -> "NotebookLMClient":
+        if member.client is None:
+            with member.create_lock:
+                if member.client is None:
+                    try:
+                        member.client = self._factory(member.profile)
+                    except Exception as e:
+                        self._record_failure(member, e, force=True)
+                        raise
+        return member.client
+
+    # ------------------------------------------------------------------
+    # Bookkeeping
+    # ------------------------------------------------------------------
+
+    def _begin(self, member: _Member) -> None:
+        with self._lock:
+            member.outstanding += 1
+            member.total_requests += 1
+
+    def _end(self, member: _Member, error: Exception | None) -> None:
+        with self._lock:
+            member.outstanding -= 1
+            if error is None:
+                member.consecutive_failures = 0
+                member.disabled_until = 0.0
+                return
+        if _is_profile_failure(error):
+            self._record_failure(member, error)
+
+    def _record_failure(self, member: _Member, error: Exception, force: bool = False) -> None:
+        with self._lock:
+            member.consecutive_failures += 1
+            member.last_error = str(error)
+            if force or member.consecutive_failures >= self.failure_threshold:
+                member.disabled_until = time.monotonic() + self.cooldown_seconds
+                if force:
+                    # Can't even build a client - drop it so the next attempt rebuilds
+                    member.client = None
+
+    def _observe(self, member: _Member, method: str, args: tuple, kwargs: dict, result: Any) -> None:
+        """Keep the ownership map current from calls that create or delete notebooks."""
+        if method == "create_notebook" and result is not None:
+            self._remember(result.id, member.profile, owned=True)
+        elif method == "delete_notebook" and result:
+            notebook_id = args[0] if args else kwargs.get("notebook_id")
+            with self._lock:
+                self._owner.pop(notebook_id, None)
+                self._readers.pop(notebook_id, None)
+
+    def _remember(self, notebook_id: str, profile: str, owned: bool) -> None:
+        with self._lock:
+            self._readers.setdefault(notebook_id, set()).add(profile)
+            if owned:
+                self._owner[notebook_id] = profile
+
+    # ------------------------------------------------------------------
+    # Pool-wide operations
+    # ------------------------------------------------------------------
+
+    def list_notebooks(self, fields: set[str] | None = None) -> list[tuple[str, "Notebook"]]:
+        """List notebooks across all healthy profiles as (profile, notebook).
+
+        Each notebook appears once, attributed to its owner when the owner is
+        in the pool. Also refreshes the ownership map used for routing.
+
+        Args:
+            fields: Passed to NotebookLMClient.list_notebooks (None = decode everything)
+        """
+        now = time.monotonic()
+        seen: dict[str, tuple[str, "Notebook"]] = {}
+        errors = []
+        for member in self._members:
+            if len(self._members) > 1 and not member.healthy(now):
+                continue
+            try:
+                notebooks = self.get_member(member.profile).list_notebooks(fields=fields)
+            except Exception as e:
+                errors.append(e)
+                continue
+            for nb in notebooks:
+                self._remember(nb.id, member.profile, owned=nb.is_owned)
+                if nb.id not in seen or nb.is_owned:
+                    seen[nb.id] = (member.profile, nb)
+        if errors and not seen:
+            raise errors[0]
+        return list(seen.values())
+
+    def get_member(self, profile: str) -> PooledClient:
+        """Get the client for a specific profile."""
+        if profile not in self._by_profile:
+            raise ValueError(f"Unknown profile: {profile}. Available: {self.profiles}")
+        return PooledClient(self, self._by_profile[profile])
+
+    def owner_of(self, notebook_id: str) -> str | None:
+        """Profile that owns a notebook, if known."""
+        return self._owner.get(notebook_id)
+
+    def query_many(self, notebook_ids: list[str], query_text: str, concurrency: int = 4) -> Iterator[dict]:
+        """Like NotebookLMClient.query_many, routing each notebook separately."""
+        from .api_client import fan_out_queries
+
+        def _query(notebook_id: str, query_text: str) -> dict | None:
+            return self.get(notebook_id).query(notebook_id, query_text=query_text)
+
+        yield from fan_out_queries(_query, notebook_ids, query_text, concurrency)
+
+    def warm(self) -> None:
+        """Build every profile's client in parallel."""
+        threads = [
+            threading.Thread(target=self._warm_member, args=(m,), daemon=True)
+            for m in self._members
+        ]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+    def _warm_member(self, member: _Member) -> None:
+        try:
+            self._client_for(member)
+        except Exception:
+            pass  # recorded as a failure; reported on first use
+
+    def health(self) -> list[dict[str, Any]]:
+        """Per-profile routing state."""
+        now = time.monotonic()
+        with self._lock:
+            return [
+                {
+                    "profile": m.profile,
+                    "healthy": m.healthy(now),
+                    "connected": m.client is not None,
+                    "outstanding": m.outstanding,
+                    "total_requests": m.total_requests,
+                    "consecutive_failures": m.consecutive_failures,
+                    "cooldown_remaining_seconds": round(max(0.0, m.disabled_until - now), 1),
+                    "last_error": m.last_error,
+                }
+                for m in self._members
+            ]
+
+    def close(self) -> None:
+        for member in self._members:
+            if member.client is not None:
+                member.client.close()
+                member.client = None
+
+
+def create_client(profile: str | None = None) -> "NotebookLMClient":
+    """Build a client from environment variables or a profile's cached tokens."""
+    from .answer_cache import AnswerCache
+    from .api_client import NotebookLMClient, extract_cookies_from_chrome_export
+    from .auth import load_cached_tokens
+
+    cookie_header = os.environ.get("NOTEBOOKLM_COOKIES", "")
+    csrf_token = os.environ.get("NOTEBOOKLM_CSRF_TOKEN", "")
+    session_id = os.environ.get("NOTEBOOKLM_SESSION_ID", "")
+
+    if cookie_header:
+        # Use environment variables (not tied to a profile's token cache)
+        cookies = extract_cookies_from_chrome_export(cookie_header)
+        profile = None
+    else:
+        # Try cached tokens from auth CLI
+        cached = load_cached_tokens(profile)
+        if cached:
+            cookies = cached.cookies
+            csrf_token = csrf_token or cached.csrf_token
+            session_id = session_id or cached.session_id
+        else:
+            raise ValueError(
+                "No authentication found. Either:\n"
+                "1. Run 'notebooklm-mcp-auth' to authenticate via Chrome, or\n"
+                "2. Set NOTEBOOKLM_COOKIES environment variable manually"
+            )
+
+    return NotebookLMClient(
+        cookies=cookies,
+        csrf_token=csrf_token,
+        session_id=session_id,
+        answer_cache=AnswerCache.from_env(),
+        profile=profile,
+    )
+
+
+def pool_from_env() -> ClientPool:
+    """Pool configured like the MCP server.
+
+    NOTEBOOKLM_COOKIES pins the pool to that single cookie set. Otherwise
+    every profile in NOTEBOOKLM_PROFILES (or every profile with cached
+    tokens) gets a client; with one profile this behaves like a single client.
+    """
+    from .auth import DEFAULT_PROFILE
+
+    if os.environ.get("NOTEBOOKLM_COOKIES"):
+        profiles = [DEFAULT_PROFILE]
+    else:
+        profiles = profiles_from_env() or [DEFAULT_PROFILE]
+    return ClientPool(profiles, create_client)
+
+
+def profiles_from_env() -> list[str]:
+    """Profiles to pool: NOTEBOOKLM_PROFILES (comma-separated) or every cached profile."""
+    from .auth import list_profiles
+
+    configured = os.environ.get("NOTEBOOKLM_PROFILES", "")
+    if configured.strip():
+        return [p.strip() for p in configured.split(",") if p.strip()]
+    return list_profiles()
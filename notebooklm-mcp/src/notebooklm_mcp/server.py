@@ -1,10 +1,26 @@
 """NotebookLM MCP Server."""
 
-from typing import Any
+import asyncio
+import contextvars
+import functools
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any
 
 from fastmcp import FastMCP
 
-from .api_client import NotebookLMClient, extract_cookies_from_chrome_export, parse_timestamp
+from . import codec
+
+if TYPE_CHECKING:
+    # Annotations only: pool and keepalive are imported where first used
+    # (get_pool(), start_keepalive()), and api_client (with httpx) only when
+    # the pool builds its first client, to keep server start-up - and the MCP
+    # handshake - fast.
+    from .keepalive import KeepAlive
+    from .pool import ClientPool, PooledClient
 
 # Initialize MCP server
 mcp = FastMCP(
@@ -17,59 +33,244 @@ mcp = FastMCP(
 )
 
 # Global state
-_client: NotebookLMClient | None = None
+_pool: "ClientPool | None" = None
+_pool_lock = threading.Lock()
+_keepalive: "KeepAlive | None" = None
+
+
+def get_pool() -> "ClientPool":
+    """Get or create the client pool (configured by pool.pool_from_env)."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                from .pool import pool_from_env
 
+                _pool = pool_from_env()
+    return _pool
 
-def get_client() -> NotebookLMClient:
-    """Get or create the API client.
+
+def get_client(notebook_id: str | None = None, write: bool = False) -> "PooledClient":
+    """Get an API client for one call.
 
     Tries environment variables first, falls back to cached tokens from auth CLI.
+    Clients are created once per profile and reused; concurrent callers (e.g.
+    a tool call racing the start-up warm-up) share a single construction.
+
+    Args:
+        notebook_id: Notebook the call targets, used to route to a profile that can see it
+        write: True if the call modifies the notebook (routes to the owning profile)
     """
-    global _client
-    if _client is None:
-        import os
+    return get_pool().get(notebook_id, write=write)
+
+
+def call_on_source_owner(
+    notebook_id: str | None,
+    call: Callable[["PooledClient"], Any],
+    write: bool = False,
+    found: Callable[[Any], bool] = bool,
+) -> Any:
+    """Run a source-level call on a profile that can see the source.
+
+    With notebook_id the call is routed like any other notebook call.
+    Without it the pool can't tell which profile holds the source, so the
+    profiles are tried in turn until one returns a result that ``found``
+    accepts (by default, any truthy one); the last result (or error) is passed
+    on if none does.
+    """
+    if notebook_id:
+        return call(get_client(notebook_id, write=write))
+
+    clients = get_pool().ranked(write=write)
+    for i, client in enumerate(clients, 1):
+        try:
+            result = call(client)
+        except Exception:
+            if i == len(clients):
+                raise
+            continue
+        if found(result) or i == len(clients):
+            return result
+
+
+def warm_client_in_background() -> threading.Thread | None:
+    """Create the clients on a daemon thread while the server starts.
+
+    Token loading and the homepage fetch then overlap with the MCP handshake
+    instead of delaying the first tool call. Errors are ignored here - the
+    first tool call retries and reports them. Set NOTEBOOKLM_WARM_START=0 to
+    disable.
+    """
+    if os.environ.get("NOTEBOOKLM_WARM_START", "1") == "0":
+        return None
 
-        from .auth import load_cached_tokens
+    def _warm() -> None:
+        try:
+            get_pool().warm()
+        except Exception:
+            pass
 
-        cookie_header = os.environ.get("NOTEBOOKLM_COOKIES", "")
-        csrf_token = os.environ.get("NOTEBOOKLM_CSRF_TOKEN", "")
-        session_id = os.environ.get("NOTEBOOKLM_SESSION_ID", "")
+    thread = threading.Thread(target=_warm, name="notebooklm-warm-client", daemon=True)
+    thread.start()
+    return thread
 
-        if cookie_header:
-            # Use environment variables
-            cookies = extract_cookies_from_chrome_export(cookie_header)
-        else:
-            # Try cached tokens from auth CLI
-            cached = load_cached_tokens()
-            if cached:
-                cookies = cached.cookies
-                csrf_token = csrf_token or cached.csrf_token
-                session_id = session_id or cached.session_id
-            else:
-                raise ValueError(
-                    "No authentication found. Either:\n"
-                    "1. Run 'notebooklm-mcp-auth' to authenticate via Chrome, or\n"
-                    "2. Set NOTEBOOKLM_COOKIES environment variable manually"
-                )
 
-        _client = NotebookLMClient(
-            cookies=cookies,
-            csrf_token=csrf_token,
-            session_id=session_id,
-        )
-    return _client
+# Blocking tool bodies run here. Bounded so a burst of slow studio/query calls
+# can't start unlimited concurrent requests against one account.
+_tool_executor = ThreadPoolExecutor(
+    max_workers=max(1, int(os.environ.get("NOTEBOOKLM_TOOL_CONCURRENCY", "8"))),
+    thread_name_prefix="notebooklm-tool",
+)
 
 
-@mcp.tool()
-def notebook_list(max_results: int = 100) -> dict[str, Any]:
+async def run_blocking(fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """Run a blocking call on the tool thread pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    return await loop.run_in_executor(_tool_executor, functools.partial(ctx.run, fn, *args, **kwargs))
+
+
+# Minimum seconds between streamed-answer progress notifications
+PROGRESS_MIN_INTERVAL = 0.3
+
+
+def _artifact_progress(artifact: dict, artifact_type: str | None = None, **extra: Any) -> str:
+    """Progress message (JSON) for a studio artifact status change."""
+    return codec.dumps({
+        "artifact_id": artifact.get("artifact_id"),
+        "type": artifact.get("type", artifact_type),
+        "status": artifact.get("status"),
+        **extra,
+    })
+
+
+class _ProgressSink:
+    """Sends MCP progress notifications for one request from any thread."""
+
+    def __init__(self, ctx: Any, loop: asyncio.AbstractEventLoop):
+        self._ctx = ctx
+        self._loop = loop
+        self._pending: list[Any] = []
+
+    def __call__(self, progress: float, total: float | None, message: str | None) -> None:
+        # Never waits; works from worker threads and from the loop itself
+        self._pending.append(asyncio.run_coroutine_threadsafe(
+            self._ctx.report_progress(progress, total, message), self._loop
+        ))
+
+    async def flush(self) -> None:
+        """Wait until queued notifications are sent, so none trail the tool result."""
+        pending, self._pending = self._pending, []
+        if pending:
+            await asyncio.gather(*(asyncio.wrap_future(f) for f in pending), return_exceptions=True)
+
+
+# Progress sink for the tool call running in this context (see report_progress)
+_progress_sink: contextvars.ContextVar[_ProgressSink | None] = contextvars.ContextVar(
+    "notebooklm_progress_sink", default=None
+)
+
+
+def _current_progress_sink() -> _ProgressSink | None:
+    """Progress sender for the current MCP request, if any."""
+    try:
+        from fastmcp.server.dependencies import get_context
+        ctx = get_context()
+    except Exception:
+        # Not inside a request, or a FastMCP version without get_context()
+        return None
+    return _ProgressSink(ctx, asyncio.get_running_loop())
+
+
+def report_progress(progress: float, total: float | None = None, message: str | None = None) -> None:
+    """Send an MCP progress notification from a tool body.
+
+    Safe to call from the tool thread pool. A no-op unless the caller passed a
+    progress token with the request. Partial results go in message as JSON.
+    """
+    sink = _progress_sink.get()
+    if sink is not None:
+        try:
+            sink(progress, total, message)
+        except Exception:
+            pass  # progress is best-effort, never fail the tool over it
+
+
+# Blocking bodies of the tools registered with @tool, by name (used by batch)
+_tool_bodies: dict[str, Callable[..., Any]] = {}
+
+
+def tool(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """Register a blocking function as an async MCP tool.
+
+    The body runs via run_blocking, so concurrent tool calls from one MCP client
+    really run concurrently (up to NOTEBOOKLM_TOOL_CONCURRENCY, default 8)
+    regardless of how the installed FastMCP version handles sync tools. The
+    body can call report_progress().
+    """
+    _tool_bodies[fn.__name__] = fn
+
+    @functools.wraps(fn)
+    async def wrapper(*args: Any, **kwargs: Any) -> Any:
+        sink = _current_progress_sink()
+        token = _progress_sink.set(sink)
+        try:
+            return await run_blocking(fn, *args, **kwargs)
+        finally:
+            _progress_sink.reset(token)
+            if sink is not None:
+                await sink.flush()
+
+    return mcp.tool()(wrapper)
+
+
+def start_keepalive() -> "KeepAlive | None":
+    """Start the session keep-alive if NOTEBOOKLM_KEEPALIVE_INTERVAL is set."""
+    global _keepalive
+    from .keepalive import KeepAlive, interval_from_env
+
+    interval = interval_from_env()
+    if not interval or _keepalive is not None:
+        return _keepalive
+    _keepalive = KeepAlive(get_pool, interval)
+    _keepalive.start()
+    return _keepalive
+
+
+# Fields notebook_list can return, and the ones it returns by default
+NOTEBOOK_LIST_FIELDS = (
+    "id", "title", "source_count", "url", "ownership", "profile",
+    "is_shared", "created_at", "modified_at", "sources",
+)
+NOTEBOOK_LIST_DEFAULT_FIELDS = tuple(f for f in NOTEBOOK_LIST_FIELDS if f != "sources")
+
+
+@tool
+def notebook_list(
+    max_results: int = 100,
+    cursor: str = "",
+    fields: list[str] | None = None,
+    max_tokens: int = 0,
+) -> dict[str, Any]:
     """List all notebooks.
 
     Args:
-        max_results: Maximum number of notebooks to return (default: 100)
+        max_results: Maximum number of notebooks per page (default: 100)
+        cursor: next_cursor from a previous call, to get the following page
+        fields: Notebook fields to return (default: all but "sources"). Available:
+            id, title, source_count, url, ownership, profile, is_shared, created_at,
+            modified_at, sources
+        max_tokens: Approximate size budget for the page in LLM tokens (default: 0=no limit)
     """
     try:
-        client = get_client()
-        notebooks = client.list_notebooks()
+        from .paging import paginate, resolve_fields
+
+        selected = resolve_fields(fields, NOTEBOOK_LIST_FIELDS, NOTEBOOK_LIST_DEFAULT_FIELDS)
+
+        # All profiles in the pool, each notebook attributed to its owner
+        listed = get_pool().list_notebooks(fields=selected)
+        notebooks = [nb for _, nb in listed]
+        profile_of = {nb.id: profile for profile, nb in listed}
 
         # Count owned vs shared notebooks
         owned_count = sum(1 for nb in notebooks if nb.is_owned)
@@ -78,31 +279,53 @@ def notebook_list(max_results: int = 100) -> dict[str, Any]:
         # Count notebooks shared by me (owned + is_shared=True)
         shared_by_me_count = sum(1 for nb in notebooks if nb.is_owned and nb.is_shared)
 
-        return {
+        def _render(nb: Any) -> dict[str, Any]:
+            row = {
+                "id": nb.id,
+                "title": nb.title,
+                "source_count": nb.source_count,
+                "url": nb.url,
+                "ownership": nb.ownership,
+                "profile": profile_of[nb.id],
+                "is_shared": nb.is_shared,
+                "created_at": nb.created_at,
+                "modified_at": nb.modified_at,
+                "sources": nb.sources,
+            }
+            return {name: value for name, value in row.items() if name in selected}
+
+        result = {
             "status": "success",
             "count": len(notebooks),
             "owned_count": owned_count,
             "shared_count": shared_count,
             "shared_by_me_count": shared_by_me_count,
-            "notebooks": [
-                {
-                    "id": nb.id,
-                    "title": nb.title,
-                    "source_count": nb.source_count,
-                    "url": nb.url,
-                    "ownership": nb.ownership,
-                    "is_shared": nb.is_shared,
-                    "created_at": nb.created_at,
-                    "modified_at": nb.modified_at,
-                }
-                for nb in notebooks[:max_results]
-            ],
         }
+        page, next_cursor = paginate(
+            notebooks,
+            key=lambda nb: nb.id,
+            render=_render,
+            cursor=cursor,
+            limit=max_results,
+            max_tokens=_remaining_budget(max_tokens, result),
+        )
+        result["notebooks"] = page
+        result["next_cursor"] = next_cursor
+        return result
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+def _remaining_budget(max_tokens: int, header: dict[str, Any]) -> int:
+    """Token budget left for a page after the fixed part of the response."""
+    if max_tokens <= 0:
+        return 0
+    from .paging import estimate_tokens
+
+    return max(1, max_tokens - estimate_tokens(header))
+
+
+@tool
 def notebook_create(title: str = "") -> dict[str, Any]:
     """Create a new notebook.
 
@@ -110,7 +333,7 @@ def notebook_create(title: str = "") -> dict[str, Any]:
         title: Optional title for the notebook
     """
     try:
-        client = get_client()
+        client = get_client(write=True)
         notebook = client.create_notebook(title=title)
 
         if notebook:
@@ -127,41 +350,92 @@ def notebook_create(title: str = "") -> dict[str, Any]:
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
-def notebook_get(notebook_id: str) -> dict[str, Any]:
+# Fields notebook_get can return, and the ones it returns by default
+NOTEBOOK_GET_FIELDS = (
+    "id", "title", "emoji", "source_count", "sources", "created_at", "modified_at", "raw",
+)
+NOTEBOOK_GET_DEFAULT_FIELDS = tuple(f for f in NOTEBOOK_GET_FIELDS if f != "raw")
+
+
+@tool
+def notebook_get(
+    notebook_id: str,
+    fields: list[str] | None = None,
+    source_fields: list[str] | None = None,
+    cursor: str = "",
+    max_sources: int = 0,
+    max_tokens: int = 0,
+) -> dict[str, Any]:
     """Get notebook details with sources.
 
     Args:
         notebook_id: Notebook UUID
+        fields: Notebook fields to return (default: all but "raw"). Available: id, title,
+            emoji, source_count, sources, created_at, modified_at, raw (the unparsed API response)
+        source_fields: Fields per source (default: all). Available: id, title, source_type,
+            source_type_name, drive_doc_id, can_sync
+        cursor: next_cursor from a previous call, to get the following page of sources
+        max_sources: Maximum number of sources per page (default: 0=no limit)
+        max_tokens: Approximate size budget for the response in LLM tokens (default: 0=no limit)
     """
     try:
-        client = get_client()
-        result = client.get_notebook(notebook_id)
+        from .api_client import (
+            SOURCE_FIELDS,
+            notebook_source_entries,
+            parse_source,
+            parse_timestamp,
+            unwrap_notebook,
+        )
+        from .paging import paginate, resolve_fields
 
-        # Extract timestamps from metadata if available
-        # Result structure: [title, sources, id, emoji, null, metadata, ...]
-        # metadata[5] = modified_at, metadata[8] = created_at
-        created_at = None
-        modified_at = None
-        if result and isinstance(result, list) and len(result) > 5:
-            metadata = result[5]
-            if isinstance(metadata, list):
-                if len(metadata) > 5:
-                    modified_at = parse_timestamp(metadata[5])
-                if len(metadata) > 8:
-                    created_at = parse_timestamp(metadata[8])
+        selected = resolve_fields(fields, NOTEBOOK_GET_FIELDS, NOTEBOOK_GET_DEFAULT_FIELDS)
+        selected_source_fields = resolve_fields(source_fields, SOURCE_FIELDS, SOURCE_FIELDS)
 
-        return {
-            "status": "success",
-            "notebook": result,
-            "created_at": created_at,
-            "modified_at": modified_at,
-        }
+        client = get_client(notebook_id)
+        result = client.get_notebook(notebook_id)
+        # Notebook structure: [title, sources, id, emoji, null, metadata, ...]
+        data = unwrap_notebook(result)
+
+        notebook: dict[str, Any] = {}
+        if "id" in selected:
+            notebook["id"] = data[2] if len(data) > 2 else notebook_id
+        if "title" in selected:
+            notebook["title"] = data[0] if data and isinstance(data[0], str) else "Untitled"
+        if "emoji" in selected:
+            notebook["emoji"] = data[3] if len(data) > 3 else None
+        if "created_at" in selected or "modified_at" in selected:
+            # metadata[5] = modified_at, metadata[8] = created_at
+            metadata = data[5] if len(data) > 5 and isinstance(data[5], list) else []
+            if "created_at" in selected:
+                notebook["created_at"] = parse_timestamp(metadata[8]) if len(metadata) > 8 else None
+            if "modified_at" in selected:
+                notebook["modified_at"] = parse_timestamp(metadata[5]) if len(metadata) > 5 else None
+
+        entries = notebook_source_entries(data)
+        if "source_count" in selected:
+            notebook["source_count"] = len(entries)
+        if "raw" in selected:
+            notebook["raw"] = result
+
+        response: dict[str, Any] = {"status": "success", "notebook": notebook}
+        if "sources" in selected:
+            # Only sources on this page are decoded
+            page, next_cursor = paginate(
+                entries,
+                key=lambda src: parse_source(src, {"id"})["id"],
+                render=lambda src: parse_source(src, selected_source_fields),
+                cursor=cursor,
+                limit=max_sources,
+                max_tokens=_remaining_budget(max_tokens, response),
+            )
+            notebook["sources"] = page
+            response["next_cursor"] = next_cursor
+        return response
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def notebook_describe(notebook_id: str) -> dict[str, Any]:
     """Get AI-generated notebook summary with suggested topics.
 
@@ -171,7 +445,7 @@ def notebook_describe(notebook_id: str) -> dict[str, Any]:
     Returns: summary (markdown), suggested_topics list
     """
     try:
-        client = get_client()
+        client = get_client(notebook_id)
         result = client.get_notebook_summary(notebook_id)
 
         return {
@@ -182,18 +456,22 @@ def notebook_describe(notebook_id: str) -> dict[str, Any]:
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
-def source_describe(source_id: str) -> dict[str, Any]:
+@tool
+def source_describe(source_id: str, notebook_id: str | None = None) -> dict[str, Any]:
     """Get AI-generated source summary with keyword chips.
 
     Args:
         source_id: Source UUID
+        notebook_id: Notebook the source belongs to (optional, routes to its profile)
 
     Returns: summary (markdown with **bold** keywords), keywords list
     """
     try:
-        client = get_client()
-        result = client.get_source_guide(source_id)
+        result = call_on_source_owner(
+            notebook_id,
+            lambda client: client.get_source_guide(source_id),
+            found=lambda guide: bool(guide["summary"] or guide["keywords"]),
+        )
 
         return {
             "status": "success",
@@ -203,7 +481,7 @@ def source_describe(source_id: str) -> dict[str, Any]:
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def notebook_add_url(notebook_id: str, url: str) -> dict[str, Any]:
     """Add URL (website or YouTube) as source.
 
@@ -212,7 +490,7 @@ def notebook_add_url(notebook_id: str, url: str) -> dict[str, Any]:
         url: URL to add
     """
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
         result = client.add_url_source(notebook_id, url=url)
 
         if result:
@@ -225,7 +503,7 @@ def notebook_add_url(notebook_id: str, url: str) -> dict[str, Any]:
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def notebook_add_text(
     notebook_id: str,
     text: str,
@@ -239,7 +517,7 @@ def notebook_add_text(
         title: Optional title
     """
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
         result = client.add_text_source(notebook_id, text=text, title=title)
 
         if result:
@@ -252,7 +530,16 @@ def notebook_add_text(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+DRIVE_MIME_TYPES = {
+    "doc": "application/vnd.google-apps.document",
+    "docs": "application/vnd.google-apps.document",
+    "slides": "application/vnd.google-apps.presentation",
+    "sheets": "application/vnd.google-apps.spreadsheet",
+    "pdf": "application/pdf",
+}
+
+
+@tool
 def notebook_add_drive(
     notebook_id: str,
     document_id: str,
@@ -268,22 +555,14 @@ def notebook_add_drive(
         doc_type: doc|slides|sheets|pdf
     """
     try:
-        mime_types = {
-            "doc": "application/vnd.google-apps.document",
-            "docs": "application/vnd.google-apps.document",
-            "slides": "application/vnd.google-apps.presentation",
-            "sheets": "application/vnd.google-apps.spreadsheet",
-            "pdf": "application/pdf",
-        }
-
-        mime_type = mime_types.get(doc_type.lower())
+        mime_type = DRIVE_MIME_TYPES.get(doc_type.lower())
         if not mime_type:
             return {
                 "status": "error",
                 "error": f"Unknown doc_type '{doc_type}'. Use 'doc', 'slides', 'sheets', or 'pdf'.",
             }
 
-        client = get_client()
+        client = get_client(notebook_id, write=True)
         result = client.add_drive_source(
             notebook_id,
             document_id=document_id,
@@ -301,7 +580,7 @@ def notebook_add_drive(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def notebook_query(
     notebook_id: str,
     query: str,
@@ -315,14 +594,27 @@ def notebook_query(
         query: Question to ask
         source_ids: Source IDs to query (default: all)
         conversation_id: For follow-up questions
+
+    Progress notifications carry the answer text so far while it streams.
     """
+    last_sent = 0.0
+
+    def on_answer(text: str) -> None:
+        # Throttled - the complete answer is always in the result
+        nonlocal last_sent
+        now = time.monotonic()
+        if now - last_sent >= PROGRESS_MIN_INTERVAL:
+            last_sent = now
+            report_progress(len(text), None, text)
+
     try:
-        client = get_client()
+        client = get_client(notebook_id)
         result = client.query(
             notebook_id,
             query_text=query,
             source_ids=source_ids,
             conversation_id=conversation_id,
+            on_answer=on_answer if _progress_sink.get() else None,
         )
 
         if result:
@@ -330,13 +622,184 @@ def notebook_query(
                 "status": "success",
                 "answer": result.get("answer", ""),
                 "conversation_id": result.get("conversation_id"),
+                "cached": result.get("cached", False),
             }
         return {"status": "error", "error": "Failed to query notebook"}
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
+def notebook_query_many(
+    notebook_ids: list[str],
+    query: str,
+    concurrency: int = 4,
+) -> dict[str, Any]:
+    """Ask the same question across several notebooks in parallel.
+
+    Args:
+        notebook_ids: Notebook UUIDs to query (e.g. every notebook in a group)
+        query: Question to ask
+        concurrency: Max queries in flight at once (default: 4, capped at
+            NOTEBOOKLM_MAX_QUERY_CONCURRENCY, default 8)
+
+    Progress notifications carry each notebook's result (JSON) as it completes.
+    """
+    if not notebook_ids:
+        return {"status": "error", "error": "No notebook IDs provided"}
+
+    try:
+        started = time.perf_counter()
+        total = len(set(notebook_ids))
+        results = []
+        # Routed per notebook, so notebooks spread over profiles run in parallel too
+        for result in get_pool().query_many(notebook_ids, query_text=query, concurrency=concurrency):
+            results.append(result)
+            # Each notebook's result as soon as it's done
+            report_progress(len(results), total, codec.dumps(result))
+        succeeded = sum(1 for r in results if r["status"] == "success")
+
+        return {
+            "status": "success" if succeeded == len(results) else "partial" if succeeded else "error",
+            "summary": {
+                "total": len(results),
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded,
+                "wall_seconds": round(time.perf_counter() - started, 2),
+            },
+            # Completion order - fastest notebooks first
+            "results": results,
+        }
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+
+# Tools that can't run inside a batch
+_BATCH_EXCLUDED = {"batch", "save_auth_tokens"}
+# Source-adding tools whose calls on one notebook share a batchexecute request
+_SOURCE_ADD_TOOLS = {"notebook_add_url", "notebook_add_text", "notebook_add_drive"}
+
+
+def _batch_group_key(tool_name: str, args: dict) -> str | None:
+    if tool_name in _SOURCE_ADD_TOOLS and isinstance(args.get("notebook_id"), str):
+        return args["notebook_id"]
+    return None
+
+
+def _run_batch_op(tool_name: str, args: dict) -> dict:
+    try:
+        return _tool_bodies[tool_name](**args)
+    except TypeError as e:
+        # Bad or missing arguments
+        return {"status": "error", "error": str(e)}
+
+
+def _run_source_adds(calls: list[tuple[str, dict]]) -> list[dict]:
+    """Add several sources to one notebook with a single multi-RPC request."""
+    sources: list[dict] = []
+    invalid: dict[int, dict] = {}
+    for i, (tool_name, args) in enumerate(calls):
+        if tool_name == "notebook_add_url" and "url" in args:
+            sources.append({"url": args["url"]})
+        elif tool_name == "notebook_add_text" and "text" in args:
+            sources.append({"text": args["text"], "title": args.get("title", "Pasted Text")})
+        elif (
+            tool_name == "notebook_add_drive"
+            and {"document_id", "title"} <= args.keys()
+            and str(args.get("doc_type", "doc")).lower() in DRIVE_MIME_TYPES
+        ):
+            sources.append({
+                "document_id": args["document_id"],
+                "title": args["title"],
+                "mime_type": DRIVE_MIME_TYPES[str(args.get("doc_type", "doc")).lower()],
+            })
+        else:
+            # Let the tool itself report the argument error
+            invalid[i] = _run_batch_op(tool_name, args)
+
+    added = iter([])
+    if sources:
+        notebook_id = calls[0][1]["notebook_id"]
+        added = iter(get_client(notebook_id, write=True).add_sources(notebook_id, sources))
+
+    results = []
+    for i, (tool_name, _) in enumerate(calls):
+        if i in invalid:
+            results.append(invalid[i])
+            continue
+        source = next(added)
+        if source:
+            results.append({"status": "success", "source": source})
+        else:
+            kind = {"notebook_add_url": "URL", "notebook_add_text": "text"}.get(tool_name, "Drive")
+            results.append({"status": "error", "error": f"Failed to add {kind} source"})
+    return results
+
+
+@tool
+def batch(
+    operations: list[dict],
+    concurrency: int = 4,
+    stop_on_error: bool = False,
+) -> dict[str, Any]:
+    """Run several tool calls in one request, in parallel where possible.
+
+    Args:
+        operations: List of {"id": "...", "tool": "<tool name>", "args": {...}, "after": [ids]}.
+            A string arg "$<id>.<path>" is replaced by a value from that operation's result
+            (e.g. "$nb.notebook.id") and waits for it. "after" is optional.
+        concurrency: Max tool calls in flight at once (default: 4, capped at
+            NOTEBOOKLM_MAX_BATCH_CONCURRENCY, default 8)
+        stop_on_error: Don't start further operations after the first failure (default: False)
+
+    Independent operations run concurrently; sources added to the same notebook share one
+    request. Operations whose dependencies failed are skipped. Progress notifications
+    carry each operation's result (JSON) as it completes. Operations run on the batch's
+    own threads, not the tool pool, so they don't queue behind other tool calls.
+    """
+    try:
+        from .batch import parse_operations, run_batch
+
+        started = time.perf_counter()
+        available = set(_tool_bodies) - _BATCH_EXCLUDED
+        parsed = parse_operations(operations, available)
+
+        completed = 0
+
+        def _on_result(entry: dict) -> None:
+            nonlocal completed
+            completed += 1
+            report_progress(completed, len(parsed), codec.dumps(entry))
+
+        results = run_batch(
+            parsed,
+            run_one=_run_batch_op,
+            run_group=_run_source_adds,
+            group_key=_batch_group_key,
+            concurrency=concurrency,
+            stop_on_error=stop_on_error,
+            on_result=_on_result,
+        )
+        succeeded = sum(1 for r in results if r["status"] == "success")
+        skipped = sum(1 for r in results if r["status"] == "skipped")
+
+        return {
+            "status": "success" if succeeded == len(results) else "partial" if succeeded else "error",
+            "summary": {
+                "total": len(results),
+                "succeeded": succeeded,
+                "failed": len(results) - succeeded - skipped,
+                "skipped": skipped,
+                "wall_seconds": round(time.perf_counter() - started, 2),
+            },
+            # Input order
+            "results": results,
+        }
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+
+@tool
 def notebook_delete(
     notebook_id: str,
     confirm: bool = False,
@@ -357,7 +820,7 @@ def notebook_delete(
         }
 
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
         result = client.delete_notebook(notebook_id)
 
         if result:
@@ -370,7 +833,7 @@ def notebook_delete(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def notebook_rename(
     notebook_id: str,
     new_title: str,
@@ -382,7 +845,7 @@ def notebook_rename(
         new_title: New title
     """
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
         result = client.rename_notebook(notebook_id, new_title)
 
         if result:
@@ -398,7 +861,7 @@ def notebook_rename(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def chat_configure(
     notebook_id: str,
     goal: str = "default",
@@ -414,7 +877,7 @@ def chat_configure(
         response_length: default|longer|shorter
     """
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
         result = client.configure_chat(
             notebook_id=notebook_id,
             goal=goal,
@@ -428,7 +891,7 @@ def chat_configure(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def source_list_drive(notebook_id: str) -> dict[str, Any]:
     """List sources with types and Drive freshness status.
 
@@ -438,7 +901,7 @@ def source_list_drive(notebook_id: str) -> dict[str, Any]:
         notebook_id: Notebook UUID
     """
     try:
-        client = get_client()
+        client = get_client(notebook_id)
         sources = client.get_notebook_sources_with_types(notebook_id)
 
         # Separate sources by syncability
@@ -477,10 +940,11 @@ def source_list_drive(notebook_id: str) -> dict[str, Any]:
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def source_sync_drive(
     source_ids: list[str],
     confirm: bool = False,
+    notebook_id: str | None = None,
 ) -> dict[str, Any]:
     """Sync Drive sources with latest content. Requires confirm=True.
 
@@ -489,6 +953,9 @@ def source_sync_drive(
     Args:
         source_ids: Source UUIDs to sync
         confirm: Must be True after user approval
+        notebook_id: Notebook the sources belong to (optional, routes to its owner)
+
+    Progress notifications carry each source's result (JSON) as it syncs.
     """
     if not confirm:
         return {
@@ -506,14 +973,17 @@ def source_sync_drive(
         }
 
     try:
-        client = get_client()
         results = []
         synced_count = 0
         failed_count = 0
 
-        for source_id in source_ids:
+        for i, source_id in enumerate(source_ids, 1):
             try:
-                result = client.sync_drive_source(source_id)
+                result = call_on_source_owner(
+                    notebook_id,
+                    lambda client: client.sync_drive_source(source_id),
+                    write=True,
+                )
                 if result:
                     results.append({
                         "source_id": source_id,
@@ -535,6 +1005,8 @@ def source_sync_drive(
                     "error": str(e),
                 })
                 failed_count += 1
+            # Per-source result as soon as it's known
+            report_progress(i, len(source_ids), codec.dumps(results[-1]))
 
         return {
             "status": "success" if failed_count == 0 else "partial",
@@ -549,7 +1021,7 @@ def source_sync_drive(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def source_delete(
     source_id: str,
     confirm: bool = False,
@@ -570,7 +1042,7 @@ def source_delete(
         }
 
     try:
-        client = get_client()
+        client = get_client(write=True)
         result = client.delete_source(source_id)
 
         if result:
@@ -583,7 +1055,7 @@ def source_delete(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def research_start(
     query: str,
     source: str = "web",
@@ -601,7 +1073,7 @@ def research_start(
         title: Title for new notebook
     """
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
 
         # Validate mode + source combination early
         if mode.lower() == "deep" and source.lower() == "drive":
@@ -688,7 +1160,7 @@ def _compact_research_result(result: dict) -> dict:
 
 
 @mcp.tool()
-def research_status(
+async def research_status(
     notebook_id: str,
     poll_interval: int = 30,
     max_wait: int = 300,
@@ -703,16 +1175,17 @@ def research_status(
         compact: If True (default), truncate report and limit sources shown to save tokens.
                 Use compact=False to get full details.
     """
-    import time
-
     try:
-        client = get_client()
+        # Off the event loop: choosing a profile may list notebooks, and a
+        # cold pool builds the client (homepage fetch)
+        client = await run_blocking(get_client, notebook_id)
         start_time = time.time()
         polls = 0
 
         while True:
             polls += 1
-            result = client.poll_research(notebook_id)
+            # Lambda: attribute access may build the client (homepage fetch)
+            result = await run_blocking(lambda: client.poll_research(notebook_id))
 
             if not result:
                 return {"status": "error", "error": "Failed to poll research status"}
@@ -750,14 +1223,14 @@ def research_status(
                     "research": result,
                 }
 
-            # Wait before next poll
-            time.sleep(poll_interval)
+            # Wait before next poll - without holding a worker thread
+            await asyncio.sleep(poll_interval)
 
     except Exception as e:
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def research_import(
     notebook_id: str,
     task_id: str,
@@ -771,9 +1244,11 @@ def research_import(
         notebook_id: Notebook UUID
         task_id: Research task ID
         source_indices: Source indices to import (default: all)
+
+    Progress notifications carry each imported source (JSON).
     """
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
 
         # First, get the current research results to get source details
         poll_result = client.poll_research(notebook_id)
@@ -833,11 +1308,16 @@ def research_import(
 
         # Import web/drive sources (skip deep_report sources as they don't have URLs)
         web_sources_to_import = [s for s in sources_to_import if s.get("result_type") != 5]
+        total = len(web_sources_to_import) + (1 if deep_report_source and report_content else 0)
+        report_progress(0, total, f"Importing {len(web_sources_to_import)} sources")
         imported = client.import_research_sources(
             notebook_id=notebook_id,
             task_id=task_id,
             sources=web_sources_to_import,
         )
+        # One RPC imports them all; report each so the caller can start on them
+        for i, source in enumerate(imported, 1):
+            report_progress(i, total, codec.dumps(source))
 
         # If deep research with report, import the report as a text source
         if deep_report_source and report_content:
@@ -852,6 +1332,7 @@ def research_import(
                         "id": report_result.get("id"),
                         "title": report_result.get("title", "Deep Research Report"),
                     })
+                    report_progress(total, total, codec.dumps(imported[-1]))
             except Exception as e:
                 # Don't fail the entire import if report import fails
                 pass
@@ -867,7 +1348,7 @@ def research_import(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def audio_overview_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
@@ -904,7 +1385,7 @@ def audio_overview_create(
         }
 
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
 
         # Map format string to code
         format_codes = {
@@ -944,6 +1425,7 @@ def audio_overview_create(
                 "error": "No sources found in notebook. Add sources before creating audio overview.",
             }
 
+        report_progress(0, None, "Requesting audio generation")
         result = client.create_audio_overview(
             notebook_id=notebook_id,
             source_ids=source_ids,
@@ -954,6 +1436,7 @@ def audio_overview_create(
         )
 
         if result:
+            report_progress(1, None, _artifact_progress(result, "audio"))
             return {
                 "status": "success",
                 "artifact_id": result["artifact_id"],
@@ -970,7 +1453,7 @@ def audio_overview_create(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def video_overview_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
@@ -1007,7 +1490,7 @@ def video_overview_create(
         }
 
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
 
         # Map format string to code
         format_codes = {
@@ -1053,6 +1536,7 @@ def video_overview_create(
                 "error": "No sources found in notebook. Add sources before creating video overview.",
             }
 
+        report_progress(0, None, "Requesting video generation")
         result = client.create_video_overview(
             notebook_id=notebook_id,
             source_ids=source_ids,
@@ -1063,6 +1547,7 @@ def video_overview_create(
         )
 
         if result:
+            report_progress(1, None, _artifact_progress(result, "video"))
             return {
                 "status": "success",
                 "artifact_id": result["artifact_id"],
@@ -1080,19 +1565,55 @@ def video_overview_create(
 
 
 @mcp.tool()
-def studio_status(notebook_id: str) -> dict[str, Any]:
+async def studio_status(
+    notebook_id: str,
+    max_wait: int = 0,
+    poll_interval: int = 15,
+) -> dict[str, Any]:
     """Check studio content generation status and get URLs.
 
     Args:
         notebook_id: Notebook UUID
+        max_wait: Seconds to wait for in-progress artifacts to finish (default: 0=single poll)
+        poll_interval: Seconds between polls while waiting (default: 15)
+
+    While waiting, each artifact status change is sent as a progress notification
+    (JSON, with the completed and total artifact counts).
     """
     try:
-        client = get_client()
-        artifacts = client.poll_studio_status(notebook_id)
+        # Off the event loop: choosing a profile may list notebooks, and a
+        # cold pool builds the client (homepage fetch)
+        client = await run_blocking(get_client, notebook_id)
+        start_time = time.time()
+        seen: dict[str, str] = {}
+        sink = _current_progress_sink()
+        # Progress must increase with every notification, so it counts them;
+        # the completed/total counts go in the message
+        notified = 0
 
-        # Separate by status
-        completed = [a for a in artifacts if a["status"] == "completed"]
-        in_progress = [a for a in artifacts if a["status"] == "in_progress"]
+        while True:
+            # Lambda: attribute access may build the client (homepage fetch)
+            artifacts = await run_blocking(lambda: client.poll_studio_status(notebook_id))
+
+            # Separate by status
+            completed = [a for a in artifacts if a["status"] == "completed"]
+            in_progress = [a for a in artifacts if a["status"] == "in_progress"]
+
+            for artifact in artifacts:
+                if seen.get(artifact["artifact_id"]) != artifact["status"]:
+                    seen[artifact["artifact_id"]] = artifact["status"]
+                    if sink is not None:
+                        notified += 1
+                        sink(notified, None, _artifact_progress(
+                            artifact, completed=len(completed), total=len(artifacts)
+                        ))
+
+            if sink is not None:
+                await sink.flush()
+            if not in_progress or time.time() - start_time >= max_wait:
+                break
+            # Wait before next poll - without holding a worker thread
+            await asyncio.sleep(poll_interval)
 
         return {
             "status": "success",
@@ -1109,7 +1630,7 @@ def studio_status(notebook_id: str) -> dict[str, Any]:
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def studio_delete(
     notebook_id: str,
     artifact_id: str,
@@ -1132,7 +1653,7 @@ def studio_delete(
         }
 
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
         result = client.delete_studio_artifact(artifact_id)
 
         if result:
@@ -1146,7 +1667,7 @@ def studio_delete(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def infographic_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
@@ -1183,7 +1704,7 @@ def infographic_create(
         }
 
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
 
         # Map orientation string to code
         orientation_codes = {
@@ -1222,6 +1743,7 @@ def infographic_create(
                 "error": "No sources found in notebook. Add sources before creating infographic.",
             }
 
+        report_progress(0, None, "Requesting infographic generation")
         result = client.create_infographic(
             notebook_id=notebook_id,
             source_ids=source_ids,
@@ -1232,6 +1754,7 @@ def infographic_create(
         )
 
         if result:
+            report_progress(1, None, _artifact_progress(result, "infographic"))
             return {
                 "status": "success",
                 "artifact_id": result["artifact_id"],
@@ -1248,7 +1771,7 @@ def infographic_create(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def slide_deck_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
@@ -1285,7 +1808,7 @@ def slide_deck_create(
         }
 
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
 
         # Map format string to code
         format_codes = {
@@ -1322,6 +1845,7 @@ def slide_deck_create(
                 "error": "No sources found in notebook. Add sources before creating slide deck.",
             }
 
+        report_progress(0, None, "Requesting slide deck generation")
         result = client.create_slide_deck(
             notebook_id=notebook_id,
             source_ids=source_ids,
@@ -1332,6 +1856,7 @@ def slide_deck_create(
         )
 
         if result:
+            report_progress(1, None, _artifact_progress(result, "slide_deck"))
             return {
                 "status": "success",
                 "artifact_id": result["artifact_id"],
@@ -1348,7 +1873,7 @@ def slide_deck_create(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def report_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
@@ -1382,13 +1907,14 @@ def report_create(
         }
 
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
 
         # Get source IDs if not provided
         if not source_ids:
             sources = client.get_notebook_sources_with_types(notebook_id)
             source_ids = [s["id"] for s in sources if s.get("id")]
 
+        report_progress(0, None, "Requesting report generation")
         result = client.create_report(
             notebook_id=notebook_id,
             source_ids=source_ids,
@@ -1398,6 +1924,7 @@ def report_create(
         )
 
         if result:
+            report_progress(1, None, _artifact_progress(result, "report"))
             return {
                 "status": "success",
                 "artifact_id": result["artifact_id"],
@@ -1413,7 +1940,7 @@ def report_create(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def flashcards_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
@@ -1441,13 +1968,14 @@ def flashcards_create(
         }
 
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
 
         # Get source IDs if not provided
         if not source_ids:
             sources = client.get_notebook_sources_with_types(notebook_id)
             source_ids = [s["id"] for s in sources if s.get("id")]
 
+        report_progress(0, None, "Requesting flashcards generation")
         result = client.create_flashcards(
             notebook_id=notebook_id,
             source_ids=source_ids,
@@ -1455,6 +1983,7 @@ def flashcards_create(
         )
 
         if result:
+            report_progress(1, None, _artifact_progress(result, "flashcards"))
             return {
                 "status": "success",
                 "artifact_id": result["artifact_id"],
@@ -1469,7 +1998,7 @@ def flashcards_create(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def quiz_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
@@ -1500,12 +2029,13 @@ def quiz_create(
         }
 
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
 
         if not source_ids:
             sources = client.get_notebook_sources_with_types(notebook_id)
             source_ids = [s["id"] for s in sources if s.get("id")]
 
+        report_progress(0, None, "Requesting quiz generation")
         result = client.create_quiz(
             notebook_id=notebook_id,
             source_ids=source_ids,
@@ -1514,6 +2044,7 @@ def quiz_create(
         )
 
         if result:
+            report_progress(1, None, _artifact_progress(result, "quiz"))
             return {
                 "status": "success",
                 "artifact_id": result["artifact_id"],
@@ -1529,7 +2060,7 @@ def quiz_create(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def data_table_create(
     notebook_id: str,
     description: str,
@@ -1560,12 +2091,13 @@ def data_table_create(
         }
 
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
 
         if not source_ids:
             sources = client.get_notebook_sources_with_types(notebook_id)
             source_ids = [s["id"] for s in sources if s.get("id")]
 
+        report_progress(0, None, "Requesting data table generation")
         result = client.create_data_table(
             notebook_id=notebook_id,
             source_ids=source_ids,
@@ -1574,6 +2106,7 @@ def data_table_create(
         )
 
         if result:
+            report_progress(1, None, _artifact_progress(result, "data_table"))
             return {
                 "status": "success",
                 "artifact_id": result["artifact_id"],
@@ -1588,7 +2121,7 @@ def data_table_create(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def mind_map_create(
     notebook_id: str,
     source_ids: list[str] | None = None,
@@ -1616,7 +2149,7 @@ def mind_map_create(
         }
 
     try:
-        client = get_client()
+        client = get_client(notebook_id, write=True)
 
         # Get source IDs if not provided
         if not source_ids:
@@ -1624,11 +2157,13 @@ def mind_map_create(
             source_ids = [s["id"] for s in sources if s.get("id")]
 
         # Step 1: Generate the mind map
+        report_progress(0, 2, "Generating mind map")
         gen_result = client.generate_mind_map(source_ids=source_ids)
         if not gen_result or not gen_result.get("mind_map_json"):
             return {"status": "error", "error": "Failed to generate mind map"}
 
         # Step 2: Save the mind map to the notebook
+        report_progress(1, 2, "Saving mind map")
         save_result = client.save_mind_map(
             notebook_id=notebook_id,
             mind_map_json=gen_result["mind_map_json"],
@@ -1638,12 +2173,11 @@ def mind_map_create(
 
         if save_result:
             # Parse the JSON to get structure info
-            import json
             try:
-                mind_map_data = json.loads(save_result.get("mind_map_json", "{}"))
+                mind_map_data = codec.loads(save_result.get("mind_map_json", "{}"))
                 root_name = mind_map_data.get("name", "Unknown")
                 children_count = len(mind_map_data.get("children", []))
-            except json.JSONDecodeError:
+            except codec.JSONDecodeError:
                 root_name = "Unknown"
                 children_count = 0
 
@@ -1662,7 +2196,7 @@ def mind_map_create(
         return {"status": "error", "error": str(e)}
 
 
-@mcp.tool()
+@tool
 def mind_map_list(notebook_id: str) -> dict[str, Any]:
     """List all mind maps in a notebook.
 
@@ -1670,7 +2204,7 @@ def mind_map_list(notebook_id: str) -> dict[str, Any]:
         notebook_id: Notebook UUID
     """
     try:
-        client = get_client()
+        client = get_client(notebook_id)
         mind_maps = client.list_mind_maps(notebook_id)
 
         return {
@@ -1701,13 +2235,30 @@ ESSENTIAL_COOKIES = [
 ]
 
 
-@mcp.tool()
+@tool
+def session_health() -> dict[str, Any]:
+    """Auth/session health per account profile. For monitoring, not needed before other tools."""
+    try:
+        result = {
+            "status": "success",
+            "profiles": get_pool().health(),
+            "keepalive": _keepalive.health() if _keepalive else {"running": False},
+        }
+        profiles_ok = all(p["healthy"] for p in result["profiles"])
+        result["healthy"] = profiles_ok and result["keepalive"].get("healthy", True)
+        return result
+    except Exception as e:
+        return {"status": "error", "error": str(e)}
+
+
+@tool
 def save_auth_tokens(
     cookies: str,
     csrf_token: str = "",
     session_id: str = "",
     request_body: str = "",
     request_url: str = "",
+    profile: str | None = None,
 ) -> dict[str, Any]:
     """Save NotebookLM cookies. CSRF and session ID are auto-extracted.
 
@@ -1717,11 +2268,11 @@ def save_auth_tokens(
         session_id: (deprecated, auto-extracted from request_url or page)
         request_body: Optional request body from get_network_request (contains CSRF token)
         request_url: Optional request URL from get_network_request (contains session ID)
+        profile: Auth profile to save to, e.g. a second account for the client pool (default: "default")
     """
-    global _client
+    global _pool
 
     try:
-        import time
         import urllib.parse
         from .auth import AuthTokens, save_tokens_to_cache
 
@@ -1767,10 +2318,14 @@ def save_auth_tokens(
             session_id=session_id,  # May be empty - will be auto-extracted from page
             extracted_at=time.time(),
         )
-        save_tokens_to_cache(tokens)
+        save_tokens_to_cache(tokens, profile=profile)
 
-        # Reset client so next call uses fresh tokens
-        _client = None
+        # Reset the pool so next call uses fresh tokens (and picks up new profiles).
+        # Close the old one's HTTP clients; calls still using it reopen theirs.
+        with _pool_lock:
+            old_pool, _pool = _pool, None
+        if old_pool is not None:
+            old_pool.close()
 
         from .auth import get_cache_path
 
@@ -1787,7 +2342,7 @@ def save_auth_tokens(
         return {
             "status": "success",
             "message": f"Saved {len(cookie_dict)} essential cookies (filtered from {len(all_cookies)}). {token_msg}",
-            "cache_path": str(get_cache_path()),
+            "cache_path": str(get_cache_path(profile)),
             "extracted_csrf": bool(csrf_token),
             "extracted_session_id": bool(session_id),
         }
@@ -1797,6 +2352,8 @@ def save_auth_tokens(
 
 def main():
     """Run the MCP server."""
+    warm_client_in_background()
+    start_keepalive()
     mcp.run()
     return 0
 